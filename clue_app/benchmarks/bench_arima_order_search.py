@@ -0,0 +1,93 @@
+"""
+Benchmark: CLUE ARIMA order search vs. pmdarima exhaustive auto_arima
+Run from clue_app/:
+    python -m benchmarks.bench_arima_order_search --years 2 5 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from pmdarima import auto_arima
+
+from forecasting.order_search import ARIMAOrderSearch
+
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def synthetic_daily_series(years: int, seed: int = 42) -> pd.Series:
+    """Random walk with drift and AR(1) noise, on business days."""
+    n = years * TRADING_DAYS_PER_YEAR
+    rng = np.random.default_rng(seed)
+
+    noise = np.zeros(n)
+    shocks = rng.normal(0, 1, n)
+    for t in range(1, n):
+        noise[t] = 0.4 * noise[t - 1] + shocks[t]
+
+    values = 100 + np.cumsum(0.05 + noise)
+    index = pd.bdate_range("2000-01-03", periods=n)
+    return pd.Series(values, index=index, name="Close")
+
+
+def run_baseline(series: pd.Series):
+    """The call AutoARIMAModel.fit used before the CLUE search engine."""
+    start = time.perf_counter()
+    model = auto_arima(
+        series,
+        start_p=0,
+        start_q=0,
+        max_p=6,
+        max_q=6,
+        max_d=2,
+        seasonal=False,
+        trend="t",
+        information_criterion="aic",
+        stepwise=False,
+        suppress_warnings=True,
+        error_action="ignore",
+        n_jobs=-1,
+    )
+    return time.perf_counter() - start, model.order, model.aic()
+
+
+def run_clue(series: pd.Series, time_budget=None, n_jobs=None):
+    search = ARIMAOrderSearch(time_budget=time_budget, n_jobs=n_jobs)
+    start = time.perf_counter()
+    model = search.fit_best(series)
+    return time.perf_counter() - start, model.order, model.aic(), search.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, nargs="+", default=[2, 5, 20])
+    parser.add_argument("--time-budget", type=float, default=None)
+    parser.add_argument("--n-jobs", type=int, default=None)
+    parser.add_argument("--skip-baseline", action="store_true")
+    args = parser.parse_args()
+
+    header = f"{'years':>5} {'points':>7} | {'baseline s':>10} {'order':>10} {'aic':>10} | {'clue s':>8} {'order':>10} {'aic':>10} {'pruned':>6} | {'speedup':>7}"
+    print(header)
+    print("-" * len(header))
+
+    for years in args.years:
+        series = synthetic_daily_series(years)
+
+        if args.skip_baseline:
+            base_s, base_order, base_aic = np.nan, None, np.nan
+        else:
+            base_s, base_order, base_aic = run_baseline(series)
+
+        clue_s, clue_order, clue_aic, stats = run_clue(series, args.time_budget, args.n_jobs)
+        speedup = base_s / clue_s if np.isfinite(base_s) else np.nan
+
+        print(
+            f"{years:>5} {len(series):>7} | {base_s:>10.2f} {str(base_order):>10} {base_aic:>10.1f} | "
+            f"{clue_s:>8.2f} {str(clue_order):>10} {clue_aic:>10.1f} {stats['pruned']:>6} | {speedup:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
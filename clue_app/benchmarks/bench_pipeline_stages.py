@@ -0,0 +1,336 @@
+"""
+Benchmark: every pipeline stage on synthetic series of increasing size
+Times CSV parsing, feature generation, train/test split, ARIMA fit/forecast,
+XGBoost fit/recursive forecast, evaluation metrics, EDA charts and the PDF
+report on 500 / 5k / 50k / 500k point series (fixed seed, hourly bars so
+500k points stay inside the datetime range). Model fits are skipped above
+MAX_POINTS unless --no-caps is given. Every timed call starts cold: the
+differencing-order cache (arima_fit) and the figure cache's rendered rasters
+(report) are cleared beforehand, outside the timing.
+Run from clue_app/:
+    python -m benchmarks.bench_pipeline_stages --output bench.json
+    python -m benchmarks.bench_pipeline_stages --baseline bench.json      # run and compare
+    python -m benchmarks.bench_pipeline_stages --results new.json --baseline bench.json
+Comparison exits with status 1 when a stage got slower than --threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Callable, Dict, List, Optional
+
+import matplotlib
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from core.data_loader import DataLoader
+from core.evaluation_metrics import calculate_evaluation_metrics
+from core.report_generator import format_eda_summary, generate_report
+from forecasting.auto_arima import AutoARIMAModel
+from forecasting.order_search import clear_diff_cache
+from forecasting.xgboost_model import XGBoostModel
+from preprocessing.eda import eda_summary, generate_eda_charts
+from preprocessing.feature_engineering import FeatureEngineer
+from preprocessing.split import TimeSeriesSplitter
+from visualization.figure_cache import get_figure_cache
+from visualization.forecast_plot import plot_forecast
+
+
+SIZES = (500, 5_000, 50_000, 500_000)
+
+STAGES = (
+    "csv_parse",
+    "features",
+    "split",
+    "arima_fit",
+    "arima_forecast",
+    "xgboost_fit",
+    "xgboost_forecast",
+    "metrics",
+    "eda_charts",
+    "report",
+)
+
+# Largest series a stage runs on by default; ARIMA fits are quadratic-ish in practice
+MAX_POINTS = {
+    "arima_fit": 5_000,
+    "arima_forecast": 5_000,
+    "xgboost_fit": 50_000,
+    "xgboost_forecast": 50_000,
+}
+
+HORIZON = 30
+
+# Memo a stage would otherwise hit on every repeat after the first
+STAGE_RESETS: Dict[str, Callable[[], None]] = {
+    "arima_fit": clear_diff_cache,
+    "report": lambda: get_figure_cache().clear(),
+}
+
+
+# -------------------- FIXTURES --------------------
+
+class StageContext:
+    """Synthetic data and fitted models for one series size, built on first use."""
+
+    def __init__(self, n: int, workdir: str, seed: int = 7):
+        self.n = n
+        self.workdir = workdir
+        self.seed = seed
+
+    @cached_property
+    def df(self) -> pd.DataFrame:
+        rng = np.random.default_rng(self.seed)
+        close = 100 + np.cumsum(rng.normal(0.01, 1, self.n))
+        index = pd.date_range("2000-01-03", periods=self.n, freq="h", name="Date")
+        return pd.DataFrame({"Open": close + rng.normal(0, 0.5, self.n), "Close": close}, index=index)
+
+    @cached_property
+    def csv_path(self) -> str:
+        path = os.path.join(self.workdir, f"series_{self.n}.csv")
+        self.df.to_csv(path, date_format="%Y-%m-%d %H:%M:%S")
+        return path
+
+    @cached_property
+    def featured(self) -> pd.DataFrame:
+        return FeatureEngineer().generate_features(self.df)
+
+    @cached_property
+    def split(self):
+        return TimeSeriesSplitter().split(self.featured)
+
+    @cached_property
+    def xgboost_model(self) -> XGBoostModel:
+        X_train, _, y_train, _ = self.split
+        return XGBoostModel().fit(X_train, y_train)
+
+    @cached_property
+    def arima_model(self) -> AutoARIMAModel:
+        return AutoARIMAModel().fit(self.df["Close"])
+
+    @cached_property
+    def figures(self):
+        forecast = pd.Series(np.full(HORIZON, self.df["Close"].iloc[-1]), name="Forecast")
+        conf_int = pd.DataFrame({"Lower CI": forecast - 1, "Upper CI": forecast + 1})
+        return generate_eda_charts(self.df), plot_forecast(self.df, forecast, conf_int), forecast
+
+
+def stage_function(stage: str, ctx: StageContext) -> Callable[[], object]:
+    """Returns the timed call for stage; fixtures it needs are built beforehand."""
+    if stage == "csv_parse":
+        path = ctx.csv_path
+        loader = DataLoader(use_series_store=False)
+        return lambda: loader.load_csv(path, streaming=False)
+
+    if stage == "features":
+        df = ctx.df
+        return lambda: FeatureEngineer().generate_features(df)
+
+    if stage == "split":
+        featured = ctx.featured
+        return lambda: TimeSeriesSplitter().split(featured)
+
+    if stage == "arima_fit":
+        close = ctx.df["Close"]
+        return lambda: AutoARIMAModel().fit(close)
+
+    if stage == "arima_forecast":
+        model = ctx.arima_model
+        return lambda: model.forecast(HORIZON)
+
+    if stage == "xgboost_fit":
+        X_train, _, y_train, _ = ctx.split
+        return lambda: XGBoostModel().fit(X_train, y_train)
+
+    if stage == "xgboost_forecast":
+        model = ctx.xgboost_model
+        last_row = ctx.featured.drop(columns=["Close"]).iloc[[-1]]
+        return lambda: model.recursive_forecast(last_row, HORIZON)
+
+    if stage == "metrics":
+        y_true = ctx.df["Close"].to_numpy()
+        y_pred = y_true + np.random.default_rng(ctx.seed).normal(0, 1, ctx.n)
+        return lambda: calculate_evaluation_metrics(y_true, y_pred)
+
+    if stage == "eda_charts":
+        df = ctx.df
+        return lambda: plt.close(generate_eda_charts(df))
+
+    if stage == "report":
+        eda_fig, forecast_fig, forecast = ctx.figures
+        summary = format_eda_summary(eda_summary(ctx.df))
+        metrics = {"MAE": 1.0, "RMSE": 1.0}
+        path = os.path.join(ctx.workdir, "report.pdf")
+        return lambda: generate_report(
+            output_path=path,
+            title="CLUE Benchmark Report",
+            model_results={"model_type": "XGBOOST"},
+            metrics=metrics,
+            eda_summary=summary,
+            eda_fig=eda_fig,
+            forecast_fig=forecast_fig,
+            predicted_values=forecast,
+        )
+
+    raise ValueError(f"Unknown stage: {stage}")
+
+
+# -------------------- RUNNING --------------------
+
+def time_call(fn: Callable[[], object], repeats: int, reset: Optional[Callable[[], None]] = None) -> Dict:
+    """reset: run before every call, untimed, so repeats measure the same cold work"""
+    timings = []
+    for _ in range(repeats):
+        if reset is not None:
+            reset()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return {"best_s": min(timings), "median_s": statistics.median(timings), "repeats": repeats}
+
+
+def environment() -> Dict:
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def run_suite(sizes: List[int], stages: List[str], repeats: int, caps: bool = True, progress: bool = True) -> Dict:
+    results: Dict[str, Dict[str, Dict]] = {stage: {} for stage in stages}
+
+    with tempfile.TemporaryDirectory(prefix="clue-bench-") as workdir:
+        for n in sizes:
+            ctx = StageContext(n, workdir)
+            for stage in stages:
+                if caps and n > MAX_POINTS.get(stage, n):
+                    results[stage][str(n)] = {"skipped": f"above {MAX_POINTS[stage]} points (use --no-caps)"}
+                    continue
+
+                fn = stage_function(stage, ctx)
+                results[stage][str(n)] = time_call(fn, repeats, STAGE_RESETS.get(stage))
+                if progress:
+                    print(f"  {stage:<17} {n:>8} points  {results[stage][str(n)]['best_s'] * 1000:>10.1f} ms", file=sys.stderr)
+            plt.close("all")
+
+    return {"meta": {**environment(), "repeats": repeats, "caps": caps}, "results": results}
+
+
+# -------------------- COMPARISON --------------------
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.2, min_delta: float = 0.005) -> List[Dict]:
+    """
+    One row per (stage, size) in either run. A stage regresses when its best
+    time grew by more than threshold (relative) and min_delta seconds (absolute),
+    so sub-millisecond jitter is never flagged.
+    """
+    rows = []
+    stages = list(dict.fromkeys([*current["results"], *baseline["results"]]))
+
+    for stage in stages:
+        now_sizes = current["results"].get(stage, {})
+        then_sizes = baseline["results"].get(stage, {})
+        for size in sorted(set(now_sizes) | set(then_sizes), key=int):
+            now = now_sizes.get(size, {}).get("best_s")
+            then = then_sizes.get(size, {}).get("best_s")
+
+            if now is None or then is None:
+                status, ratio = ("new" if then is None else "missing"), None
+            else:
+                ratio = now / then if then > 0 else float("inf")
+                if ratio > 1 + threshold and now - then > min_delta:
+                    status = "REGRESSION"
+                elif ratio < 1 / (1 + threshold) and then - now > min_delta:
+                    status = "improved"
+                else:
+                    status = "ok"
+
+            rows.append({"stage": stage, "size": int(size), "baseline_s": then, "current_s": now, "ratio": ratio, "status": status})
+    return rows
+
+
+def _ms(value: Optional[float]) -> str:
+    return f"{value * 1000:.1f}" if value is not None else "-"
+
+
+def print_results(results: Dict):
+    sizes = sorted({int(size) for by_size in results["results"].values() for size in by_size})
+    header = f"{'stage':<17} | " + " | ".join(f"{size:>10}" for size in sizes)
+    print(f"best of {results['meta']['repeats']} runs, milliseconds")
+    print(header)
+    print("-" * len(header))
+    for stage, by_size in results["results"].items():
+        cells = [_ms(by_size.get(str(size), {}).get("best_s")) for size in sizes]
+        print(f"{stage:<17} | " + " | ".join(f"{cell:>10}" for cell in cells))
+
+
+def print_comparison(rows: List[Dict], current: Dict, baseline: Dict):
+    for key in ("platform", "cpu_count", "python", "numpy", "pandas"):
+        if current["meta"].get(key) != baseline["meta"].get(key):
+            print(f"note: {key} differs from the baseline ({baseline['meta'].get(key)} -> {current['meta'].get(key)})")
+
+    header = f"{'stage':<17} | {'size':>8} | {'baseline ms':>11} | {'current ms':>10} | {'ratio':>6} | status"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        ratio = f"{row['ratio']:.2f}" if row["ratio"] is not None else "-"
+        print(
+            f"{row['stage']:<17} | {row['size']:>8} | {_ms(row['baseline_s']):>11} | "
+            f"{_ms(row['current_s']):>10} | {ratio:>6} | {row['status']}"
+        )
+
+
+# -------------------- ENTRY POINT --------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeats", type=int, default=3, help="runs per stage and size; best is compared")
+    parser.add_argument("--no-caps", action="store_true", help="run model fits on every size")
+    parser.add_argument("--output", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--results", metavar="PATH", help="compare an existing results file instead of running")
+    parser.add_argument("--baseline", metavar="PATH", help="baseline JSON to flag regressions against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative slowdown flagged as a regression (default: 0.2)")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="absolute slowdown in seconds ignored as noise (default: 0.005)")
+    args = parser.parse_args()
+
+    if args.results:
+        with open(args.results) as fh:
+            current = json.load(fh)
+    else:
+        current = run_suite(args.sizes, args.stages, args.repeats, caps=not args.no_caps)
+        print_results(current)
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(current, fh, indent=2)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as fh:
+        baseline = json.load(fh)
+    rows = compare(current, baseline, args.threshold, args.min_delta)
+    print()
+    print_comparison(rows, current, baseline)
+    return 1 if any(row["status"] == "REGRESSION" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Benchmark: import-time totals of the GUI and CLI entry paths
+Runs each target in a fresh interpreter under `python -X importtime` and
+reports its cumulative import time, the heaviest modules and which heavy
+libraries were loaded eagerly.
+Run from clue_app/:
+    python -m benchmarks.bench_startup_imports --repeats 3
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+
+TARGETS = {
+    "main window": "ui.main_window",
+    "ui controller": "ui.controllers.ui_controller",
+    "cli": "cli",
+    "cli forecast path": "pipeline.forecasting_pipeline",
+}
+
+HEAVY_LIBRARIES = ("pmdarima", "statsmodels", "xgboost", "sklearn", "reportlab", "yfinance", "matplotlib.pyplot", "PySide6")
+
+_PROBE = "import sys, json, {module}; print(json.dumps([m for m in {heavy!r} if m in sys.modules]))"
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Returns (module, self_us, cumulative_us) rows from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure(module: str) -> Dict:
+    env = {**os.environ, "QT_QPA_PLATFORM": os.environ.get("QT_QPA_PLATFORM", "offscreen")}
+    probe = _PROBE.format(module=module, heavy=HEAVY_LIBRARIES)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    rows = parse_importtime(completed.stderr)
+    return {
+        "total_ms": sum(self_us for _, self_us, _ in rows) / 1000,
+        "heaviest": sorted(((name, cum / 1000) for name, _, cum in rows), key=lambda row: -row[1])[:5],
+        "heavy_loaded": json.loads(completed.stdout.strip().splitlines()[-1]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=3, help="fresh interpreters per target; best is kept")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for label, module in TARGETS.items():
+        runs = [measure(module) for _ in range(args.repeats)]
+        results[label] = min(runs, key=lambda run: run["total_ms"])
+
+    header = f"{'target':<18} | {'import ms':>9} | heavy libraries loaded"
+    print(header)
+    print("-" * len(header))
+    for label, result in results.items():
+        print(f"{label:<18} | {result['total_ms']:>9.0f} | {', '.join(result['heavy_loaded']) or '-'}")
+
+    print()
+    for label, result in results.items():
+        heaviest = ", ".join(f"{name} {ms:.0f}" for name, ms in result["heaviest"])
+        print(f"{label}: {heaviest}")
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
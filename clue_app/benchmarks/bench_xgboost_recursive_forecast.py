@@ -0,0 +1,58 @@
+"""
+Benchmark: XGBoostModel.forecast (ring-buffer engine) vs. the legacy
+per-step DataFrame loop in XGBoostModel.recursive_forecast
+Run from clue_app/:
+    python -m benchmarks.bench_xgboost_recursive_forecast --horizons 7 30 90
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from forecasting.xgboost_model import train_xgboost_model
+from preprocessing.feature_engineering import create_features
+from preprocessing.split import time_series_train_test_split
+
+
+def synthetic_close(n: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2010-01-04", periods=n)
+    return pd.DataFrame({"Close": 100 + np.cumsum(rng.normal(0.02, 1, n))}, index=index)
+
+
+def best_of(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--horizons", type=int, nargs="+", default=[7, 14, 30, 60, 90])
+    parser.add_argument("--points", type=int, default=2500)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    df = synthetic_close(args.points)
+    featured = create_features(df)
+    X_train, _, y_train, _ = time_series_train_test_split(featured)
+    model = train_xgboost_model(X_train, y_train)
+    last_row = featured.drop(columns=["Close"]).iloc[[-1]]
+
+    header = f"{'horizon':>7} | {'legacy ms':>10} | {'engine ms':>10} | {'speedup':>7}"
+    print(header)
+    print("-" * len(header))
+
+    for horizon in args.horizons:
+        legacy = best_of(lambda: model.recursive_forecast(last_row, horizon), args.repeats)
+        engine = best_of(lambda: model.forecast(df["Close"], horizon), args.repeats)
+        print(f"{horizon:>7} | {legacy * 1000:>10.1f} | {engine * 1000:>10.1f} | {legacy / engine:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""
+CLUE Command-Line Entry Point
+Headless access to the pipelines for scheduled jobs:
+    python cli.py train     --csv prices.csv --model AUTO_ARIMA
+    python cli.py forecast  --ticker AAPL --start 2020-01-01 --periods 30
+    python cli.py evaluate  --csv prices.csv --model XGBOOST
+    python cli.py report    --csv prices.csv --output clue_report.pdf
+    python cli.py backtest  --csv prices.csv --folds 5 --periods 30
+    python cli.py train     --csv prices.csv --profile --profile-log spans.jsonl
+Never imports PySide6; matplotlib is only loaded by the report command.
+A forecast from a stored model takes about 2-3 s end to end: unpickling it
+imports pmdarima (AUTO_ARIMA) or xgboost (XGBOOST*), which is nearly all of
+that time; the pipeline stages themselves take well under 0.1 s.
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional
+
+
+MODEL_TYPES = ("AUTO_ARIMA", "XGBOOST", "XGBOOST_DIRECT")
+
+
+# -------------------- ARGUMENTS --------------------
+
+def _source_arguments() -> argparse.ArgumentParser:
+    parent = argparse.ArgumentParser(add_help=False)
+
+    source = parent.add_argument_group("data source")
+    origin = source.add_mutually_exclusive_group(required=True)
+    origin.add_argument("--csv", metavar="PATH", help="CSV file with Date and Close columns")
+    origin.add_argument("--ticker", help="Yahoo Finance ticker")
+    source.add_argument("--start", help="first date for --ticker (YYYY-MM-DD)")
+    source.add_argument("--end", help="end date for --ticker, exclusive (YYYY-MM-DD)")
+
+    model = parent.add_argument_group("model")
+    model.add_argument("--model", choices=MODEL_TYPES, default="AUTO_ARIMA")
+    model.add_argument("--periods", type=int, default=30, help="forecast horizon (default: 30)")
+
+    profiling = parent.add_argument_group("profiling")
+    profiling.add_argument("--profile", action="store_true", help="print per-stage timings (and add them to the report)")
+    profiling.add_argument("--profile-log", metavar="PATH", help="append the stage spans to a JSON-lines file")
+    profiling.add_argument("--profile-dump", metavar="DIR", help="write a profiler dump per top-level stage")
+    profiling.add_argument("--profiler", choices=("cprofile", "pyinstrument"), default="cprofile",
+                           help="profiler used for --profile-dump (default: cprofile)")
+
+    parent.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    return parent
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="clue", description="CLUE financial forecasting (headless)")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+    parent = _source_arguments()
+
+    train = commands.add_parser("train", parents=[parent], help="fit a model and print its details")
+    train.set_defaults(handler=cmd_train)
+
+    forecast = commands.add_parser(
+        "forecast", parents=[parent], help="forecast the next periods",
+        description=(
+            "Forecast the next periods, reusing the stored model for the same data. "
+            "Expect about 2-3 s per run even then: loading the model imports pmdarima "
+            "or xgboost, and only the library of the chosen model is imported."
+        ),
+    )
+    forecast.add_argument("--output", metavar="PATH", help="also write the forecast to a CSV file")
+    forecast.set_defaults(handler=cmd_forecast)
+
+    evaluate = commands.add_parser("evaluate", parents=[parent], help="print hold-out evaluation metrics")
+    evaluate.set_defaults(handler=cmd_evaluate)
+
+    report = commands.add_parser("report", parents=[parent], help="write the PDF report")
+    report.add_argument("--output", metavar="PATH", default="clue_report.pdf")
+    report.set_defaults(handler=cmd_report)
+
+    backtest = commands.add_parser("backtest", parents=[parent], help="walk-forward out-of-sample evaluation")
+    backtest.add_argument("--folds", type=int, default=5, help="number of forecast origins (default: 5)")
+    backtest.add_argument("--step", type=int, help="observations between origins (default: --periods)")
+    backtest.add_argument("--window", type=int, help="rolling training window (default: expanding)")
+    backtest.add_argument("--jobs", type=int, help="worker processes")
+    backtest.add_argument("--output", metavar="PATH", help="also write the fold x horizon error matrix to CSV")
+    backtest.set_defaults(handler=cmd_backtest)
+
+    return parser
+
+
+def source_config(args: argparse.Namespace) -> Dict:
+    if args.csv:
+        return {"source": "csv", "file_path": args.csv}
+    if not args.start:
+        raise ValueError("--start is required with --ticker")
+    return {"source": "yahoo", "ticker": args.ticker, "start": args.start, "end": args.end}
+
+
+# -------------------- COMMANDS --------------------
+
+def cmd_train(args: argparse.Namespace) -> Dict:
+    from pipeline.training_pipeline import run_training
+
+    result = run_training(args.model, source_config(args), forecast_periods=args.periods)
+    return {
+        "model_type": result["model_type"],
+        "model_order": result.get("model_order"),
+        "metrics": result.get("metrics", {}),
+    }
+
+
+def cmd_evaluate(args: argparse.Namespace) -> Dict:
+    from pipeline.training_pipeline import run_training
+
+    result = run_training(args.model, source_config(args), forecast_periods=args.periods)
+    return {"model_type": result["model_type"], "metrics": result.get("metrics", {})}
+
+
+def cmd_forecast(args: argparse.Namespace) -> Dict:
+    from pipeline.forecasting_pipeline import run_forecast
+
+    result = run_forecast(args.model, source_config(args), forecast_periods=args.periods)
+    table = _forecast_table(result)
+
+    if args.output:
+        table.to_csv(args.output, index_label="Step")
+
+    return {
+        "model_type": result["model_type"],
+        "forecast": {column: table[column].tolist() for column in table},
+        "output": args.output,
+    }
+
+
+def cmd_report(args: argparse.Namespace) -> Dict:
+    import matplotlib
+    matplotlib.use("Agg")
+
+    from core.dataset_cache import load_cached_financial_data
+    from core.profiling import get_profiler
+    from core.report_generator import format_eda_summary, generate_report
+    from pipeline.forecasting_pipeline import run_forecast
+    from pipeline.training_pipeline import run_training
+    from preprocessing.eda import eda_summary, generate_eda_charts
+    from visualization.forecast_plot import plot_forecast
+
+    config = source_config(args)
+    df = load_cached_financial_data(**config)
+    training = run_training(args.model, config, forecast_periods=args.periods)
+    forecast = run_forecast(args.model, config, forecast_periods=args.periods)
+
+    generate_report(
+        output_path=args.output,
+        title="CLUE Forecasting Report",
+        model_results=training,
+        metrics=training.get("metrics", {}),
+        eda_summary=format_eda_summary(eda_summary(df)),
+        eda_fig=generate_eda_charts(df),
+        forecast_fig=plot_forecast(df, forecast["forecast"], forecast["confidence_intervals"]),
+        predicted_values=forecast["forecast"],
+        notes="Generated by CLUE AI Forecasting System",
+        profile=get_profiler().records() if args.profile else None,
+    )
+    return {"model_type": args.model, "output": args.output}
+
+
+def cmd_backtest(args: argparse.Namespace) -> Dict:
+    from pipeline.backtest_pipeline import run_backtest
+
+    result = run_backtest(
+        args.model,
+        source_config(args),
+        n_folds=args.folds,
+        horizon=args.periods,
+        step=args.step,
+        window=args.window,
+        n_jobs=args.jobs,
+    )
+
+    if args.output:
+        result["errors"].to_csv(args.output)
+
+    horizon_metrics = result["horizon_metrics"]
+    return {
+        "model_type": result["model_type"],
+        "metrics": result["metrics"],
+        "horizon_metrics": {column: horizon_metrics[column].tolist() for column in horizon_metrics},
+        "stats": result["stats"],
+        "output": args.output,
+    }
+
+
+# -------------------- OUTPUT --------------------
+
+def _forecast_table(result: Dict):
+    import pandas as pd
+
+    forecast = pd.Series(result["forecast"]).reset_index(drop=True)
+    table = pd.DataFrame({"Forecast": forecast.to_numpy()}, index=pd.RangeIndex(1, len(forecast) + 1))
+
+    conf_int = result.get("confidence_intervals")
+    if conf_int is not None:
+        table["Lower CI"] = conf_int["Lower CI"].to_numpy()
+        table["Upper CI"] = conf_int["Upper CI"].to_numpy()
+    return table
+
+
+def _to_plain(value):
+    """JSON-safe copy of command results (numpy scalars, tuples)."""
+    if isinstance(value, dict):
+        return {str(key): _to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(item) for item in value]
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def _print_result(command: str, result: Dict):
+    if "model_order" in result and result["model_order"] is not None:
+        print(f"Model Type  : {result['model_type']}")
+        print(f"Model Order : {tuple(result['model_order'])}")
+    else:
+        print(f"Model Type  : {result['model_type']}")
+
+    for name, value in result.get("metrics", {}).items():
+        print(f"{name:<22}: {value:.4f}")
+
+    horizon_metrics = result.get("horizon_metrics")
+    if horizon_metrics:
+        columns = list(horizon_metrics)
+        print("Horizon " + "  ".join(f"{column:>10}" for column in columns))
+        for step, values in enumerate(zip(*horizon_metrics.values()), start=1):
+            print(f"{step:>7} " + "  ".join(f"{value:>10.4f}" for value in values))
+
+    forecast = result.get("forecast")
+    if forecast:
+        columns = list(forecast)
+        print("Step  " + "  ".join(f"{column:>12}" for column in columns))
+        for step, values in enumerate(zip(*forecast.values()), start=1):
+            print(f"{step:>4}  " + "  ".join(f"{value:>12.4f}" for value in values))
+
+    if result.get("output"):
+        print(f"Written to {result['output']}")
+
+    if result.get("profile"):
+        from core.profiling import format_spans
+        print()
+        print(format_spans(result["profile"]))
+
+
+# -------------------- ENTRY POINT --------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from core.profiling import get_profiler
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    profiler = get_profiler()
+    if args.profile_dump:
+        profiler.dump_dir = args.profile_dump
+        profiler.dump_backend = args.profiler
+    mark = profiler.mark()
+
+    try:
+        result = args.handler(args)
+    except (ValueError, FileNotFoundError) as exc:
+        print(f"clue {args.command}: {exc}", file=sys.stderr)
+        return 2
+    finally:
+        if args.profile_log:
+            profiler.export_jsonl(args.profile_log, since=mark)
+
+    if args.profile:
+        result["profile"] = profiler.records(since=mark)
+
+    if args.json:
+        print(json.dumps(_to_plain(result), indent=2, default=str))
+    else:
+        _print_result(args.command, result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+Streaming CSV Ingestion for CLUE Financial Forecasting
+Loads large tick / minute exports without materialising the whole file:
+- reads only the Date and target columns, with explicit dtypes, in chunks
+- detects already-sorted input and skips the final sort
+- optionally resamples to a target frequency while streaming
+- reports rows/sec and the peak size of its working buffers
+"""
+
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import Tick
+
+
+DEFAULT_CHUNK_SIZE = 500_000
+
+
+class StreamingCSVLoader:
+    def __init__(
+        self,
+        date_column: str = "Date",
+        target_column: str = "Close",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resample: Optional[str] = None,
+        resample_how: str = "last",
+        date_format: Optional[str] = None,
+    ):
+        """
+        resample: pandas offset alias ("1min", "h", "D", ...) or None to keep every row;
+                  fixed-length aliases are resampled while streaming, calendar ones
+                  ("W", "ME", ...) once at the end
+        resample_how: aggregation per bucket ("last", "first", "mean", "max", "min")
+        date_format: strftime format of the date column; inferred when None
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.date_column = date_column
+        self.target_column = target_column
+        self.chunk_size = chunk_size
+        self.resample = resample
+        self.resample_how = resample_how
+        self.date_format = date_format
+        self._stream_resample = resample is not None and isinstance(to_offset(resample), Tick)
+        self._parsed_unit = "ns"
+        self.stats: Dict = {}
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def load(self, file_path: str) -> pd.DataFrame:
+        """Returns a DatetimeIndex ('Date') frame with the target column, like DataLoader."""
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        self._validate_header(path)
+
+        start = time.perf_counter()
+        result = self._stream(path, self._stream_resample)
+        if result is None:
+            # Unsorted input: buckets already emitted may be incomplete, so
+            # read again and resample once after sorting
+            result = self._stream(path, False)
+        df, counters = result
+
+        seconds = time.perf_counter() - start
+        self.stats = {
+            **counters,
+            "rows_out": len(df),
+            "resample": self.resample,
+            "seconds": seconds,
+            "rows_per_sec": counters["rows_read"] / seconds if seconds > 0 else float("inf"),
+        }
+        return df
+
+    # -------------------- STREAMING --------------------
+
+    def _stream(self, path: Path, stream_resample: bool):
+        """One pass over the file; returns None when streaming resampling meets unsorted rows."""
+        dates: List[np.ndarray] = []
+        values: List[np.ndarray] = []
+        kept_bytes = 0
+        peak_bytes = 0
+        rows_read = 0
+        chunks = 0
+        is_sorted = True
+        last_date = None
+        carry: Optional[pd.Series] = None
+
+        for chunk in self._read_chunks(path):
+            chunks += 1
+            rows_read += len(chunk)
+            chunk_bytes = int(chunk.memory_usage(deep=True).sum())
+
+            series = self._clean_chunk(chunk)
+            del chunk
+
+            if len(series):
+                chunk_dates = series.index.asi8
+                if is_sorted:
+                    in_order = bool((np.diff(chunk_dates) >= 0).all())
+                    is_sorted = in_order and bool(last_date is None or chunk_dates[0] >= last_date)
+                    if not is_sorted and stream_resample:
+                        return None
+                last_date = chunk_dates[-1]
+
+                if stream_resample:
+                    series, carry = self._resample_streaming(series, carry)
+
+                dates.append(series.index.asi8)
+                values.append(series.to_numpy())
+                kept_bytes += dates[-1].nbytes + values[-1].nbytes
+
+            peak_bytes = max(peak_bytes, kept_bytes + chunk_bytes)
+
+        if carry is not None:
+            carry = self._aggregate(carry)
+            dates.append(carry.index.asi8)
+            values.append(carry.to_numpy())
+
+        all_dates = np.concatenate(dates) if dates else np.empty(0, dtype=np.int64)
+        all_values = np.concatenate(values) if values else np.empty(0, dtype=np.float64)
+        # Concatenation briefly holds the chunk list and the joined arrays
+        peak_bytes = max(peak_bytes, kept_bytes + all_dates.nbytes + all_values.nbytes)
+        del dates, values
+
+        if not is_sorted:
+            order = np.argsort(all_dates, kind="stable")
+            all_dates = all_dates[order]
+            all_values = all_values[order]
+
+        # Same resolution as a whole-file pd.to_datetime parse
+        index = pd.DatetimeIndex(all_dates.view("datetime64[ns]"), name="Date").as_unit(self._parsed_unit)
+        df = pd.DataFrame({self.target_column: all_values}, index=index)
+
+        if self.resample and not stream_resample:
+            df = self._aggregate(df[self.target_column]).to_frame()
+
+        counters = {"rows_read": rows_read, "chunks": chunks, "was_sorted": is_sorted, "peak_bytes": peak_bytes}
+        return df, counters
+
+    # -------------------- READING --------------------
+
+    def _validate_header(self, path: Path):
+        columns = pd.read_csv(path, nrows=0).columns
+        if self.date_column not in columns or self.target_column not in columns:
+            raise ValueError(
+                f"Required columns missing. Expected: '{self.date_column}' and '{self.target_column}'"
+            )
+
+    def _read_chunks(self, path: Path):
+        return pd.read_csv(
+            path,
+            usecols=[self.date_column, self.target_column],
+            dtype={self.date_column: str, self.target_column: np.float64},
+            chunksize=self.chunk_size,
+            engine="c",
+        )
+
+    def _clean_chunk(self, chunk: pd.DataFrame) -> pd.Series:
+        dates = pd.to_datetime(chunk[self.date_column], format=self.date_format, errors="coerce")
+        if dates.isnull().any():
+            raise ValueError("Invalid date values detected")
+        self._parsed_unit = dates.dt.unit
+
+        series = pd.Series(
+            chunk[self.target_column].to_numpy(),
+            index=pd.DatetimeIndex(dates).as_unit("ns"),
+            name=self.target_column,
+        )
+        return series.dropna()
+
+    # -------------------- RESAMPLING --------------------
+
+    def _aggregate(self, series: pd.Series) -> pd.Series:
+        # Epoch-anchored buckets, so chunk boundaries never shift bucket edges
+        origin = "epoch" if self._stream_resample else "start_day"
+        resampled = getattr(series.resample(self.resample, origin=origin), self.resample_how)()
+        return resampled.dropna()
+
+    def _resample_streaming(self, series: pd.Series, carry: Optional[pd.Series]):
+        """
+        Aggregates every complete bucket of carry + series and returns
+        (aggregated, raw rows of the last, possibly incomplete bucket).
+        """
+        if carry is not None:
+            series = pd.concat([carry, series])
+
+        buckets = series.index.floor(self.resample)
+        last_bucket = buckets[-1]
+        complete = buckets < last_bucket
+
+        return self._aggregate(series[complete]), series[~complete]
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+def stream_csv(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, resample: Optional[str] = None, **kwargs) -> pd.DataFrame:
+    return StreamingCSVLoader(chunk_size=chunk_size, resample=resample, **kwargs).load(file_path)
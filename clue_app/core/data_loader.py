@@ -8,37 +8,98 @@ Handles:
 """
 
 import pandas as pd
-import yfinance as yf
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+from core.csv_stream import DEFAULT_CHUNK_SIZE, StreamingCSVLoader
+from core.profiling import profiled
+from core.series_store import SeriesStore, get_series_store, save_series_quietly
+from core.yahoo_cache import YahooPriceCache, get_yahoo_cache, yfinance_download
+
+
+# Files at least this large are streamed in chunks instead of read whole
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
 
 
 class DataLoader:
-    def __init__(self, date_column: str = "Date", target_column: str = "Close"):
+    def __init__(
+        self,
+        date_column: str = "Date",
+        target_column: str = "Close",
+        series_store: Optional[SeriesStore] = None,
+        use_series_store: bool = True,
+        yahoo_cache: Optional[YahooPriceCache] = None,
+        use_yahoo_cache: bool = True,
+    ):
         self.date_column = date_column
         self.target_column = target_column
+        self.series_store = series_store
+        self.use_series_store = use_series_store
+        self.yahoo_cache = yahoo_cache
+        self.use_yahoo_cache = use_yahoo_cache
+        self.stream_stats: Dict = {}
 
     # -------------------- PUBLIC METHODS --------------------
 
-    def load_csv(self, file_path: str) -> pd.DataFrame:
-        """Load and validate local CSV file."""
+    def load_csv(self, file_path: str, streaming: Optional[bool] = None) -> pd.DataFrame:
+        """
+        Load and validate local CSV file.
+        Cleaned series are kept in the columnar series store, so later
+        loads of an unchanged file are memory-mapped reads.
+        streaming: None streams files over STREAMING_THRESHOLD_BYTES
+        """
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        df = pd.read_csv(path)
-        return self._process_dataframe(df)
+        store = None
+        if self.use_series_store:
+            store = self.series_store or get_series_store()
+            cached = store.load(file_path, self.date_column, self.target_column)
+            if cached is not None:
+                return cached
+
+        if streaming is None:
+            streaming = path.stat().st_size >= STREAMING_THRESHOLD_BYTES
+        if streaming:
+            df = self.load_csv_streaming(file_path)
+        else:
+            df = self._process_dataframe(pd.read_csv(path))
+
+        if store is not None:
+            save_series_quietly(store, df, file_path, self.date_column, self.target_column)
+        return df
+
+    def load_csv_streaming(
+        self,
+        file_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resample: Optional[str] = None,
+        resample_how: str = "last",
+    ) -> pd.DataFrame:
+        """Chunked Date/Close-only CSV load; rows/sec and peak memory land in stream_stats."""
+        loader = StreamingCSVLoader(
+            date_column=self.date_column,
+            target_column=self.target_column,
+            chunk_size=chunk_size,
+            resample=resample,
+            resample_how=resample_how,
+        )
+        df = loader.load(file_path)
+        self.stream_stats = loader.stats
+        return df
 
     def load_yahoo_finance(self, ticker: str, start: str, end: Optional[str] = None) -> pd.DataFrame:
-        df = yf.download(ticker, start=start, end=end, auto_adjust=True)
+        """Fetches through the local price cache, which only downloads missing date ranges."""
+        if self.use_yahoo_cache:
+            df = (self.yahoo_cache or get_yahoo_cache()).get(ticker, start, end)
+        else:
+            range_end = pd.Timestamp(end) if end else pd.Timestamp.today().normalize() + pd.Timedelta(days=1)
+            df = yfinance_download(ticker, pd.Timestamp(start), range_end)
 
         if df.empty:
             raise ValueError("No data returned from Yahoo Finance")
 
-        # Fix MultiIndex column issue from Yahoo Finance
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
-
         df = df.reset_index()
 
         if self.target_column not in df.columns:
@@ -94,6 +155,7 @@ class DataLoader:
 
 # -------------------- GUI FRIENDLY FUNCTION --------------------
 
+@profiled("load_financial_data", rows=len)
 def load_financial_data(
     source: str,
     file_path: Optional[str] = None,
@@ -0,0 +1,201 @@
+"""
+Dataset Cache for CLUE Financial Forecasting Application
+Handles:
+- Session-scoped caching of loaded datasets
+- Cache keys from normalized source config (CSV mtime/size, Yahoo ticker/range)
+- Read-only DataFrames shared between GUI and pipelines
+- LRU eviction by byte size and hit/miss statistics
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+from core.data_loader import load_financial_data
+from core.profiling import profiled
+
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class DatasetCache:
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        loader: Callable[..., pd.DataFrame] = load_financial_data,
+    ):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.max_bytes = max_bytes
+        self.loader = loader
+
+        self._entries: "OrderedDict[Hashable, Tuple[pd.DataFrame, int]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def load(self, **source_config) -> pd.DataFrame:
+        """Returns a read-only dataset for the config, loading it on a miss."""
+        # The loader dispatches on the same normalized source the key uses
+        source_config["source"] = normalize_source(source_config.get("source"))
+        key = self.make_key(source_config)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._share(entry[0])
+            self.misses += 1
+
+        df = self._freeze(self.loader(**source_config))
+        self._store(key, df)
+        return self._share(df)
+
+    def invalidate(self, **source_config) -> bool:
+        """Drops a single dataset from the cache."""
+        key = self.make_key(source_config)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._current_bytes -= entry[1]
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    # -------------------- CACHE KEYS --------------------
+
+    @staticmethod
+    def make_key(source_config: Dict) -> Hashable:
+        """
+        Normalizes a source config into a hashable key.
+        CSV keys include mtime and size so edited files are reloaded.
+        """
+        source = normalize_source(source_config.get("source"))
+
+        if source == "csv":
+            file_path = source_config.get("file_path")
+            if not file_path:
+                raise ValueError("file_path is required for CSV source")
+            path = Path(file_path).expanduser().resolve()
+            if not path.exists():
+                raise FileNotFoundError(f"File not found: {file_path}")
+            stat = path.stat()
+            return ("csv", str(path), stat.st_mtime_ns, stat.st_size)
+
+        elif source == "yahoo":
+            ticker = source_config.get("ticker")
+            start = source_config.get("start")
+            if not ticker or not start:
+                raise ValueError("ticker and start date required for Yahoo Finance")
+            end = source_config.get("end") or None
+            return ("yahoo", ticker.strip().upper(), str(start), str(end) if end else None)
+
+        else:
+            raise ValueError("Invalid source type. Use 'csv' or 'yahoo'")
+
+    # -------------------- STORAGE --------------------
+
+    def _store(self, key: Hashable, df: pd.DataFrame):
+        size = int(df.memory_usage(index=True, deep=True).sum())
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._current_bytes -= old[1]
+
+            # Datasets larger than the whole budget are served but not kept
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (df, size)
+            self._current_bytes += size
+
+            while self._current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_size
+                self.evictions += 1
+
+    @staticmethod
+    def _freeze(df: pd.DataFrame) -> pd.DataFrame:
+        """Returns a copy of df whose value buffers are not writeable."""
+        columns = {}
+        for name in df.columns:
+            values = df[name].to_numpy(copy=True)
+            values.flags.writeable = False
+            columns[name] = pd.Series(values, index=df.index, name=name, copy=False)
+
+        frozen = pd.DataFrame(columns, copy=False)
+        frozen.index.name = df.index.name
+        frozen.attrs = dict(df.attrs)
+        return frozen
+
+    @staticmethod
+    def _share(df: pd.DataFrame) -> pd.DataFrame:
+        # Shallow copy: callers may add columns without touching the cached frame
+        return df.copy(deep=False)
+
+
+def normalize_source(source) -> str:
+    """'CSV ' -> 'csv': source names as the loaders compare them."""
+    return str(source or "").strip().lower()
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+_default_cache: Optional[DatasetCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_dataset_cache() -> DatasetCache:
+    """Returns the session-wide dataset cache."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = DatasetCache()
+        return _default_cache
+
+
+@profiled("load_data", rows=len)
+def load_cached_financial_data(
+    source: str,
+    file_path: Optional[str] = None,
+    ticker: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Cached drop-in for load_financial_data.
+    The returned DataFrame is read-only; copy it before modifying values.
+    """
+    source = normalize_source(source)
+    return get_dataset_cache().load(
+        source=source,
+        file_path=file_path,
+        ticker=ticker,
+        start=start,
+        end=end,
+    )
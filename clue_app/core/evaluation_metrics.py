@@ -1,80 +1,132 @@
+"""
+Evaluation Metrics Engine for CLUE Financial Forecasting
+All metrics are computed in one vectorized pass over the last axis, so the
+same code scores a single forecast, a batch of series (series x time) or a
+backtest (series x fold x horizon). Non-finite values are masked out.
+
+    scores = batch_evaluation_metrics(actuals, predictions)   # shape (series, fold)
+    scores["RMSE"]                                            # float array
+"""
+
+from typing import Dict
+
 import numpy as np
-from sklearn.metrics import r2_score
 
 
-def calculate_evaluation_metrics(y_true, y_pred):
+METRIC_NAMES = (
+    "MAE",
+    "MSE",
+    "RMSE",
+    "MAPE",
+    "SMAPE",
+    "WAPE",
+    "R2",
+    "MASE",
+    "Bias",
+    "Skewness",
+    "Kurtosis",
+    "Directional Accuracy",
+    "Confidence Score",
+    "Volatility Error Ratio",
+)
+
+METRICS_DTYPE = np.dtype([(name, np.float64) for name in METRIC_NAMES])
+
+EPSILON = 1e-8
+
+
+def batch_evaluation_metrics(y_true, y_pred, axis: int = -1) -> np.ndarray:
+    """
+    Scores every series along axis and returns a structured array with one
+    float field per metric and the remaining dimensions as its shape.
+    Pairs where either value is NaN/inf are ignored; MAPE also skips zero actuals.
+    """
+    y_true = np.moveaxis(np.asarray(y_true, dtype=np.float64), axis, -1)
+    y_pred = np.moveaxis(np.asarray(y_pred, dtype=np.float64), axis, -1)
+    if y_true.shape != y_pred.shape:
+        raise ValueError(f"Shape mismatch: y_true {y_true.shape} vs y_pred {y_pred.shape}")
+
+    # Shared intermediates; masked entries are zeroed so plain sums can be used
+    valid = np.isfinite(y_true) & np.isfinite(y_pred)
+    actual = np.where(valid, y_true, 0.0)
+    predicted = np.where(valid, y_pred, 0.0)
+    residuals = actual - predicted
+    abs_residuals = np.abs(residuals)
+    abs_actual = np.abs(actual)
+    squared = residuals ** 2
+
+    # Consecutive valid pairs for the naive, direction and volatility metrics
+    pairs = valid[..., 1:] & valid[..., :-1]
+    actual_diff = np.where(pairs, np.diff(actual, axis=-1), 0.0)
+    pred_diff = np.where(pairs, np.diff(predicted, axis=-1), 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        count = _count(valid)
+        pair_count = _count(pairs)
+        nonzero = valid & (actual != 0)
+
+        mae = abs_residuals.sum(axis=-1) / count
+        mse = squared.sum(axis=-1) / count
+        bias = residuals.sum(axis=-1) / count
+
+        mape = np.where(nonzero, abs_residuals / np.where(nonzero, abs_actual, 1.0), 0.0).sum(axis=-1) / _count(nonzero) * 100
+        smape = (2.0 * abs_residuals / (abs_actual + np.abs(predicted) + EPSILON)).sum(axis=-1) / count * 100
+        wape = abs_residuals.sum(axis=-1) / (abs_actual.sum(axis=-1) + EPSILON) * 100
+
+        # R2 with sklearn's conventions: undefined below two points, and 1 (perfect)
+        # or 0 for constant actuals
+        centered_actual = np.where(valid, actual - (actual.sum(axis=-1) / count)[..., None], 0.0)
+        ss_res = squared.sum(axis=-1)
+        ss_tot = (centered_actual ** 2).sum(axis=-1)
+        r2 = np.where(ss_tot > 0, 1 - ss_res / ss_tot, np.where(ss_res == 0, 1.0, 0.0))
+        r2 = np.where(count >= 2, r2, np.nan)
+
+        mase = mae / (np.abs(actual_diff).sum(axis=-1) / pair_count + EPSILON)
+
+        centered = np.where(valid, residuals - bias[..., None], 0.0)
+        centered_sq = centered ** 2
+        residual_std = np.sqrt(centered_sq.sum(axis=-1) / count) + EPSILON
+        skewness = (centered_sq * centered).sum(axis=-1) / count / residual_std ** 3
+        kurtosis = (centered_sq ** 2).sum(axis=-1) / count / residual_std ** 4
+
+        same_direction = pairs & (np.sign(actual_diff) == np.sign(pred_diff))
+        directional_accuracy = same_direction.sum(axis=-1) / pair_count * 100
+
+        volatility_error_ratio = _diff_std(pred_diff, pairs, pair_count) / (_diff_std(actual_diff, pairs, pair_count) + EPSILON)
+
+    scores = np.empty(y_true.shape[:-1], dtype=METRICS_DTYPE)
+    scores["MAE"] = mae
+    scores["MSE"] = mse
+    scores["RMSE"] = np.sqrt(mse)
+    scores["MAPE"] = mape
+    scores["SMAPE"] = smape
+    scores["WAPE"] = np.where(np.isnan(count), np.nan, wape)
+    scores["R2"] = r2
+    scores["MASE"] = mase
+    scores["Bias"] = bias
+    scores["Skewness"] = skewness
+    scores["Kurtosis"] = kurtosis
+    scores["Directional Accuracy"] = directional_accuracy
+    scores["Confidence Score"] = np.maximum(0, 100 - mape)
+    scores["Volatility Error Ratio"] = volatility_error_ratio
+    return scores
+
+
+def _count(mask: np.ndarray) -> np.ndarray:
+    """Per-series number of True entries, NaN where there are none."""
+    count = mask.sum(axis=-1).astype(np.float64)
+    return np.where(count == 0, np.nan, count)
+
+
+def _diff_std(diffs: np.ndarray, pairs: np.ndarray, pair_count: np.ndarray) -> np.ndarray:
+    centered = np.where(pairs, diffs - (diffs.sum(axis=-1) / pair_count)[..., None], 0.0)
+    return np.sqrt((centered ** 2).sum(axis=-1) / pair_count)
+
+
+def calculate_evaluation_metrics(y_true, y_pred) -> Dict[str, float]:
     """
     Comprehensive evaluation metrics for forecasting models.
-    Returns 15 professional-grade performance indicators.
+    Returns 14 professional-grade performance indicators.
     """
-
-    y_true = np.array(y_true)
-    y_pred = np.array(y_pred)
-
-    residuals = y_true - y_pred
-
-    # ---------- Core Error Metrics ----------
-    mae = np.mean(np.abs(residuals))
-    mse = np.mean(residuals ** 2)
-    rmse = np.sqrt(mse)
-
-    # Prevent divide by zero
-    safe_true = np.where(y_true == 0, 1e-8, y_true)
-
-    mape = np.mean(np.abs(residuals / safe_true)) * 100
-    smape = np.mean(2.0 * np.abs(y_pred - y_true) / (np.abs(y_true) + np.abs(y_pred) + 1e-8)) * 100
-    wape = np.sum(np.abs(residuals)) / (np.sum(np.abs(y_true)) + 1e-8) * 100
-
-    # ---------- Goodness of Fit ----------
-    r2 = r2_score(y_true, y_pred)
-
-    # ---------- Forecast Stability ----------
-    bias = np.mean(residuals)
-
-    # MASE
-    if len(y_true) > 1:
-        naive_forecast = np.roll(y_true, 1)
-        naive_errors = np.abs(y_true[1:] - naive_forecast[1:])
-        mase = mae / (np.mean(naive_errors) + 1e-8)
-    else:
-        mase = np.nan
-
-    # ---------- Residual Distribution ----------
-    residual_mean = np.mean(residuals)
-    residual_std = np.std(residuals) + 1e-8
-
-    skewness = np.mean((residuals - residual_mean) ** 3) / residual_std ** 3
-    kurtosis = np.mean((residuals - residual_mean) ** 4) / residual_std ** 4
-
-    # ---------- Direction Accuracy ----------
-    if len(y_true) > 1:
-        direction_actual = np.sign(np.diff(y_true))
-        direction_pred = np.sign(np.diff(y_pred))
-        directional_accuracy = np.mean(direction_actual == direction_pred) * 100
-    else:
-        directional_accuracy = np.nan
-
-    # ---------- Confidence Score ----------
-    confidence_score = max(0, 100 - mape)
-
-    # ---------- Volatility Error Ratio ----------
-    actual_volatility = np.std(np.diff(y_true))
-    pred_volatility = np.std(np.diff(y_pred))
-    volatility_error_ratio = pred_volatility / (actual_volatility + 1e-8)
-
-    return {
-        "MAE": mae,
-        "MSE": mse,
-        "RMSE": rmse,
-        "MAPE": mape,
-        "SMAPE": smape,
-        "WAPE": wape,
-        "R2": r2,
-        "MASE": mase,
-        "Bias": bias,
-        "Skewness": skewness,
-        "Kurtosis": kurtosis,
-        "Directional Accuracy": directional_accuracy,
-        "Confidence Score": confidence_score,
-        "Volatility Error Ratio": volatility_error_ratio
-    }
+    scores = batch_evaluation_metrics(np.ravel(y_true), np.ravel(y_pred))
+    return {name: float(scores[name]) for name in METRIC_NAMES}
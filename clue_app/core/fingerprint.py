@@ -0,0 +1,133 @@
+"""
+Data Fingerprinting for CLUE Financial Forecasting Application
+Produces stable content hashes for series, frames and parameter dicts
+so fitted models and derived results can be cached by the data they came from.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+
+def fingerprint_data(data: Any) -> str:
+    """Returns a hex digest of the values and index of a Series/DataFrame/array."""
+    digest = hashlib.sha1()
+
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        hashed = pd.util.hash_pandas_object(data, index=True).to_numpy()
+        digest.update(np.ascontiguousarray(hashed).tobytes())
+        if isinstance(data, pd.DataFrame):
+            digest.update(repr(list(data.columns)).encode())
+        else:
+            digest.update(repr(data.name).encode())
+    else:
+        values = np.ascontiguousarray(np.asarray(data))
+        digest.update(str(values.dtype).encode())
+        digest.update(repr(values.shape).encode())
+        digest.update(values.tobytes())
+
+    return digest.hexdigest()
+
+
+def prefix_fingerprints(data: pd.Series, lengths) -> Dict[int, str]:
+    """
+    fingerprint_data(data.iloc[:n]) for every n in lengths, hashing the
+    rows only once (row hashes of a prefix are a prefix of the row hashes).
+    """
+    hashed = np.ascontiguousarray(pd.util.hash_pandas_object(data, index=True).to_numpy())
+    suffix = repr(data.name).encode()
+
+    fingerprints = {}
+    for n in lengths:
+        if 0 < n <= len(hashed):
+            digest = hashlib.sha1(hashed[:n].tobytes())
+            digest.update(suffix)
+            fingerprints[n] = digest.hexdigest()
+    return fingerprints
+
+
+# Artist getters that decide what a rendered figure looks like
+_FIGURE_GETTERS = (
+    "get_xydata",
+    "get_offsets",
+    "get_xlim",
+    "get_ylim",
+    "get_text",
+    "get_position",
+    "get_color",
+    "get_facecolor",
+    "get_edgecolor",
+    "get_linewidth",
+    "get_linestyle",
+    "get_alpha",
+    "get_visible",
+)
+
+# Patches whose geometry is laid out at draw time (legend frames, axis spines)
+_LAYOUT_PATCHES = ("FancyBboxPatch", "Spine")
+
+
+def fingerprint_figure(fig: Any) -> str:
+    """
+    Returns a hex digest of a matplotlib figure's drawn content (artist data,
+    geometry, limits, text and colours), so unchanged figures can reuse a
+    previous rendering. Works on any figure without importing matplotlib.
+    """
+    digest = hashlib.sha1()
+    digest.update(repr((tuple(fig.get_size_inches()), fig.dpi)).encode())
+
+    for artist, getters in _figure_artists(fig):
+        digest.update(type(artist).__name__.encode())
+        for getter in getters:
+            method = getattr(artist, getter, None)
+            if method is None:
+                continue
+            try:
+                _update_digest(digest, method())
+            except Exception:
+                # Some getters need a renderer or are not meaningful for this artist
+                continue
+
+        # Patches (bars) and collections (fills) keep their geometry in paths
+        if type(artist).__name__ in _LAYOUT_PATCHES:
+            continue
+        if hasattr(artist, "get_patch_transform"):
+            try:
+                _update_digest(digest, artist.get_patch_transform().transform_path(artist.get_path()).vertices)
+            except Exception:
+                pass
+        elif hasattr(artist, "get_paths"):
+            for path in artist.get_paths():
+                _update_digest(digest, path.vertices)
+
+    return digest.hexdigest()
+
+
+def _figure_artists(fig: Any):
+    stack = list(fig.get_children())
+    while stack:
+        artist = stack.pop()
+        if hasattr(artist, "get_major_ticks"):
+            # Ticks and label positions are laid out at draw time; only the label text is content
+            yield artist.label, ("get_text", "get_color", "get_visible")
+            continue
+        yield artist, _FIGURE_GETTERS
+        stack.extend(artist.get_children())
+
+
+def _update_digest(digest, value: Any):
+    if isinstance(value, np.ndarray) or (isinstance(value, (list, tuple)) and value and isinstance(value[0], np.ndarray)):
+        array = np.ascontiguousarray(np.asarray(value, dtype=float) if not isinstance(value, np.ndarray) else value)
+        digest.update(repr(array.shape).encode())
+        digest.update(array.tobytes())
+    else:
+        digest.update(repr(value).encode())
+
+
+def fingerprint_params(params: Dict[str, Any]) -> str:
+    """Returns a hex digest of a parameter dict, independent of key order."""
+    payload = json.dumps(params or {}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
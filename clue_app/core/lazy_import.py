@@ -0,0 +1,48 @@
+"""
+Lazy Module Loading for CLUE
+Heavy libraries (pmdarima/statsmodels, xgboost, reportlab, yfinance) are
+only imported when a code path actually needs them, so the GUI and the
+CLI start without paying for models the user never selects.
+
+    auto_arima = lazy_module("forecasting.auto_arima")
+    ...
+    model = auto_arima.AutoARIMAModel()   # imported here, on first use
+"""
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import Optional
+
+
+class LazyModule:
+    """Module proxy that imports its target on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._module is not None or self._name in sys.modules
+
+    def load(self) -> ModuleType:
+        if self._module is None:
+            # Job worker threads may race here; import_module is itself locked per module
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attribute: str):
+        return getattr(self.load(), attribute)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    return LazyModule(name)
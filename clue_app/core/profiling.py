@@ -0,0 +1,360 @@
+"""
+Pipeline Profiling for CLUE
+Lightweight spans around the pipeline stages (load, features, split, fit,
+forecast, metrics, report):
+
+    with span("fit", rows=len(X_train), model="XGBOOST") as stage:
+        ...
+        stage.attrs["source"] = "store"
+
+    @profiled("create_features", rows=len)
+    def create_features(df): ...
+
+- each span records wall time, process CPU time (all threads, including
+  native ones such as XGBoost's, so concurrent stages overlap), its own
+  peak RSS (the current RSS sampled while the span is open) and a row count
+- spans nest per thread; a stage's time includes the spans it contains
+- finished spans are kept in a ring buffer for the CLI, the Qt diagnostics
+  panel and the PDF report appendix
+- optional JSON-lines log (CLUE_PROFILE_LOG) and cProfile / pyinstrument
+  dumps of each outermost span (CLUE_PROFILE_DUMPS, CLUE_PROFILE_BACKEND)
+Spans opened inside worker processes (order search, backtest chunks) are
+not collected; their time shows up in the enclosing span of the parent.
+"""
+
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+import warnings
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+DEFAULT_MAX_SPANS = 500
+DEFAULT_RSS_INTERVAL = 0.02
+DUMP_BACKENDS = ("cprofile", "pyinstrument")
+
+# Columns of span_rows(): the CLI, the diagnostics panel and the report appendix
+SPAN_COLUMNS = ("Stage", "Wall (s)", "Process CPU (s)", "Peak RSS (MB)", "Rows")
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss_mb() -> Optional[float]:
+    """Current resident set size of the process, None when unavailable."""
+    try:
+        with open("/proc/self/statm", "rb") as handle:
+            return int(handle.read().split()[1]) * _PAGE_SIZE / 1024 ** 2
+    except (OSError, IndexError, ValueError):
+        pass
+
+    # macOS / Windows
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss / 1024 ** 2
+
+
+class Span:
+    __slots__ = (
+        "id", "name", "parent", "depth", "thread", "started_at",
+        "wall_seconds", "cpu_seconds", "peak_rss_mb", "rss_growth_mb",
+        "rows", "attrs", "error", "dump",
+    )
+
+    def __init__(self, span_id: int, name: str, parent: Optional[int], depth: int, rows: Optional[int], attrs: Dict):
+        self.id = span_id
+        self.name = name
+        self.parent = parent
+        self.depth = depth
+        self.thread = threading.current_thread().name
+        self.started_at = time.time()
+        self.wall_seconds = None
+        self.cpu_seconds = None
+        self.peak_rss_mb = None
+        self.rss_growth_mb = None
+        self.rows = rows
+        self.attrs = attrs
+        self.error = None
+        self.dump = None
+
+    def as_dict(self) -> Dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class Profiler:
+    def __init__(
+        self,
+        max_spans: int = DEFAULT_MAX_SPANS,
+        log_path: Optional[str] = None,
+        dump_dir: Optional[str] = None,
+        dump_backend: str = "cprofile",
+        rss_interval: float = DEFAULT_RSS_INTERVAL,
+    ):
+        """
+        log_path: JSON-lines file every finished span is appended to
+        dump_dir: directory for a cProfile (.prof) / pyinstrument (.html) dump per outermost span
+        rss_interval: seconds between RSS samples while spans are open
+        """
+        if dump_backend not in DUMP_BACKENDS:
+            raise ValueError(f"Unsupported profiler backend: {dump_backend}")
+
+        self.enabled = True
+        self.log_path = log_path
+        self.dump_dir = dump_dir
+        self.dump_backend = dump_backend
+
+        self._spans: "deque[Span]" = deque(maxlen=max_spans)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # One sampling profiler at a time, whatever the thread
+        self._dump_lock = threading.Lock()
+
+        # Open spans (any thread) whose peak RSS the sampler thread raises
+        self.rss_interval = rss_interval
+        self._open: set = set()
+        self._open_lock = threading.Lock()
+        self._spans_open = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    # -------------------- SPANS --------------------
+
+    @contextmanager
+    def span(self, name: str, rows: Optional[int] = None, **attrs) -> Iterator[Span]:
+        """Times the block; rows / attrs can still be filled in on the yielded span."""
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        current = Span(next(self._ids), name, parent.id if parent else None, len(stack), rows, attrs)
+
+        if not self.enabled:
+            yield current
+            return
+
+        dumper = self._start_dump() if parent is None and self.dump_dir else None
+        stack.append(current)
+        rss_before = current_rss_mb()
+        current.peak_rss_mb = rss_before
+        self._open_span(current)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield current
+        except BaseException as exc:
+            current.error = type(exc).__name__
+            raise
+        finally:
+            current.wall_seconds = time.perf_counter() - wall_start
+            current.cpu_seconds = time.process_time() - cpu_start
+            self._close_span(current)
+            if rss_before is not None:
+                current.rss_growth_mb = current.peak_rss_mb - rss_before
+            stack.pop()
+            if dumper is not None:
+                current.dump = self._finish_dump(dumper, current)
+            self._record(current)
+
+    # -------------------- RECORDS --------------------
+
+    def mark(self) -> int:
+        """Id of the newest finished span; records(since=mark) then returns only later spans."""
+        with self._lock:
+            return max((span.id for span in self._spans), default=0)
+
+    def records(self, since: int = 0) -> List[Dict]:
+        """Finished spans as dicts, in start order."""
+        with self._lock:
+            spans = [span for span in self._spans if span.id > since]
+        return [span.as_dict() for span in sorted(spans, key=lambda span: span.id)]
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+
+    def export_jsonl(self, path: str, since: int = 0) -> int:
+        """Appends finished spans to a JSON-lines file and returns how many were written."""
+        records = self.records(since)
+        with open(path, "a", encoding="utf-8") as handle:
+            for record in records:
+                handle.write(json.dumps(record, default=str) + "\n")
+        return len(records)
+
+    # -------------------- HELPERS --------------------
+
+    def _stack(self) -> List[Span]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _open_span(self, current: Span):
+        if current.peak_rss_mb is None:
+            return
+        with self._open_lock:
+            self._open.add(current)
+            self._spans_open.set()
+            if self._sampler is None:
+                self._sampler = threading.Thread(target=self._sample_rss, name="clue-rss-sampler", daemon=True)
+                self._sampler.start()
+
+    def _close_span(self, current: Span):
+        if current.peak_rss_mb is None:
+            return
+        # Final sample, so spans shorter than the interval still see their end state
+        rss = current_rss_mb()
+        with self._open_lock:
+            self._open.discard(current)
+            if not self._open:
+                self._spans_open.clear()
+            if rss is not None:
+                current.peak_rss_mb = max(current.peak_rss_mb, rss)
+
+    def _sample_rss(self):
+        while True:
+            self._spans_open.wait()
+            rss = current_rss_mb()
+            if rss is not None:
+                with self._open_lock:
+                    for current in self._open:
+                        if rss > current.peak_rss_mb:
+                            current.peak_rss_mb = rss
+            time.sleep(self.rss_interval)
+
+    def _record(self, current: Span):
+        with self._lock:
+            self._spans.append(current)
+            if self.log_path:
+                try:
+                    with open(self.log_path, "a", encoding="utf-8") as handle:
+                        handle.write(json.dumps(current.as_dict(), default=str) + "\n")
+                except OSError as exc:
+                    warnings.warn(f"Could not write profile log {self.log_path}: {exc}")
+
+    def _start_dump(self):
+        # Nested or concurrent stages are covered by the dump already running
+        if not self._dump_lock.acquire(blocking=False):
+            return None
+
+        backend = self.dump_backend
+        if backend == "pyinstrument":
+            try:
+                from pyinstrument import Profiler as SamplingProfiler
+            except ImportError:
+                warnings.warn("pyinstrument dumps need the optional pyinstrument package; using cProfile")
+                backend = "cprofile"
+            else:
+                sampler = SamplingProfiler()
+                sampler.start()
+                return backend, sampler
+
+        import cProfile
+        sampler = cProfile.Profile()
+        try:
+            sampler.enable()
+        except ValueError:
+            # Another profiler (e.g. a debugger) is already active
+            self._dump_lock.release()
+            return None
+        return backend, sampler
+
+    def _finish_dump(self, dumper, current: Span) -> Optional[str]:
+        backend, sampler = dumper
+        try:
+            directory = Path(self.dump_dir)
+            directory.mkdir(parents=True, exist_ok=True)
+            stem = f"{time.strftime('%Y%m%d-%H%M%S')}-{current.id:05d}-{current.name}"
+
+            if backend == "pyinstrument":
+                sampler.stop()
+                path = directory / f"{stem}.html"
+                path.write_text(sampler.output_html(), encoding="utf-8")
+            else:
+                sampler.disable()
+                path = directory / f"{stem}.prof"
+                sampler.dump_stats(str(path))
+            return str(path)
+        except OSError as exc:
+            warnings.warn(f"Could not write profile dump to {self.dump_dir}: {exc}")
+            return None
+        finally:
+            self._dump_lock.release()
+
+
+# -------------------- FORMATTING --------------------
+
+def span_rows(records: List[Dict]) -> List[List[str]]:
+    """Table rows (SPAN_COLUMNS) for span records, stages indented by nesting depth."""
+    rows = []
+    for record in records:
+        stage = "  " * record["depth"] + record["name"]
+        if record["attrs"].get("model"):
+            stage += f" [{record['attrs']['model']}]"
+        if record["error"]:
+            stage += f" ({record['error']})"
+        rows.append([
+            stage,
+            f"{record['wall_seconds']:.3f}",
+            f"{record['cpu_seconds']:.3f}",
+            "-" if record["peak_rss_mb"] is None else f"{record['peak_rss_mb']:.1f}",
+            "-" if record["rows"] is None else str(record["rows"]),
+        ])
+    return rows
+
+
+def format_spans(records: List[Dict]) -> str:
+    """Plain-text stage table, as printed by the CLI."""
+    rows = [list(SPAN_COLUMNS)] + span_rows(records)
+    widths = [max(len(row[i]) for row in rows) for i in range(len(SPAN_COLUMNS))]
+    lines = [
+        "  ".join(cell.ljust(width) if i == 0 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths)))
+        for row in rows
+    ]
+    lines.insert(1, "-" * len(lines[0]))
+    return "\n".join(lines)
+
+
+# -------------------- DEFAULT PROFILER --------------------
+
+_default_profiler: Optional[Profiler] = None
+_default_profiler_lock = threading.Lock()
+
+
+def get_profiler() -> Profiler:
+    """Returns the session-wide profiler, configured from CLUE_PROFILE_* variables."""
+    global _default_profiler
+    with _default_profiler_lock:
+        if _default_profiler is None:
+            _default_profiler = Profiler(
+                log_path=os.environ.get("CLUE_PROFILE_LOG") or None,
+                dump_dir=os.environ.get("CLUE_PROFILE_DUMPS") or None,
+                dump_backend=os.environ.get("CLUE_PROFILE_BACKEND", "cprofile"),
+            )
+        return _default_profiler
+
+
+def span(name: str, rows: Optional[int] = None, **attrs):
+    """span() of the session-wide profiler."""
+    return get_profiler().span(name, rows, **attrs)
+
+
+def profiled(name: Optional[str] = None, rows: Optional[Callable] = None, profiler: Optional[Profiler] = None):
+    """
+    Decorator form of span(); rows(result) gives the span's row count.
+    Without profiler, the session-wide one is looked up at call time.
+    """
+    def decorator(fn):
+        stage = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with (profiler or get_profiler()).span(stage) as current:
+                result = fn(*args, **kwargs)
+                if rows is not None:
+                    current.rows = rows(result)
+                return result
+        return wrapper
+    return decorator
@@ -10,23 +10,75 @@ Includes:
 - Evaluation Metrics (extended)
 - Forecast Visualization
 - Predicted Values Table
+- Appendix: Pipeline Timings (profiling spans)
 """
 
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-import matplotlib.pyplot as plt
+import io
 import os
-import tempfile
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 
+from core.profiling import SPAN_COLUMNS, profiled, span_rows
 
-def _save_figure_to_image(fig):
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-    fig.savefig(tmp.name, dpi=150, bbox_inches="tight")
-    return tmp.name
 
+IMAGE_WIDTH = 400
+IMAGE_HEIGHT = 300
 
+
+def _render_figure(fig, image_format: str = "png", dpi: int = 150) -> bytes:
+    """Renders fig into memory through the figure cache (unchanged figures are not re-rendered)."""
+    if isinstance(fig, bytes):
+        # Already rendered by the caller (the GUI renders shown figures on its own thread)
+        return fig
+
+    from visualization.figure_cache import get_figure_cache
+    return get_figure_cache().render(fig, image_format, dpi)
+
+
+def _vector_support() -> bool:
+    try:
+        import svglib  # noqa: F401
+    except ImportError:
+        warnings.warn("vector figures need the optional svglib package; embedding PNG instead")
+        return False
+    return True
+
+
+def _figure_flowable(rendered: bytes, vector: bool):
+    """reportlab flowable for an in-memory PNG, or a scaled vector Drawing for SVG."""
+    if not vector or rendered.startswith(b"\x89PNG"):
+        from reportlab.platypus import Image
+        return Image(io.BytesIO(rendered), width=IMAGE_WIDTH, height=IMAGE_HEIGHT)
+
+    from svglib.svglib import svg2rlg
+    drawing = svg2rlg(io.BytesIO(rendered))
+    drawing.scale(IMAGE_WIDTH / drawing.width, IMAGE_HEIGHT / drawing.height)
+    drawing.width, drawing.height = IMAGE_WIDTH, IMAGE_HEIGHT
+    return drawing
+
+
+def format_eda_summary(summary: dict) -> str:
+    """Plain-text EDA section from preprocessing.eda.eda_summary output."""
+    stats = summary.get("basic_stats", {})
+    returns = summary.get("returns_stats", {})
+
+    return (
+        "DATA OVERVIEW\n"
+        f"Start Date   : {stats.get('start_date')}\n"
+        f"End Date     : {stats.get('end_date')}\n"
+        f"Observations : {stats.get('n_observations')}\n\n"
+        "PRICE STATISTICS\n"
+        f"Min  : {stats.get('min'):.2f}\n"
+        f"Max  : {stats.get('max'):.2f}\n"
+        f"Mean : {stats.get('mean'):.2f}\n"
+        f"Std  : {stats.get('std'):.2f}\n\n"
+        "RETURNS\n"
+        f"Mean Daily Return : {returns.get('mean_daily_return'):.4f}\n"
+        f"Volatility        : {returns.get('volatility'):.4f}\n"
+    )
+
+
+@profiled("generate_report")
 def generate_report(
     output_path: str,
     title: str,
@@ -36,8 +88,34 @@ def generate_report(
     eda_fig=None,
     forecast_fig=None,
     predicted_values=None,
-    notes: str = ""
+    notes: str = "",
+    vector: bool = False,
+    dpi: int = 150,
+    render_jobs: int = None,
+    profile: list = None,
 ):
+    """
+    vector: embed figures as vector drawings instead of PNG; needs the optional
+            svglib package (commented out in requirements.txt), else falls back to PNG
+    render_jobs: threads rendering figures while the rest of the story is built
+    eda_fig / forecast_fig: matplotlib Figures, or PNG bytes rendered beforehand
+    profile: span records (core.profiling) listed in a timings appendix
+    """
+    # reportlab is only needed once a report is actually generated
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib import colors
+
+    vector = vector and _vector_support()
+    image_format = "svg" if vector else "png"
+    figures = {name: fig for name, fig in (("eda", eda_fig), ("forecast", forecast_fig)) if fig is not None}
+
+    # Figures are rendered in memory, concurrently, while the text is laid out
+    pool = ThreadPoolExecutor(max_workers=render_jobs or max(1, min(len(figures), os.cpu_count() or 1)))
+    rendering = {name: pool.submit(_render_figure, fig, image_format, dpi) for name, fig in figures.items()}
+    pool.shutdown(wait=False)
+
     doc = SimpleDocTemplate(output_path, pagesize=A4)
     styles = getSampleStyleSheet()
     story = []
@@ -56,10 +134,9 @@ def generate_report(
         story.append(Spacer(1, 12))
 
     # ================= EDA IMAGE =================
-    if eda_fig is not None:
-        img_path = _save_figure_to_image(eda_fig)
+    if "eda" in rendering:
         story.append(Paragraph("EDA Visuals", styles['Heading2']))
-        story.append(Image(img_path, width=400, height=300))
+        story.append(_figure_flowable(rendering["eda"].result(), vector))
         story.append(PageBreak())
 
     # ================= MODEL DETAILS =================
@@ -92,10 +169,9 @@ def generate_report(
     story.append(PageBreak())
 
     # ================= FORECAST IMAGE =================
-    if forecast_fig is not None:
-        img_path = _save_figure_to_image(forecast_fig)
+    if "forecast" in rendering:
         story.append(Paragraph("Forecast Visualization", styles['Heading2']))
-        story.append(Image(img_path, width=400, height=300))
+        story.append(_figure_flowable(rendering["forecast"].result(), vector))
         story.append(PageBreak())
 
     # ================= PREDICTED VALUES =================
@@ -118,4 +194,25 @@ def generate_report(
         story.append(Paragraph("Notes", styles['Heading2']))
         story.append(Paragraph(notes, styles['BodyText']))
 
+    # ================= APPENDIX: PIPELINE TIMINGS =================
+    if profile:
+        story.append(PageBreak())
+        story.append(Paragraph("Appendix: Pipeline Timings", styles['Heading2']))
+        story.append(Paragraph(
+            "Wall time, process CPU time (all threads) and peak resident memory per "
+            "pipeline stage; nested stages are indented and included in their parent. "
+            "Peak RSS is the highest RSS sampled while the stage ran.",
+            styles['BodyText'],
+        ))
+        story.append(Spacer(1, 12))
+
+        table = Table([list(SPAN_COLUMNS)] + span_rows(profile), repeatRows=1)
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+        ]))
+        story.append(table)
+
     doc.build(story)
@@ -0,0 +1,188 @@
+"""
+Columnar Series Store for CLUE Financial Forecasting Application
+Keeps each cleaned CSV series on local disk as two raw NumPy columns
+(int64 timestamps, float64 values) so later loads are memory-mapped
+reads instead of CSV parsing.
+Handles:
+- Fast validation by source size/mtime, with a content hash fallback
+- Zero-copy DataFrames backed by copy-on-write maps of the files
+- Atomic writes next to a small JSON manifest
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import warnings
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_STORE_DIR = Path.home() / ".clue" / "series"
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_sha1(path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SeriesStore:
+    def __init__(self, root_dir: Optional[str] = None):
+        self.root_dir = Path(root_dir or os.environ.get("CLUE_SERIES_DIR", DEFAULT_STORE_DIR))
+        self._lock = threading.Lock()
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def load(self, file_path: str, date_column: str = "Date", target_column: str = "Close") -> Optional[pd.DataFrame]:
+        """Returns the stored series for the CSV, or None when missing or stale."""
+        source = Path(file_path).resolve()
+        dates_path, values_path, manifest_path = self._paths(source, date_column, target_column)
+        if not manifest_path.exists():
+            return None
+
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            stat = source.stat()
+        except (OSError, ValueError):
+            return None
+
+        if (manifest.get("size"), manifest.get("mtime_ns")) != (stat.st_size, stat.st_mtime_ns):
+            # Touched or copied files keep their cache when the content is unchanged
+            if manifest.get("size") != stat.st_size or manifest.get("sha1") != file_sha1(source):
+                self._remove(dates_path, values_path, manifest_path)
+                return None
+            manifest["mtime_ns"] = stat.st_mtime_ns
+            self._write_manifest(manifest_path, manifest)
+
+        try:
+            dates = np.load(dates_path, mmap_mode="c")
+            values = np.load(values_path, mmap_mode="c")
+        except (OSError, ValueError):
+            self._remove(dates_path, values_path, manifest_path)
+            return None
+
+        if len(dates) != manifest.get("rows") or len(values) != len(dates):
+            self._remove(dates_path, values_path, manifest_path)
+            return None
+
+        # Keep the parser's resolution, so fingerprints match a fresh CSV load
+        unit = manifest.get("unit", "ns")
+        index = pd.DatetimeIndex(dates.view(f"datetime64[{unit}]"), name="Date", copy=False)
+        return pd.DataFrame({target_column: values}, index=index, copy=False)
+
+    def save(self, df: pd.DataFrame, file_path: str, date_column: str = "Date", target_column: str = "Close") -> Path:
+        """Writes the cleaned series of a CSV as mapped columns plus manifest."""
+        source = Path(file_path).resolve()
+        dates_path, values_path, manifest_path = self._paths(source, date_column, target_column)
+        stat = source.stat()
+
+        dates = np.ascontiguousarray(df.index.asi8, dtype=np.int64)
+        values = np.ascontiguousarray(df[target_column].to_numpy(), dtype=np.float64)
+
+        manifest = {
+            "source": str(source),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha1": file_sha1(source),
+            "date_column": date_column,
+            "target_column": target_column,
+            "rows": len(dates),
+            "unit": df.index.unit,
+        }
+
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._atomic_save(dates_path, dates)
+            self._atomic_save(values_path, values)
+            self._write_manifest(manifest_path, manifest)
+        return manifest_path
+
+    def invalidate(self, file_path: str, date_column: str = "Date", target_column: str = "Close"):
+        self._remove(*self._paths(Path(file_path).resolve(), date_column, target_column))
+
+    def clear(self):
+        if not self.root_dir.exists():
+            return
+        with self._lock:
+            for manifest_path in self.root_dir.glob("*.json"):
+                stem = manifest_path.name[:-len(".json")]
+                self._remove(
+                    self.root_dir / f"{stem}.dates.npy",
+                    self.root_dir / f"{stem}.values.npy",
+                    manifest_path,
+                )
+
+    # -------------------- STORAGE HELPERS --------------------
+
+    def _paths(self, source: Path, date_column: str, target_column: str):
+        stem = hashlib.sha1(f"{source}|{date_column}|{target_column}".encode()).hexdigest()[:20]
+        return (
+            self.root_dir / f"{stem}.dates.npy",
+            self.root_dir / f"{stem}.values.npy",
+            self.root_dir / f"{stem}.json",
+        )
+
+    def _atomic_save(self, path: Path, array: np.ndarray):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                np.save(fh, array, allow_pickle=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _write_manifest(self, path: Path, manifest: Dict):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump(manifest, fh, indent=2)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _remove(*paths: Path):
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Still mapped by a live DataFrame (Windows); overwritten on next save
+                pass
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+_default_store: Optional[SeriesStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_series_store() -> SeriesStore:
+    """Returns the default on-disk series store (CLUE_SERIES_DIR or ~/.clue/series)."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = SeriesStore()
+        return _default_store
+
+
+def save_series_quietly(store: SeriesStore, *args, **kwargs) -> Optional[Path]:
+    """Saves a series, downgrading disk errors to a warning so loading still succeeds."""
+    try:
+        return store.save(*args, **kwargs)
+    except OSError as exc:
+        warnings.warn(f"Could not cache series in {store.root_dir}: {exc}")
+        return None
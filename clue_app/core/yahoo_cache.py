@@ -0,0 +1,262 @@
+"""
+Yahoo Finance Price Cache for CLUE Financial Forecasting Application
+Keeps every downloaded price frame per ticker on local disk, together
+with the date ranges it covers, so repeated requests only fetch the
+missing ranges and fully covered requests are served offline.
+Handles:
+- Half-open [start, end) coverage bookkeeping per ticker
+- Incremental fetches of gaps only, merged into the stored frame
+- Injectable downloader (ticker, start, end) -> DataFrame for offline tests
+- Empty downloads for ranges with weekdays count as failures, never as
+  coverage (yfinance returns an empty frame on network errors and rate limits)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import warnings
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import pandas as pd
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".clue" / "yahoo"
+
+Range = Tuple[pd.Timestamp, pd.Timestamp]
+Downloader = Callable[[str, pd.Timestamp, pd.Timestamp], pd.DataFrame]
+
+
+def yfinance_download(ticker: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Default downloader: adjusted daily prices indexed by date."""
+    import yfinance as yf
+
+    df = yf.download(
+        ticker,
+        start=start.strftime("%Y-%m-%d"),
+        end=end.strftime("%Y-%m-%d"),
+        auto_adjust=True,
+        progress=False,
+    )
+
+    # Fix MultiIndex column issue from Yahoo Finance
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    return df
+
+
+class EmptyDownloadError(ValueError):
+    """The downloader returned no rows for a range that has trading days."""
+
+
+class YahooPriceCache:
+    def __init__(
+        self,
+        root_dir: Optional[str] = None,
+        downloader: Optional[Downloader] = None,
+        offline: bool = False,
+    ):
+        """
+        downloader: (ticker, start, end) -> DataFrame with a DatetimeIndex, end exclusive
+        offline: never call the downloader; uncovered requests raise
+        """
+        self.root_dir = Path(root_dir or os.environ.get("CLUE_YAHOO_DIR", DEFAULT_CACHE_DIR))
+        self.downloader = downloader or yfinance_download
+        self.offline = offline
+        self._lock = threading.Lock()
+        self.downloads = 0
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def get(self, ticker: str, start: str, end: Optional[str] = None) -> pd.DataFrame:
+        """Returns prices for [start, end), downloading only ranges not cached yet."""
+        ticker = ticker.upper()
+        request = self._request_range(start, end)
+
+        with self._lock:
+            data, covered = self._read(ticker)
+            gaps = self.missing_ranges(covered, request)
+
+            if gaps and self.offline:
+                raise ValueError(f"{ticker} {self._format(request)} is not fully cached (offline mode)")
+
+            fetched = []
+            try:
+                for gap in gaps:
+                    fetched.append(self._download(ticker, gap))
+                    covered = self._merge_ranges(covered + [self._settled(gap)])
+            except Exception as exc:
+                if not fetched and self._slice(data, request).empty:
+                    raise
+                warnings.warn(f"Yahoo Finance download failed, serving cached {ticker} data: {exc}")
+
+            if fetched:
+                data = self._combine([data, *fetched])
+                self._write(ticker, data, covered)
+
+        return self._slice(data, request)
+
+    def covered_ranges(self, ticker: str) -> List[Range]:
+        with self._lock:
+            return self._read(ticker.upper())[1]
+
+    def invalidate(self, ticker: str):
+        with self._lock:
+            for path in self._paths(ticker.upper()):
+                self._remove(path)
+
+    @staticmethod
+    def missing_ranges(covered: List[Range], request: Range) -> List[Range]:
+        """Parts of request not inside any covered range."""
+        gaps = []
+        cursor, stop = request
+        for covered_start, covered_end in sorted(covered):
+            if covered_end <= cursor:
+                continue
+            if covered_start >= stop:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < stop:
+            gaps.append((cursor, stop))
+        return gaps
+
+    # -------------------- RANGES --------------------
+
+    @staticmethod
+    def _today() -> pd.Timestamp:
+        return pd.Timestamp.today().normalize()
+
+    def _request_range(self, start: str, end: Optional[str]) -> Range:
+        range_start = pd.Timestamp(start).normalize()
+        range_end = pd.Timestamp(end).normalize() if end else self._today() + pd.Timedelta(days=1)
+        if range_end <= range_start:
+            raise ValueError("end must be after start")
+        return range_start, range_end
+
+    def _settled(self, gap: Range) -> Range:
+        # Today's bar is still moving, so it is never recorded as covered
+        return gap[0], min(gap[1], max(gap[0], self._today()))
+
+    @staticmethod
+    def _merge_ranges(ranges: List[Range]) -> List[Range]:
+        merged: List[Range] = []
+        for range_start, range_end in sorted(r for r in ranges if r[1] > r[0]):
+            if merged and range_start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], range_end))
+            else:
+                merged.append((range_start, range_end))
+        return merged
+
+    @staticmethod
+    def _format(request: Range) -> str:
+        return f"[{request[0]:%Y-%m-%d}, {request[1]:%Y-%m-%d})"
+
+    # -------------------- DATA --------------------
+
+    def _download(self, ticker: str, gap: Range) -> pd.DataFrame:
+        self.downloads += 1
+        df = self.downloader(ticker, gap[0], gap[1])
+        if df is None or df.empty:
+            if self._has_trading_days(self._settled(gap)):
+                # yfinance reports failures (network, rate limit, bad ticker) as empty frames
+                raise EmptyDownloadError(f"no {ticker} prices returned for {self._format(gap)}")
+            # Weekends (and today's unsettled bar): nothing to store
+            return pd.DataFrame()
+
+        df = df.copy()
+        df.index = pd.DatetimeIndex(df.index).tz_localize(None).as_unit("ns")
+        df.index.name = "Date"
+        return df[(df.index >= gap[0]) & (df.index < gap[1])]
+
+    @staticmethod
+    def _has_trading_days(gap: Range) -> bool:
+        # Weekdays only: an empty holiday is retried rather than cached as covered
+        return len(pd.bdate_range(gap[0], gap[1] - pd.Timedelta(days=1))) > 0
+
+    @staticmethod
+    def _combine(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames)
+        return df[~df.index.duplicated(keep="last")].sort_index()
+
+    @staticmethod
+    def _slice(data: pd.DataFrame, request: Range) -> pd.DataFrame:
+        if data.empty:
+            return data.copy()
+        return data[(data.index >= request[0]) & (data.index < request[1])].copy()
+
+    # -------------------- STORAGE HELPERS --------------------
+
+    def _paths(self, ticker: str):
+        stem = f"{''.join(c if c.isalnum() else '_' for c in ticker)}-{hashlib.sha1(ticker.encode()).hexdigest()[:8]}"
+        return self.root_dir / f"{stem}.pkl", self.root_dir / f"{stem}.json"
+
+    def _read(self, ticker: str):
+        data_path, manifest_path = self._paths(ticker)
+        if not data_path.exists() or not manifest_path.exists():
+            return pd.DataFrame(), []
+
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            data = pd.read_pickle(data_path)
+        except Exception:
+            self._remove(data_path)
+            self._remove(manifest_path)
+            return pd.DataFrame(), []
+
+        covered = [(pd.Timestamp(a), pd.Timestamp(b)) for a, b in manifest.get("covered", [])]
+        return data, covered
+
+    def _write(self, ticker: str, data: pd.DataFrame, covered: List[Range]):
+        data_path, manifest_path = self._paths(ticker)
+        manifest = {
+            "ticker": ticker,
+            "covered": [[a.strftime("%Y-%m-%d"), b.strftime("%Y-%m-%d")] for a, b in covered],
+            "rows": len(data),
+        }
+
+        try:
+            self.root_dir.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(data_path, lambda fh: data.to_pickle(fh))
+            self._atomic_write(manifest_path, lambda fh: fh.write(json.dumps(manifest, indent=2).encode()))
+        except OSError as exc:
+            warnings.warn(f"Could not cache {ticker} prices in {self.root_dir}: {exc}")
+
+    def _atomic_write(self, path: Path, write: Callable):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                write(fh)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _remove(path: Path):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+_default_cache: Optional[YahooPriceCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_yahoo_cache() -> YahooPriceCache:
+    """Returns the default on-disk Yahoo price cache (CLUE_YAHOO_DIR or ~/.clue/yahoo)."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = YahooPriceCache()
+        return _default_cache
@@ -1,48 +1,52 @@
 """
 Model Evaluation Module for CLUE Financial Forecasting
 Provides unified evaluation metrics for all forecasting models.
+Thin wrapper over the vectorized engine in core.evaluation_metrics.
 """
 
 import pandas as pd
 import numpy as np
 from typing import Dict
 
+from core.evaluation_metrics import batch_evaluation_metrics
+
 
 class ModelEvaluator:
 
+    SUMMARY_METRICS = ("MAE", "MSE", "RMSE", "MAPE")
+
+    @staticmethod
+    def _score(y_true, y_pred, name: str) -> float:
+        return float(batch_evaluation_metrics(np.ravel(y_true), np.ravel(y_pred))[name])
+
     @staticmethod
     def mae(y_true: pd.Series, y_pred: pd.Series) -> float:
-        return float(np.mean(np.abs(y_true - y_pred)))
+        return ModelEvaluator._score(y_true, y_pred, "MAE")
 
     @staticmethod
     def mse(y_true: pd.Series, y_pred: pd.Series) -> float:
-        return float(np.mean((y_true - y_pred) ** 2))
+        return ModelEvaluator._score(y_true, y_pred, "MSE")
 
     @staticmethod
     def rmse(y_true: pd.Series, y_pred: pd.Series) -> float:
-        return float(np.sqrt(np.mean((y_true - y_pred) ** 2)))
+        return ModelEvaluator._score(y_true, y_pred, "RMSE")
 
     @staticmethod
     def mape(y_true, y_pred):
-        y_true, y_pred = np.array(y_true), np.array(y_pred)
-        mask = y_true != 0
-        return float(np.mean(np.abs((y_true[mask] - y_pred[mask]) / y_true[mask])) * 100)
-
+        return ModelEvaluator._score(y_true, y_pred, "MAPE")
 
     @staticmethod
     def evaluate_all(y_true: pd.Series, y_pred: pd.Series) -> Dict[str, float]:
-        return {
-            "MAE": ModelEvaluator.mae(y_true, y_pred),
-            "MSE": ModelEvaluator.mse(y_true, y_pred),
-            "RMSE": ModelEvaluator.rmse(y_true, y_pred),
-            "MAPE": ModelEvaluator.mape(y_true, y_pred),
-        }
+        scores = batch_evaluation_metrics(np.ravel(y_true), np.ravel(y_pred))
+        return {name: float(scores[name]) for name in ModelEvaluator.SUMMARY_METRICS}
 
 
 # -------------------- GUI FRIENDLY FUNCTION --------------------
 
 def evaluate_model(y_true: pd.Series, y_pred: pd.Series) -> Dict[str, float]:
     return ModelEvaluator.evaluate_all(y_true, y_pred)
+
+
 def compare_models(metrics_a: dict, metrics_b: dict, name_a: str, name_b: str) -> dict:
     """Return simple comparison between two models based on RMSE."""
     rmse_a = metrics_a.get("RMSE", float("inf"))
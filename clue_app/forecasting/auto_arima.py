@@ -3,40 +3,165 @@ Auto ARIMA Model Module for CLUE Financial Forecasting
 Improved version with stronger model search and trend awareness.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Tuple
-from pmdarima import auto_arima
+from typing import Dict, Optional, Tuple
+
+from forecasting.order_search import ARIMAOrderSearch
 
 
 class AutoARIMAModel:
-    def __init__(self):
+    SEARCH_PARAMS = {
+        "max_p": 6,
+        "max_q": 6,
+        "max_d": 2,
+        "max_order": 5,
+        "trend": "t",
+        "information_criterion": "aic",
+    }
+
+    def __init__(
+        self,
+        time_budget: Optional[float] = None,
+        n_jobs: Optional[int] = None,
+        drift_threshold: float = 4.0,
+        drift_window: int = 20,
+        aic_tolerance: float = 0.05,
+        d: Optional[int] = None,
+    ):
+        """
+        d: differencing order decided beforehand (e.g. by screen_stationarity's
+           ADF screen); it wins over the order search's own KPSS decision.
+           None lets the search decide.
+        drift_threshold: z-score of the mean of the last drift_window one-step
+                         residuals (in fit-time residual std) that forces a re-search
+        aic_tolerance: relative rise of AIC per observation that forces a re-search
+        """
         self.model = None
         self.order = None
+        self.time_budget = time_budget
+        self.n_jobs = n_jobs
+        self.drift_threshold = drift_threshold
+        self.drift_window = drift_window
+        self.aic_tolerance = aic_tolerance
+        self.d = d
+        self.search_stats = {}
+        self.n_observations = 0
+        self.last_timestamp = None
+        self.baseline: Dict[str, float] = {}
+        self.last_refresh: Dict = {}
 
     # -------------------- TRAINING --------------------
 
-    def fit(self, series: pd.Series):
-        """Trains optimized Auto ARIMA model on univariate series."""
-
-        self.model = auto_arima(
-            series,
-            start_p=0,
-            start_q=0,
-            max_p=6,
-            max_q=6,
-            max_d=2,
-            seasonal=False,
-            trend="t",
-            information_criterion="aic",
-            stepwise=False,     # deeper search
-            suppress_warnings=True,
-            error_action="ignore",
-            n_jobs=-1
+    def fit(self, series: pd.Series, d: Optional[int] = None):
+        """
+        Trains optimized Auto ARIMA model on univariate series.
+        d: overrides the differencing order given at construction
+        """
+        if d is not None:
+            self.d = d
+
+        search = ARIMAOrderSearch(
+            **self.SEARCH_PARAMS,
+            time_budget=self.time_budget,
+            n_jobs=self.n_jobs,
         )
+        self.model = search.fit_best(series, self.d)
+        self.search_stats = search.stats
 
         self.order = self.model.order
+        self._track(series, new_baseline=True)
+        return self
+
+    def update(self, new_observations: pd.Series):
+        """Extends the fitted model with observations after the training data, keeping its order."""
+        if self.model is None:
+            raise ValueError("Model is not trained yet")
+        self.model.update(pd.Series(new_observations).to_numpy(dtype=float))
+        self.n_observations += len(new_observations)
+        if isinstance(new_observations, pd.Series) and len(new_observations):
+            self.last_timestamp = new_observations.index[-1]
         return self
 
+    def refit(self, series: pd.Series):
+        """Refits the current order on series without searching again."""
+        if self.model is None:
+            raise ValueError("Model is not trained yet")
+        self.model = ARIMAOrderSearch(**self.SEARCH_PARAMS).fit_order(series, self.order)
+        self._track(series, new_baseline=True)
+        return self
+
+    def refresh(self, series: pd.Series) -> str:
+        """
+        Brings the model up to date with series, which must extend the
+        training data. New observations are appended with update(); the
+        full order search only runs when the drift or AIC trigger fires.
+        Returns "unchanged", "updated" or "researched".
+        """
+        if self.model is None or not getattr(self, "baseline", None):
+            self.fit(series)
+            return self._refreshed("researched", reason="no fitted baseline")
+
+        new_observations = series.iloc[self.n_observations:]
+        if len(series) < self.n_observations or (
+            self.last_timestamp is not None and series.index[self.n_observations - 1] != self.last_timestamp
+        ):
+            self.fit(series)
+            return self._refreshed("researched", reason="series does not extend the training data")
+
+        if new_observations.empty:
+            return self._refreshed("unchanged")
+
+        self.update(new_observations)
+        triggers = self.check_triggers()
+        if triggers["drift"] or triggers["aic"]:
+            self.fit(series)
+            return self._refreshed("researched", reason="drift" if triggers["drift"] else "aic", **triggers)
+
+        return self._refreshed("updated", **triggers)
+
+    def check_triggers(self) -> Dict:
+        """Drift and AIC-degradation statistics of the current model against its fit-time baseline."""
+        residuals = self._residuals()
+        window = residuals[-min(self.drift_window, len(residuals)):]
+        drift_z = abs(window.mean()) / (self.baseline["resid_std"] / np.sqrt(len(window)) + 1e-12)
+
+        aic_per_obs = float(self.model.aic()) / len(residuals)
+        aic_change = (aic_per_obs - self.baseline["aic_per_obs"]) / (abs(self.baseline["aic_per_obs"]) + 1e-12)
+
+        return {
+            "drift_z": float(drift_z),
+            "aic_change": float(aic_change),
+            "drift": bool(drift_z > self.drift_threshold),
+            "aic": bool(aic_change > self.aic_tolerance),
+        }
+
+    def _track(self, series: pd.Series, new_baseline: bool):
+        self.n_observations = len(series)
+        self.last_timestamp = series.index[-1] if isinstance(series, pd.Series) and len(series) else None
+        if new_baseline:
+            residuals = self._residuals()
+            self.baseline = {
+                "resid_std": float(residuals.std()) or 1e-12,
+                "aic_per_obs": float(self.model.aic()) / len(residuals),
+            }
+
+    def _residuals(self) -> np.ndarray:
+        # The first p + d residuals absorb the initial level; leave them out
+        p, d, _ = self.order
+        return np.asarray(self.model.resid(), dtype=float)[max(1, p + d):]
+
+    def _refreshed(self, action: str, **details) -> str:
+        self.last_refresh = {"action": action, **details}
+        return action
+
+    def get_params(self) -> dict:
+        """Returns the order-search configuration used by fit."""
+        params = {**self.SEARCH_PARAMS, "time_budget": self.time_budget}
+        if getattr(self, "d", None) is not None:
+            params["d"] = self.d
+        return params
+
     # -------------------- FORECASTING --------------------
 
     def forecast(self, periods: int = 30) -> Tuple[pd.Series, pd.DataFrame]:
@@ -67,8 +192,8 @@ class AutoARIMAModel:
 
 # -------------------- GUI FRIENDLY FUNCTIONS --------------------
 
-def train_auto_arima(series: pd.Series) -> AutoARIMAModel:
-    model = AutoARIMAModel()
+def train_auto_arima(series: pd.Series, d: Optional[int] = None) -> AutoARIMAModel:
+    model = AutoARIMAModel(d=d)
     model.fit(series)
     return model
 
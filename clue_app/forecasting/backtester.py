@@ -0,0 +1,240 @@
+"""
+Walk-Forward Backtester for CLUE Financial Forecasting
+Out-of-sample evaluation over rolling forecast origins (WalkForwardSplitter):
+- expanding or rolling training windows, configurable folds / step / horizon
+- folds are split into contiguous chunks (at least min_chunk_folds each)
+  that run on a process pool
+- inside a chunk only the first fold is fitted from scratch; later folds
+  refit incrementally (ARIMA update / fixed-order refit, XGBoost warm start)
+- the result is a fold x horizon error matrix plus pooled and per-horizon metrics
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.evaluation_metrics import batch_evaluation_metrics, calculate_evaluation_metrics
+from core.lazy_import import lazy_module
+from preprocessing.feature_engineering import create_features
+from preprocessing.split import Fold, WalkForwardSplitter
+
+model_selector = lazy_module("forecasting.model_selector")
+
+
+MODEL_TYPES = ("AUTO_ARIMA", "XGBOOST", "XGBOOST_DIRECT")
+
+HORIZON_METRICS = ("MAE", "RMSE", "MAPE", "Bias")
+
+
+# -------------------- WORKER FUNCTIONS --------------------
+
+def _init_worker():
+    # Parallelism is across fold chunks; keep each ARIMA order search in-process
+    os.environ["CLUE_SEARCH_JOBS"] = "1"
+
+
+def _run_chunk(model_type: str, df: pd.DataFrame, folds: List[Fold], incremental: bool, update_rounds: int) -> List[Dict]:
+    """Fits and forecasts a run of consecutive folds, reusing the model between them."""
+    featured = create_features(df) if model_type != "AUTO_ARIMA" else None
+    model = None
+    previous: Optional[Fold] = None
+    results = []
+
+    for fold in folds:
+        start = time.perf_counter()
+        if model is None or not incremental:
+            model = _fit_full(model_type, df, featured, fold)
+            refit = "full"
+        else:
+            model, refit = _fit_incremental(model_type, model, df, featured, previous, fold, update_rounds)
+        fit_seconds = time.perf_counter() - start
+
+        horizon = fold.test_end - fold.origin
+        predictions = _forecast(model_type, model, df, featured, fold, horizon)
+
+        results.append({
+            "fold": fold,
+            "refit": refit,
+            "fit_seconds": fit_seconds,
+            "actual": df["Close"].to_numpy()[fold.origin:fold.test_end],
+            "predicted": np.asarray(predictions, dtype=float)[:horizon],
+        })
+        previous = fold
+
+    return results
+
+
+def _training_rows(df: pd.DataFrame, featured: pd.DataFrame, start: int, stop: int):
+    """Feature rows whose observation lies in positions [start, stop) of df."""
+    lower = df.index[start]
+    upper = df.index[stop]
+    rows = featured[(featured.index >= lower) & (featured.index < upper)]
+    return rows.drop(columns=["Close"]), rows["Close"]
+
+
+def _fit_full(model_type: str, df: pd.DataFrame, featured: Optional[pd.DataFrame], fold: Fold):
+    model = model_selector.ModelSelector.get_model_class(model_type)()
+    if model_type == "AUTO_ARIMA":
+        return model.fit(df["Close"].iloc[fold.train_start:fold.origin])
+
+    X_train, y_train = _training_rows(df, featured, fold.train_start, fold.origin)
+    return model.fit(X_train, y_train)
+
+
+def _fit_incremental(model_type, model, df, featured, previous: Fold, fold: Fold, update_rounds: int):
+    """Returns (model, refit kind) for fold, starting from the model fitted for previous."""
+    rolling = fold.train_start > 0
+
+    if model_type == "AUTO_ARIMA":
+        if rolling:
+            # Old observations must leave the window: refit, but keep the searched order
+            return model.refit(df["Close"].iloc[fold.train_start:fold.origin]), "order reuse"
+        return model.update(df["Close"].iloc[previous.origin:fold.origin]), "update"
+
+    if model_type == "XGBOOST" and not rolling:
+        if fold.origin == previous.origin:
+            return model, "reuse"
+        # Extra trees are boosted on the whole expanding window, so the model
+        # stays close to a full refit (what run_training ships)
+        X_train, y_train = _training_rows(df, featured, fold.train_start, fold.origin)
+        return model.update(X_train, y_train, n_rounds=update_rounds), "warm start"
+
+    # Direct targets of the newest rows reach past the origin, so there is
+    # nothing leak-free to warm start on; rolling windows refit too
+    return _fit_full(model_type, df, featured, fold), "full"
+
+
+def _forecast(model_type: str, model, df: pd.DataFrame, featured: Optional[pd.DataFrame], fold: Fold, horizon: int):
+    if model_type == "AUTO_ARIMA":
+        forecast, _ = model.forecast(horizon)
+        return forecast
+
+    if model_type == "XGBOOST":
+        return model.forecast(df["Close"].iloc[:fold.origin], horizon)
+
+    last_known = featured[featured.index < df.index[fold.origin]].drop(columns=["Close"]).iloc[[-1]]
+    return model.forecast(last_known, horizon)
+
+
+# -------------------- BACKTESTER --------------------
+
+class WalkForwardBacktester:
+    def __init__(
+        self,
+        model_type: str = "AUTO_ARIMA",
+        n_folds: int = 5,
+        horizon: int = 30,
+        step: Optional[int] = None,
+        window: Optional[int] = None,
+        incremental: bool = True,
+        update_rounds: int = 50,
+        n_jobs: Optional[int] = None,
+        min_chunk_folds: int = 2,
+    ):
+        """
+        window: rolling training length; None uses an expanding window
+        incremental: refit later folds of a chunk incrementally instead of from scratch
+        update_rounds: extra boosting rounds per XGBoost warm start
+        n_jobs: worker processes; folds are split into at most this many contiguous chunks
+        min_chunk_folds: smallest chunk when incremental, so every chunk has folds
+                         to refit incrementally after its one full fit
+        """
+        if min_chunk_folds < 1:
+            raise ValueError("min_chunk_folds must be at least 1")
+        if model_type not in MODEL_TYPES:
+            raise ValueError(f"Unsupported model type: {model_type}")
+
+        self.model_type = model_type
+        self.splitter = WalkForwardSplitter(n_folds, horizon, step, window)
+        self.incremental = incremental
+        self.update_rounds = update_rounds
+        self.n_jobs = n_jobs or max(1, (os.cpu_count() or 1) - 1)
+        self.min_chunk_folds = min_chunk_folds
+        self.stats: Dict = {}
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def run(self, df: pd.DataFrame) -> Dict:
+        """Backtests df (DatetimeIndex, 'Close') and returns matrices and metrics."""
+        start = time.perf_counter()
+        folds = self.splitter.folds(len(df))
+        chunks = np.array_split(np.arange(len(folds)), self._chunk_count(len(folds)))
+        fold_chunks = [[folds[i] for i in chunk] for chunk in chunks if len(chunk)]
+
+        args = (self.incremental, self.update_rounds)
+        if len(fold_chunks) == 1:
+            chunk_results = [_run_chunk(self.model_type, df, fold_chunks[0], *args)]
+        else:
+            with ProcessPoolExecutor(max_workers=len(fold_chunks), initializer=_init_worker) as pool:
+                futures = [pool.submit(_run_chunk, self.model_type, df, chunk, *args) for chunk in fold_chunks]
+                chunk_results = [future.result() for future in futures]
+
+        results = [result for chunk in chunk_results for result in chunk]
+        report = self._assemble(df, results)
+
+        self.stats = {
+            "folds": len(results),
+            "chunks": len(fold_chunks),
+            "full_fits": sum(result["refit"] == "full" for result in results),
+            "fit_seconds": sum(result["fit_seconds"] for result in results),
+            "seconds": time.perf_counter() - start,
+        }
+        report["stats"] = self.stats
+        return report
+
+    # -------------------- HELPERS --------------------
+
+    def _chunk_count(self, n_folds: int) -> int:
+        # Without incremental refits every fold is a full fit, so one fold per chunk is fine
+        min_size = self.min_chunk_folds if self.incremental else 1
+        chunk_size = max(min_size, math.ceil(n_folds / self.n_jobs))
+        return max(1, math.ceil(n_folds / chunk_size))
+
+    def _assemble(self, df: pd.DataFrame, results: List[Dict]) -> Dict:
+        horizon = self.splitter.horizon
+        steps = pd.RangeIndex(1, horizon + 1, name="horizon")
+        fold_index = pd.RangeIndex(1, len(results) + 1, name="fold")
+
+        actuals = pd.DataFrame(np.vstack([r["actual"] for r in results]), index=fold_index, columns=steps)
+        predictions = pd.DataFrame(np.vstack([r["predicted"] for r in results]), index=fold_index, columns=steps)
+        errors = predictions - actuals
+
+        folds = pd.DataFrame(
+            [
+                {
+                    "train_start": df.index[r["fold"].train_start],
+                    "origin": df.index[r["fold"].origin],
+                    "test_end": df.index[r["fold"].test_end - 1],
+                    "train_size": r["fold"].origin - r["fold"].train_start,
+                    "refit": r["refit"],
+                    "fit_seconds": r["fit_seconds"],
+                }
+                for r in results
+            ],
+            index=fold_index,
+        )
+
+        # Score each horizon step across folds in one vectorized pass
+        by_step = batch_evaluation_metrics(actuals.to_numpy(), predictions.to_numpy(), axis=0)
+        horizon_metrics = pd.DataFrame({name: by_step[name] for name in HORIZON_METRICS}, index=steps)
+
+        return {
+            "model_type": self.model_type,
+            "folds": folds,
+            "actuals": actuals,
+            "predictions": predictions,
+            "errors": errors,
+            "metrics": calculate_evaluation_metrics(actuals.to_numpy().ravel(), predictions.to_numpy().ravel()),
+            "horizon_metrics": horizon_metrics,
+        }
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+def backtest_model(model_type: str, df: pd.DataFrame, n_folds: int = 5, horizon: int = 30, **kwargs) -> Dict:
+    return WalkForwardBacktester(model_type, n_folds, horizon, **kwargs).run(df)
@@ -0,0 +1,84 @@
+"""
+Direct Multi-Horizon XGBoost Model for CLUE Financial Forecasting
+Trains a single multi-output booster on shifted targets (one output per
+horizon bucket), so a whole forecast comes from one predict call on the
+last feature row instead of a step-by-step recursive loop.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Sequence
+from xgboost import XGBRegressor
+
+from preprocessing.feature_engineering import create_direct_targets
+
+
+# Bucket anchors up to the 90-day maximum of the horizon slider;
+# horizons between anchors are interpolated.
+DEFAULT_HORIZONS = (1, 2, 3, 5, 7, 10, 14, 21, 30, 45, 60, 90)
+
+
+class DirectXGBoostModel:
+    def __init__(self, horizons: Sequence[int] = DEFAULT_HORIZONS):
+        if not horizons or min(horizons) < 1:
+            raise ValueError("horizons must be positive integers")
+
+        self.horizons = tuple(sorted(set(int(h) for h in horizons)))
+        # n_jobs=-1: the per-horizon trees of each round are built on all cores
+        self.model = XGBRegressor(
+            n_estimators=500,
+            learning_rate=0.05,
+            max_depth=5,
+            subsample=0.8,
+            colsample_bytree=0.8,
+            objective="reg:squarederror",
+            n_jobs=-1,
+        )
+
+    # -------------------- TRAINING --------------------
+
+    def fit(self, X_train: pd.DataFrame, y_train: pd.Series):
+        """Fits every horizon at once on targets shifted within the training window."""
+        targets = create_direct_targets(y_train.to_frame(), self.horizons, target_column=y_train.name)
+        complete = targets.notna().all(axis=1).to_numpy()
+
+        if not complete.any():
+            raise ValueError(f"Training window too short for a {self.horizons[-1]}-step horizon")
+
+        self.model.fit(X_train[complete], targets[complete].to_numpy())
+        return self
+
+    def get_params(self) -> dict:
+        return {**self.model.get_params(), "horizons": list(self.horizons)}
+
+    # -------------------- PREDICTION --------------------
+
+    def predict(self, X_test: pd.DataFrame) -> pd.Series:
+        """
+        One-step-ahead predictions (shortest horizon), for evaluation.
+        Row t estimates Close at row t+1, so the result is indexed by the
+        row it predicts: the first row of X_test gets no prediction.
+        """
+        predictions = self.model.predict(X_test)[:, 0]
+        return pd.Series(predictions[:-1], index=X_test.index[1:], name="Predicted")
+
+    # -------------------- FORECASTING --------------------
+
+    def forecast(self, last_known_data: pd.DataFrame, periods: int = 30) -> pd.Series:
+        """Forecasts 1..periods steps from the last feature row in a single predict call."""
+        if periods > self.horizons[-1]:
+            raise ValueError(f"Direct model was trained for at most {self.horizons[-1]} steps")
+
+        bucket_values = self.model.predict(last_known_data.iloc[[-1]])[0]
+        steps = np.arange(1, periods + 1)
+        predictions = np.interp(steps, self.horizons, bucket_values)
+
+        return pd.Series(predictions, name="Forecast")
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+def train_direct_xgboost_model(X_train: pd.DataFrame, y_train: pd.Series) -> DirectXGBoostModel:
+    model = DirectXGBoostModel()
+    model.fit(X_train, y_train)
+    return model
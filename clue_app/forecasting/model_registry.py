@@ -0,0 +1,93 @@
+"""
+Model Registry for CLUE Financial Forecasting
+Keeps fitted models in memory keyed by data fingerprint, model type
+and hyperparameters so training and forecasting share a single fit.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from core.fingerprint import fingerprint_params
+
+
+RegistryKey = Tuple[str, str, str]
+
+
+class ModelRegistry:
+    def __init__(self, max_models: int = 16):
+        if max_models <= 0:
+            raise ValueError("max_models must be positive")
+
+        self.max_models = max_models
+        self._models: "OrderedDict[RegistryKey, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    @staticmethod
+    def make_key(data_fingerprint: str, model_type: str, params: Optional[Dict] = None) -> RegistryKey:
+        return (data_fingerprint, model_type, fingerprint_params(params or {}))
+
+    def get(self, data_fingerprint: str, model_type: str, params: Optional[Dict] = None):
+        key = self.make_key(data_fingerprint, model_type, params)
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                self.misses += 1
+                return None
+            self._models.move_to_end(key)
+            self.hits += 1
+            return model
+
+    def put(self, data_fingerprint: str, model_type: str, model, params: Optional[Dict] = None):
+        key = self.make_key(data_fingerprint, model_type, params)
+        with self._lock:
+            self._models[key] = model
+            self._models.move_to_end(key)
+            while len(self._models) > self.max_models:
+                self._models.popitem(last=False)
+
+    def get_or_train(
+        self,
+        data_fingerprint: str,
+        model_type: str,
+        train_fn: Callable[[], Any],
+        params: Optional[Dict] = None,
+    ):
+        """Returns the registered model, fitting it with train_fn on a miss."""
+        model = self.get(data_fingerprint, model_type, params)
+        if model is None:
+            model = train_fn()
+            self.put(data_fingerprint, model_type, model, params)
+        return model
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "models": len(self._models),
+                "max_models": self.max_models,
+            }
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+_default_registry: Optional[ModelRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Returns the session-wide model registry."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = ModelRegistry()
+        return _default_registry
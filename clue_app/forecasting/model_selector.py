@@ -1,11 +1,22 @@
 # forecasting/model_selector.py
-from typing import Dict, Literal
+import time
+from typing import Dict, Literal, Optional
 
-from forecasting.auto_arima import AutoARIMAModel, train_auto_arima
-from forecasting.xgboost_model import XGBoostModel, train_xgboost_model
+from core.fingerprint import fingerprint_data, prefix_fingerprints
+from core.lazy_import import lazy_module
+from core.profiling import span
+from forecasting.model_store import ModelStore, get_model_store, save_model_quietly
 
+# Model modules pull in pmdarima/statsmodels or xgboost; load only the one selected
+auto_arima = lazy_module("forecasting.auto_arima")
+direct_xgboost_model = lazy_module("forecasting.direct_xgboost_model")
+xgboost_model = lazy_module("forecasting.xgboost_model")
 
-ModelType = Literal["AUTO_ARIMA", "XGBOOST"]
+
+ModelType = Literal["AUTO_ARIMA", "XGBOOST", "XGBOOST_DIRECT"]
+
+# How many new observations a stored ARIMA model may be brought up to date with
+MAX_REFRESH_OBSERVATIONS = 30
 
 
 class ModelSelector:
@@ -14,19 +25,83 @@ class ModelSelector:
     @staticmethod
     def get_model_class(model_type: ModelType):
         if model_type == "AUTO_ARIMA":
-            return AutoARIMAModel
+            return auto_arima.AutoARIMAModel
         elif model_type == "XGBOOST":
-            return XGBoostModel
+            return xgboost_model.XGBoostModel
+        elif model_type == "XGBOOST_DIRECT":
+            return direct_xgboost_model.DirectXGBoostModel
         else:
             raise ValueError(f"Unsupported model type: {model_type}")
 
     @staticmethod
-    def train_model(model_type: ModelType, X, y=None):
-        if model_type == "AUTO_ARIMA":
+    def train_model(
+        model_type: ModelType,
+        X,
+        y=None,
+        store: Optional[ModelStore] = None,
+        use_store: bool = True,
+        d: Optional[int] = None,
+    ):
+        """
+        Trains the requested model, or loads a stored artifact fitted on
+        the same data with the same hyperparameters.
+        d: AUTO_ARIMA differencing order decided beforehand (screen_stationarity)
+        """
+        with span("fit", rows=len(X), model=model_type) as stage:
+            model, stage.attrs["source"] = ModelSelector._train_or_load(model_type, X, y, store, use_store, d)
+        return model
+
+    @staticmethod
+    def model_options(model_type: ModelType, d: Optional[int] = None) -> Dict:
+        """Constructor arguments beyond the defaults; they are part of the model's params."""
+        return {"d": d} if model_type == "AUTO_ARIMA" and d is not None else {}
+
+    @staticmethod
+    def _train_or_load(model_type: ModelType, X, y, store: Optional[ModelStore], use_store: bool, d: Optional[int]):
+        """(model, source); source is "store", "refresh" or "fit"."""
+        model_class = ModelSelector.get_model_class(model_type)
+        options = ModelSelector.model_options(model_type, d)
+
+        if use_store:
+            store = store if store is not None else get_model_store()
+            params = model_class(**options).get_params()
+            data_fingerprint = fingerprint_data(X) if y is None else fingerprint_data(X) + fingerprint_data(y)
+
+            model = store.load(data_fingerprint, model_type, params)
+            if model is not None:
+                return model, "store"
+
+        start = time.perf_counter()
+        previous = None
+        if use_store and model_type == "AUTO_ARIMA":
+            previous = ModelSelector._load_previous_model(store, X, model_type, params)
+
+        if previous is not None:
+            # Same series with a few new bars: append them, re-search only on drift
+            model = previous
+            model.refresh(X)
+        elif model_type == "AUTO_ARIMA":
             # X is expected to be a Series
-            return train_auto_arima(X)
-        elif model_type == "XGBOOST":
-            # X: DataFrame, y: Series
-            return train_xgboost_model(X,y)
+            model = auto_arima.train_auto_arima(X, d=d)
+        elif model_type == "XGBOOST_DIRECT":
+            # X: DataFrame, y: Series (shifted per horizon inside fit)
+            model = direct_xgboost_model.train_direct_xgboost_model(X, y)
         else:
-            raise ValueError(f"Unsupported model type: {model_type}")
+            # X: DataFrame, y: Series
+            model = xgboost_model.train_xgboost_model(X,y)
+        training_seconds = time.perf_counter() - start
+
+        if use_store:
+            save_model_quietly(store, model, data_fingerprint, model_type, params, training_seconds)
+
+        return model, "fit" if previous is None else "refresh"
+
+    @staticmethod
+    def _load_previous_model(store: ModelStore, series, model_type: ModelType, params: Dict):
+        """Newest stored model fitted on a prefix of series, if any."""
+        lengths = range(len(series) - 1, max(len(series) - MAX_REFRESH_OBSERVATIONS, 0) - 1, -1)
+        for prefix_fingerprint in prefix_fingerprints(series, lengths).values():
+            model = store.load(prefix_fingerprint, model_type, params)
+            if model is not None and hasattr(model, "refresh"):
+                return model
+        return None
@@ -0,0 +1,220 @@
+"""
+Model Store for CLUE Financial Forecasting
+Persists fitted models on local disk next to a JSON manifest
+(data hash, model type, order/params, library versions, training time)
+so restarts against the same dataset skip retraining.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+import warnings
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from core.fingerprint import fingerprint_params
+
+
+TRACKED_LIBRARIES = ("numpy", "pandas", "scikit-learn", "xgboost", "pmdarima", "statsmodels")
+
+DEFAULT_STORE_DIR = Path.home() / ".clue" / "models"
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+
+def library_versions() -> Dict[str, Optional[str]]:
+    versions = {}
+    for name in TRACKED_LIBRARIES:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+class ModelStore:
+    def __init__(
+        self,
+        root_dir: Optional[str] = None,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.root_dir = Path(root_dir or os.environ.get("CLUE_MODEL_DIR", DEFAULT_STORE_DIR))
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def load(self, data_fingerprint: str, model_type: str, params: Optional[Dict] = None):
+        """Returns the stored model, or None when no compatible artifact exists."""
+        artifact_path, manifest_path = self._paths(data_fingerprint, model_type, params)
+        if not artifact_path.exists() or not manifest_path.exists():
+            return None
+
+        try:
+            manifest = json.loads(manifest_path.read_text())
+        except (OSError, ValueError):
+            self._remove(artifact_path, manifest_path)
+            return None
+
+        if manifest.get("data_fingerprint") != data_fingerprint:
+            return None
+
+        if manifest.get("library_versions") != library_versions():
+            # Pickles are not portable across library upgrades
+            self._remove(artifact_path, manifest_path)
+            return None
+
+        try:
+            with open(artifact_path, "rb") as fh:
+                model = pickle.load(fh)
+        except Exception:
+            self._remove(artifact_path, manifest_path)
+            return None
+
+        # Artifact mtime doubles as last-used time for budget eviction
+        os.utime(artifact_path)
+        return model
+
+    def save(
+        self,
+        model: Any,
+        data_fingerprint: str,
+        model_type: str,
+        params: Optional[Dict] = None,
+        training_seconds: Optional[float] = None,
+    ) -> Path:
+        """Writes the model and its manifest, then enforces the store limits."""
+        artifact_path, manifest_path = self._paths(data_fingerprint, model_type, params)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+
+        manifest = {
+            "data_fingerprint": data_fingerprint,
+            "model_type": model_type,
+            "model_order": getattr(model, "order", None),
+            "params": params or {},
+            "library_versions": library_versions(),
+            "training_seconds": training_seconds,
+            "created_at": time.time(),
+            "artifact": artifact_path.name,
+        }
+
+        with self._lock:
+            self._atomic_write(artifact_path, pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+            self._atomic_write(manifest_path, json.dumps(manifest, indent=2, default=str).encode())
+
+        self.evict()
+        return artifact_path
+
+    def manifests(self) -> List[Dict]:
+        if not self.root_dir.exists():
+            return []
+
+        entries = []
+        for manifest_path in self.root_dir.glob("*.json"):
+            try:
+                entries.append(json.loads(manifest_path.read_text()))
+            except (OSError, ValueError):
+                continue
+        return entries
+
+    def evict(self) -> int:
+        """Removes artifacts older than max_age_days, then least recently used ones over max_bytes."""
+        if not self.root_dir.exists():
+            return 0
+
+        now = time.time()
+        max_age_seconds = self.max_age_days * 24 * 3600
+        removed = 0
+        live = []
+
+        with self._lock:
+            for manifest_path in self.root_dir.glob("*.json"):
+                artifact_path = manifest_path.with_suffix(".pkl")
+                try:
+                    created_at = json.loads(manifest_path.read_text()).get("created_at", 0)
+                    stat = artifact_path.stat()
+                except (OSError, ValueError):
+                    self._remove(artifact_path, manifest_path)
+                    removed += 1
+                    continue
+
+                if now - created_at > max_age_seconds:
+                    self._remove(artifact_path, manifest_path)
+                    removed += 1
+                else:
+                    size = stat.st_size + manifest_path.stat().st_size
+                    live.append((stat.st_mtime, size, artifact_path, manifest_path))
+
+            total = sum(entry[1] for entry in live)
+            for _, size, artifact_path, manifest_path in sorted(live, key=lambda entry: entry[0]):
+                if total <= self.max_bytes:
+                    break
+                self._remove(artifact_path, manifest_path)
+                total -= size
+                removed += 1
+
+        return removed
+
+    def clear(self):
+        if not self.root_dir.exists():
+            return
+        with self._lock:
+            for manifest_path in self.root_dir.glob("*.json"):
+                self._remove(manifest_path.with_suffix(".pkl"), manifest_path)
+
+    # -------------------- STORAGE HELPERS --------------------
+
+    def _paths(self, data_fingerprint: str, model_type: str, params: Optional[Dict]):
+        data_key = hashlib.sha1(data_fingerprint.encode()).hexdigest()
+        stem = f"{model_type.lower()}-{data_key[:16]}-{fingerprint_params(params or {})[:12]}"
+        return self.root_dir / f"{stem}.pkl", self.root_dir / f"{stem}.json"
+
+    def _atomic_write(self, path: Path, payload: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _remove(*paths: Path):
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+_default_store: Optional[ModelStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_model_store() -> ModelStore:
+    """Returns the default on-disk model store (CLUE_MODEL_DIR or ~/.clue/models)."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ModelStore()
+        return _default_store
+
+
+def save_model_quietly(store: ModelStore, *args, **kwargs) -> Optional[Path]:
+    """Saves a model, downgrading disk errors to a warning so training still succeeds."""
+    try:
+        return store.save(*args, **kwargs)
+    except OSError as exc:
+        warnings.warn(f"Could not persist model to {store.root_dir}: {exc}")
+        return None
@@ -0,0 +1,349 @@
+"""
+ARIMA Order Search Engine for CLUE Financial Forecasting
+Exhaustive non-seasonal (p, d, q) search that:
+- decides d once per series (KPSS via pmdarima.ndiffs) and caches it,
+  unless d is passed in: a batch ADF screen (screen_stationarity) wins
+- fans candidate fits out to a process pool, simplest orders first
+- prunes candidates whose partial (recent-window) fit trails the best AIC
+- stops growing p + q once larger orders stop improving
+  (both heuristics; probe_size=0, patience=None gives an exact search)
+- honours an optional wall-clock budget; fits still running when it runs
+  out are stopped with their worker processes
+- keeps the winning candidate's fitted model, so nothing is refitted
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pmdarima.arima import ARIMA, ndiffs
+
+from core.fingerprint import fingerprint_data
+
+
+Order = Tuple[int, int, int]
+
+_DIFF_CACHE: "OrderedDict[tuple, int]" = OrderedDict()
+_DIFF_CACHE_SIZE = 256
+_DIFF_CACHE_LOCK = threading.Lock()
+
+# Series handed to each worker once by the pool initializer
+_WORKER_SERIES = None
+
+
+def cached_ndiffs(series, max_d: int = 2, test: str = "kpss", alpha: float = 0.05) -> int:
+    """Returns the differencing order for series, remembering it per fingerprint."""
+    key = (fingerprint_data(series), max_d, test, alpha)
+
+    with _DIFF_CACHE_LOCK:
+        if key in _DIFF_CACHE:
+            _DIFF_CACHE.move_to_end(key)
+            return _DIFF_CACHE[key]
+
+    d = int(ndiffs(np.asarray(series, dtype=float), alpha=alpha, test=test, max_d=max_d))
+
+    with _DIFF_CACHE_LOCK:
+        _DIFF_CACHE[key] = d
+        while len(_DIFF_CACHE) > _DIFF_CACHE_SIZE:
+            _DIFF_CACHE.popitem(last=False)
+    return d
+
+
+def clear_diff_cache():
+    with _DIFF_CACHE_LOCK:
+        _DIFF_CACHE.clear()
+
+
+def default_search_jobs() -> int:
+    """CLUE_SEARCH_JOBS when set (batch workers use 1), else all cores but one."""
+    configured = os.environ.get("CLUE_SEARCH_JOBS")
+    if configured:
+        return max(1, int(configured))
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+# -------------------- WORKER FUNCTIONS --------------------
+
+def _init_worker(series):
+    global _WORKER_SERIES
+    _WORKER_SERIES = series
+
+
+def _tail(series, n: int):
+    return series.iloc[-n:] if isinstance(series, pd.Series) else series[-n:]
+
+
+def _criterion(model: ARIMA, information_criterion: str) -> float:
+    value = getattr(model, information_criterion)()
+    return float(value) if np.isfinite(value) else np.inf
+
+
+def _fit_candidate(
+    order: Order,
+    trend: Optional[str],
+    information_criterion: str,
+    maxiter: int,
+    probe_size: int,
+    prune_above: float,
+    keep_below: float,
+    series=None,
+) -> Tuple[Order, float, float, bool, Optional[ARIMA]]:
+    """
+    Fits one candidate and returns (order, score, probe_score, pruned, model).
+    When probe_size is set, the candidate is first fitted on the last
+    probe_size observations only; if that partial score already trails
+    prune_above, the full-sample fit is skipped.
+    The fitted model is only returned when its score beats keep_below (the
+    best score so far), so losing candidates are never sent back.
+    """
+    y = _WORKER_SERIES if series is None else series
+    probe_score = np.nan
+
+    try:
+        if probe_size:
+            probe = ARIMA(order=order, trend=trend, maxiter=maxiter, suppress_warnings=True).fit(_tail(y, probe_size))
+            probe_score = _criterion(probe, information_criterion)
+            if probe_score > prune_above:
+                return order, np.inf, probe_score, True, None
+
+        model = ARIMA(order=order, trend=trend, maxiter=maxiter, suppress_warnings=True).fit(y)
+        score = _criterion(model, information_criterion)
+        return order, score, probe_score, False, model if score < keep_below else None
+
+    except Exception:
+        # Same as pmdarima error_action="ignore": a failed candidate just loses
+        return order, np.inf, probe_score, False, None
+
+
+def _terminate_pool(pool: ProcessPoolExecutor):
+    """Stops the pool without waiting for the fits its workers are running."""
+    terminate = getattr(pool, "terminate_workers", None)
+    if terminate is not None:
+        # Python 3.14+
+        terminate()
+        return
+
+    processes = list((pool._processes or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join()
+
+
+# -------------------- SEARCH ENGINE --------------------
+
+class ARIMAOrderSearch:
+    """
+    Candidates are visited in levels of increasing p + q. By default two
+    pruning heuristics keep the exhaustive grid cheap; they usually keep
+    the winner, but can drop the candidate with the lowest full-sample
+    score, so the default search is approximate:
+    - partial fit: on long series each candidate is first scored on a recent
+      window; if it trails the best partial score by prune_margin, it is dropped
+    - level patience: once `patience` consecutive levels fail to improve the
+      best score, larger orders are not tried
+    probe_size=0 and patience=None turn both off: every candidate in the grid
+    is fitted on the full series, the same as pmdarima's exhaustive search.
+    """
+
+    def __init__(
+        self,
+        max_p: int = 6,
+        max_q: int = 6,
+        max_d: int = 2,
+        max_order: int = 5,
+        trend: Optional[str] = "t",
+        information_criterion: str = "aic",
+        maxiter: int = 50,
+        probe_size: int = 500,
+        prune_margin: float = 4.0,
+        patience: Optional[int] = 2,
+        time_budget: Optional[float] = None,
+        n_jobs: Optional[int] = None,
+    ):
+        self.max_p = max_p
+        self.max_q = max_q
+        self.max_d = max_d
+        self.max_order = max_order
+        self.trend = trend
+        self.information_criterion = information_criterion
+        self.maxiter = maxiter
+        self.probe_size = probe_size
+        self.prune_margin = prune_margin
+        self.patience = patience
+        self.time_budget = time_budget
+        self.n_jobs = n_jobs or default_search_jobs()
+
+        self.results: List[Dict] = []
+        self.best_order: Optional[Order] = None
+        self.best_model: Optional[ARIMA] = None
+        self.best_score: float = np.inf
+        self.best_probe_score: float = np.inf
+        self.stats: Dict = {}
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def candidate_levels(self, d: int) -> List[List[Order]]:
+        """Same grid as pmdarima's exhaustive search, grouped by p + q."""
+        levels = []
+        for total in range(min(self.max_order, self.max_p + self.max_q) + 1):
+            level = [
+                (p, d, total - p)
+                for p in range(min(total, self.max_p) + 1)
+                if total - p <= self.max_q
+            ]
+            if level:
+                levels.append(level)
+        return levels
+
+    def search(self, series: pd.Series, d: Optional[int] = None) -> Order:
+        """
+        Runs the order search and returns the best (p, d, q); the winning
+        candidate's fitted model is kept as best_model.
+        d: known differencing order (e.g. from screen_stationarity's ADF screen);
+           None decides it here with KPSS
+        """
+        start = time.perf_counter()
+
+        d_source = "given" if d is not None else "kpss"
+        if d is None:
+            d = cached_ndiffs(np.asarray(series, dtype=float), max_d=self.max_d)
+        levels = self.candidate_levels(d)
+        # Partial fits only pay off when the window is much shorter than the series
+        probe_size = self.probe_size if self.probe_size and len(series) >= 2 * self.probe_size else 0
+
+        self.results = []
+        self.best_order = None
+        self.best_model = None
+        self.best_score = np.inf
+        self.best_probe_score = np.inf
+
+        pool = None
+        if self.n_jobs > 1:
+            pool = ProcessPoolExecutor(max_workers=self.n_jobs, initializer=_init_worker, initargs=(series,))
+
+        budget_hit = False
+        stale_levels = 0
+        try:
+            for level in levels:
+                if self._budget_exhausted(start):
+                    budget_hit = True
+                    break
+
+                previous_best = self.best_score
+                if pool is None:
+                    budget_hit = self._run_level_serial(series, level, probe_size, start)
+                else:
+                    budget_hit = self._run_level_parallel(pool, level, probe_size, start)
+                if budget_hit:
+                    break
+
+                stale_levels = 0 if self.best_score < previous_best else stale_levels + 1
+                if self.patience is not None and stale_levels >= self.patience:
+                    break
+        finally:
+            if pool is not None:
+                if budget_hit:
+                    # Over budget: return now, without leaving fits running in the background
+                    _terminate_pool(pool)
+                else:
+                    pool.shutdown(wait=True)
+
+        if self.best_order is None:
+            raise ValueError("No ARIMA candidate could be fitted")
+
+        n_candidates = sum(len(level) for level in levels)
+        self.stats = {
+            "d": d,
+            "d_source": d_source,
+            "candidates": n_candidates,
+            "fitted": sum(not r["pruned"] for r in self.results),
+            "pruned": sum(r["pruned"] for r in self.results),
+            "skipped": n_candidates - len(self.results),
+            "budget_hit": budget_hit,
+            "seconds": time.perf_counter() - start,
+        }
+        return self.best_order
+
+    def fit_best(self, series: pd.Series, d: Optional[int] = None) -> ARIMA:
+        """Searches and returns the winning candidate's model (already fitted on the full series)."""
+        self.search(series, d)
+        return self.best_model
+
+    def fit_order(self, series: pd.Series, order: Order) -> ARIMA:
+        """Fits a known order with the search's trend and iteration settings."""
+        return ARIMA(order=order, trend=self.trend, maxiter=self.maxiter, suppress_warnings=True).fit(series)
+
+    # -------------------- EXECUTION --------------------
+
+    def _budget_exhausted(self, start: float) -> bool:
+        # Always let at least one candidate finish so a model can be returned
+        return (
+            self.time_budget is not None
+            and self.best_order is not None
+            and time.perf_counter() - start > self.time_budget
+        )
+
+    def _record(self, order: Order, score: float, probe_score: float, pruned: bool, model: Optional[ARIMA]):
+        self.results.append({"order": order, "score": score, "probe_score": probe_score, "pruned": pruned})
+        if pruned:
+            return
+        if score < self.best_score:
+            self.best_order = order
+            self.best_model = model
+            self.best_score = score
+        if np.isfinite(probe_score) and probe_score < self.best_probe_score:
+            self.best_probe_score = probe_score
+
+    def _fit_args(self, order: Order, probe_size: int) -> tuple:
+        return (
+            order,
+            self.trend,
+            self.information_criterion,
+            self.maxiter,
+            probe_size,
+            self.best_probe_score + self.prune_margin,
+            self.best_score,
+        )
+
+    def _run_level_serial(self, series, level: List[Order], probe_size: int, start: float) -> bool:
+        for order in level:
+            if self._budget_exhausted(start):
+                return True
+            self._record(*_fit_candidate(*self._fit_args(order, probe_size), series=series))
+        return False
+
+    def _run_level_parallel(self, pool: ProcessPoolExecutor, level: List[Order], probe_size: int, start: float) -> bool:
+        pending_orders = list(level)
+        in_flight = set()
+
+        while pending_orders or in_flight:
+            # Keep the pool just full, so each submission sees the latest best score
+            while pending_orders and len(in_flight) < self.n_jobs:
+                order = pending_orders.pop(0)
+                in_flight.add(pool.submit(_fit_candidate, *self._fit_args(order, probe_size)))
+
+            timeout = None
+            if self.time_budget is not None and self.best_order is not None:
+                timeout = max(0.0, self.time_budget - (time.perf_counter() - start))
+            done, in_flight = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                self._record(*future.result())
+
+            if self._budget_exhausted(start):
+                return True
+
+        return False
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+def search_arima_order(series: pd.Series, time_budget: Optional[float] = None, **kwargs) -> Order:
+    return ARIMAOrderSearch(time_budget=time_budget, **kwargs).search(series)
@@ -0,0 +1,141 @@
+"""
+Recursive Forecasting Engine for CLUE Financial Forecasting
+Multi-step forecasting for feature-based models (XGBoost) that keeps every
+FeatureEngineer feature current between steps:
+- lag_k from a NumPy ring buffer of recent values
+- rolling_mean_w / rolling_std_w from running sums, O(1) per step
+- day / month / year / day_of_week / quarter from the future calendar
+Each step predicts from one preallocated feature row.
+
+The rolling features copy FeatureEngineer's definition, whose window ends
+at (and includes) the row's own Close, i.e. the training target. So at
+each step the window includes the model's own earlier predictions, while
+training only ever saw true values there; multi-step forecasts can drift
+for that reason. Changing it means shifting the windows in FeatureEngineer
+and here together.
+"""
+
+import re
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+TIME_FEATURES = ("day", "month", "year", "day_of_week", "quarter")
+
+_LAG_PATTERN = re.compile(r"^lag_(\d+)$")
+_ROLLING_PATTERN = re.compile(r"^rolling_(mean|std)_(\d+)$")
+
+
+def future_dates(index: pd.DatetimeIndex, periods: int) -> pd.DatetimeIndex:
+    """Business days when the history has no weekend dates, calendar days otherwise."""
+    weekends = (index.dayofweek >= 5).any()
+    freq = "D" if weekends else "B"
+    return pd.date_range(start=index[-1], periods=periods + 1, freq=freq)[1:]
+
+
+class RecursiveForecaster:
+    def __init__(self, predict_fn: Callable[[np.ndarray], np.ndarray], feature_names: Sequence[str]):
+        """
+        predict_fn: maps a (1, n_features) float32 array to a length-1 prediction
+        feature_names: model input columns, in training order
+        """
+        self.predict_fn = predict_fn
+        self.feature_names = list(feature_names)
+
+        self.lag_columns: Dict[int, int] = {}
+        self.mean_columns: Dict[int, int] = {}
+        self.std_columns: Dict[int, int] = {}
+        self.time_columns: Dict[str, int] = {}
+
+        for col_idx, name in enumerate(self.feature_names):
+            lag_match = _LAG_PATTERN.match(name)
+            rolling_match = _ROLLING_PATTERN.match(name)
+
+            if lag_match:
+                self.lag_columns[int(lag_match.group(1))] = col_idx
+            elif rolling_match:
+                kind, window = rolling_match.group(1), int(rolling_match.group(2))
+                target = self.mean_columns if kind == "mean" else self.std_columns
+                target[window] = col_idx
+            elif name in TIME_FEATURES:
+                self.time_columns[name] = col_idx
+            else:
+                raise ValueError(f"Unsupported feature for recursive forecasting: {name}")
+
+        self.windows: List[int] = sorted(set(self.mean_columns) | set(self.std_columns))
+        self.buffer_size = max([1, *self.lag_columns, *self.windows])
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def forecast(self, history: pd.Series, periods: int = 30) -> pd.Series:
+        """Forecasts `periods` steps after the end of history."""
+        if periods <= 0:
+            return pd.Series([], dtype=float, name="Forecast")
+
+        values = np.asarray(history, dtype=float)
+        if len(values) < self.buffer_size:
+            raise ValueError(f"At least {self.buffer_size} observations are required")
+
+        size = self.buffer_size
+        ring = values[-size:].copy()
+        pos = 0  # index of the oldest value in ring
+
+        # Running sums over the newest w values of the ring, per window
+        sums = {w: values[-w:].sum() for w in self.windows}
+        sumsq = {w: np.square(values[-w:]).sum() for w in self.windows}
+
+        row = np.empty((1, len(self.feature_names)), dtype=np.float32)
+        time_values = self._time_values(history, periods)
+        predictions = np.empty(periods, dtype=float)
+
+        for step in range(periods):
+            newest = (pos - 1) % size
+
+            for lag, col_idx in self.lag_columns.items():
+                row[0, col_idx] = ring[(newest - lag + 1) % size]
+
+            for window in self.windows:
+                mean = sums[window] / window
+                if window in self.mean_columns:
+                    row[0, self.mean_columns[window]] = mean
+                if window in self.std_columns:
+                    # Sample std (ddof=1), as pandas rolling().std()
+                    var = (sumsq[window] - window * mean * mean) / (window - 1) if window > 1 else np.nan
+                    row[0, self.std_columns[window]] = np.sqrt(max(var, 0.0))
+
+            for name, col_idx in self.time_columns.items():
+                row[0, col_idx] = time_values[name][step]
+
+            prediction = float(self.predict_fn(row)[0])
+            predictions[step] = prediction
+
+            # Slide every window by one: drop the value w steps back, add the prediction
+            for window in self.windows:
+                leaving = ring[(pos + size - window) % size]
+                sums[window] += prediction - leaving
+                sumsq[window] += prediction * prediction - leaving * leaving
+
+            ring[pos] = prediction
+            pos = (pos + 1) % size
+
+        return pd.Series(predictions, name="Forecast")
+
+    # -------------------- HELPERS --------------------
+
+    def _time_values(self, history: pd.Series, periods: int) -> Dict[str, np.ndarray]:
+        if not self.time_columns:
+            return {}
+
+        if not isinstance(history.index, pd.DatetimeIndex):
+            raise ValueError("History index must be DatetimeIndex for time features")
+
+        dates = future_dates(history.index, periods)
+        return {
+            "day": dates.day.to_numpy(),
+            "month": dates.month.to_numpy(),
+            "year": dates.year.to_numpy(),
+            "day_of_week": dates.dayofweek.to_numpy(),
+            "quarter": dates.quarter.to_numpy(),
+        }
@@ -8,6 +8,8 @@ import pandas as pd
 from typing import Tuple
 from xgboost import XGBRegressor
 
+from forecasting.recursive_forecaster import RecursiveForecaster
+
 
 class XGBoostModel:
     def __init__(self):
@@ -26,6 +28,20 @@ class XGBoostModel:
         self.model.fit(X_train, y_train)
         return self
 
+    def update(self, X_train: pd.DataFrame, y_train: pd.Series, n_rounds: int = 50):
+        """
+        Warm start: boosts n_rounds more trees on top of the fitted booster.
+        Pass the whole (expanded) training window, not just the new rows, or
+        the added trees chase the few newest residuals and the model drifts.
+        """
+        booster = self.model.get_booster()
+        self.model = XGBRegressor(**{**self.model.get_params(), "n_estimators": n_rounds})
+        self.model.fit(X_train, y_train, xgb_model=booster)
+        return self
+
+    def get_params(self) -> dict:
+        return self.model.get_params()
+
     # -------------------- PREDICTION --------------------
 
     def predict(self, X_test: pd.DataFrame) -> pd.Series:
@@ -34,9 +50,19 @@ class XGBoostModel:
 
     # -------------------- FORECASTING --------------------
 
+    def forecast(self, history: pd.Series, periods: int = 30) -> pd.Series:
+        """
+        Recursive forecast from the raw target history. Lags, rolling
+        statistics and calendar features are all updated at every step.
+        """
+        booster = self.model.get_booster()
+        forecaster = RecursiveForecaster(booster.inplace_predict, self.model.feature_names_in_)
+        return forecaster.forecast(history, periods)
+
     def recursive_forecast(self, last_known_data: pd.DataFrame, future_steps: int = 30) -> pd.Series:
         """
         Recursive forecasting for future time steps using last available row.
+        Only lag features are shifted; prefer forecast(history, periods).
         """
         predictions = []
         current_input = last_known_data.copy()
@@ -0,0 +1,30 @@
+from typing import Dict, Optional
+
+from core.dataset_cache import load_cached_financial_data
+from forecasting.backtester import WalkForwardBacktester
+
+
+def run_backtest(
+    model_type: str,
+    source_config: Dict,
+    n_folds: int = 5,
+    horizon: int = 30,
+    step: Optional[int] = None,
+    window: Optional[int] = None,
+    n_jobs: Optional[int] = None,
+) -> Dict:
+    """
+    Walk-forward (rolling-origin) out-of-sample evaluation; returns the
+    fold x horizon error matrix with pooled and per-horizon metrics.
+    """
+    df = load_cached_financial_data(**source_config)
+
+    backtester = WalkForwardBacktester(
+        model_type,
+        n_folds=n_folds,
+        horizon=horizon,
+        step=step,
+        window=window,
+        n_jobs=n_jobs,
+    )
+    return backtester.run(df)
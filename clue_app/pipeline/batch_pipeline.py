@@ -0,0 +1,347 @@
+"""
+Batch Forecasting Pipeline for CLUE Financial Forecasting
+Runs load -> features -> fit -> forecast -> metrics for many source
+configs (tickers or CSV files) across a process pool:
+- AUTO_ARIMA batches screen the whole universe for stationarity first and
+  hand each series its differencing order to the ARIMA search
+- every series is isolated; a failure becomes a "failed" row, not an abort
+- results land in one consolidated table (one row per series)
+- a worker that dies (e.g. out of memory) fails only the series it was
+  running; the pool is rebuilt and the unfinished series resubmitted
+- progress callback, throughput (series/min) and per-stage timings, with
+  features / fit / metrics taken from the core.profiling spans of the run
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+STAGES = ("load", "features", "fit", "metrics", "forecast")
+
+# Profiling spans inside run_training -> batch stage they are timed under
+TRAINING_SPANS = {
+    "create_features": "features",
+    "train_test_split": "features",
+    "fit": "fit",
+    "predict": "metrics",
+    "metrics": "metrics",
+}
+
+
+# -------------------- WORKER FUNCTIONS --------------------
+
+# Pool workers report each position they start on this queue
+_started = None
+
+
+def _init_worker(started=None):
+    global _started
+    _started = started
+    # Parallelism is across series; keep each ARIMA order search in-process
+    os.environ["CLUE_SEARCH_JOBS"] = "1"
+
+
+def _run_series(position: int, source_config: Dict, model_type: str, forecast_periods: int, d: Optional[int] = None) -> Dict:
+    """
+    Forecasts one series; never raises, so one bad symbol cannot stop the batch.
+    d: differencing order from the batch stationarity screen (AUTO_ARIMA)
+    """
+    # Imported here so pool workers pay for the model stack only once, on first use
+    from core.dataset_cache import load_cached_financial_data
+    from core.profiling import get_profiler
+    from pipeline.forecasting_pipeline import run_forecast
+    from pipeline.training_pipeline import run_training
+
+    if _started is not None:
+        _started.put(position)
+
+    row = {
+        "position": position,
+        "series": series_label(source_config),
+        "model_type": model_type,
+        "status": "ok",
+        "error": None,
+        "differencing_order": d,
+    }
+    timings = {}
+
+    try:
+        start = time.perf_counter()
+        df = load_cached_financial_data(**source_config)
+        timings["load"] = time.perf_counter() - start
+        row.update({
+            "observations": len(df),
+            "first_date": df.index[0],
+            "last_date": df.index[-1],
+            "last_close": float(df["Close"].iloc[-1]),
+        })
+
+        # Features, fit and hold-out metrics; the fitted model stays in the registry
+        profiler = get_profiler()
+        mark = profiler.mark()
+        training = run_training(model_type, source_config, forecast_periods, d=d)
+        timings.update(_training_seconds(profiler.records(since=mark)))
+        row.update(training.get("metrics", {}))
+        if "model_order" in training:
+            row["model_order"] = str(tuple(training["model_order"]))
+
+        start = time.perf_counter()
+        forecast = run_forecast(model_type, source_config, forecast_periods, d=d)["forecast"]
+        timings["forecast"] = time.perf_counter() - start
+        values = np.asarray(forecast, dtype=float)
+        row.update({f"forecast_{step}": value for step, value in enumerate(values, start=1)})
+
+    except Exception as exc:
+        row["status"] = "failed"
+        row["error"] = f"{type(exc).__name__}: {exc}"
+
+    for stage in STAGES:
+        row[f"{stage}_seconds"] = timings.get(stage, np.nan)
+    return row
+
+
+def _load_close(source_config: Dict) -> pd.Series:
+    from core.dataset_cache import load_cached_financial_data
+    return load_cached_financial_data(**source_config)["Close"]
+
+
+def _training_seconds(records: List[Dict]) -> Dict[str, float]:
+    """Wall time per batch stage from the spans this thread recorded during run_training."""
+    thread = threading.current_thread().name
+    seconds: Dict[str, float] = {}
+    for record in records:
+        stage = TRAINING_SPANS.get(record["name"])
+        # No wall time when the profiler is disabled
+        if stage is None or record["thread"] != thread or record["wall_seconds"] is None:
+            continue
+        seconds[stage] = seconds.get(stage, 0.0) + record["wall_seconds"]
+    return seconds
+
+
+def series_label(source_config: Dict) -> str:
+    if source_config.get("source") == "yahoo":
+        return str(source_config.get("ticker", "")).upper()
+    return os.path.basename(str(source_config.get("file_path", "")))
+
+
+# -------------------- BATCH RUNNER --------------------
+
+class BatchForecaster:
+    def __init__(
+        self,
+        model_type: str = "AUTO_ARIMA",
+        forecast_periods: int = 30,
+        n_jobs: Optional[int] = None,
+        progress: Optional[Callable[[int, int, Dict], None]] = None,
+        screen: bool = True,
+    ):
+        """
+        progress: called as progress(done, total, row) after every series
+        n_jobs: worker processes; 1 runs in-process (useful for debugging)
+        screen: for AUTO_ARIMA, decide every series' d with screen_stationarity
+                before any fit (otherwise each search decides its own d)
+        """
+        self.model_type = model_type
+        self.forecast_periods = forecast_periods
+        self.screen = screen
+        self.n_jobs = n_jobs or max(1, (os.cpu_count() or 1) - 1)
+        self.progress = progress
+        self.stats: Dict = {}
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def run(self, source_configs: Sequence[Dict], output_path: Optional[str] = None) -> pd.DataFrame:
+        """Returns (and optionally writes) one consolidated row per source config."""
+        configs = list(source_configs)
+        start = time.perf_counter()
+        rows: List[Dict] = []
+
+        differencing = [None] * len(configs)
+        screen_seconds = 0.0
+        if self.screen and self.model_type == "AUTO_ARIMA":
+            differencing = self._screen(configs)
+            screen_seconds = time.perf_counter() - start
+
+        restarts = 0
+        if self.n_jobs == 1 or len(configs) <= 1:
+            for position, config in enumerate(configs):
+                rows.append(_run_series(position, config, self.model_type, self.forecast_periods, differencing[position]))
+                self._report(len(rows), len(configs), rows[-1])
+        else:
+            pending = list(range(len(configs)))
+            suspects: List[int] = []
+            while pending or suspects:
+                if suspects:
+                    # Several series were in flight when a worker died: rerun them one at a time
+                    position = suspects.pop(0)
+                    running, queued = self._run_pool(configs, differencing, [position], 1, rows)
+                    crashed = running + queued
+                else:
+                    running, queued = self._run_pool(
+                        configs, differencing, pending, min(self.n_jobs, len(pending)), rows
+                    )
+                    # Without start markers, every unfinished series is a suspect
+                    suspects = running or queued
+                    pending = queued if running else []
+                    crashed = suspects if len(suspects) == 1 else []
+                    if crashed:
+                        suspects = []
+
+                if running or queued:
+                    restarts += 1
+                for position in crashed:
+                    rows.append(self._failed_row(
+                        position, configs[position],
+                        "BrokenProcessPool: worker process died while forecasting this series",
+                    ))
+                    self._report(len(rows), len(configs), rows[-1])
+
+        table = self._consolidate(rows)
+        seconds = time.perf_counter() - start
+        self.stats = self._summarise(table, seconds)
+        self.stats["screen_seconds"] = screen_seconds
+        self.stats["pool_restarts"] = restarts
+
+        if output_path:
+            write_table(table, output_path)
+        return table
+
+    # -------------------- HELPERS --------------------
+
+    def _screen(self, configs: List[Dict]) -> List[Optional[int]]:
+        """ADF differencing order per config; None where loading or the test fails."""
+        from preprocessing.stationarity import screen_stationarity
+
+        if not configs:
+            return []
+        # Series are loaded inside the screening workers, in parallel; a failed
+        # load only leaves d unset, the series' own run reports the error
+        screen = screen_stationarity(dict(enumerate(configs)), n_jobs=self.n_jobs, loader=_load_close)
+        orders = screen["differencing_order"] if "differencing_order" in screen else pd.Series(dtype=float)
+        return [
+            int(orders[position]) if position in orders.index and pd.notna(orders[position]) else None
+            for position in range(len(configs))
+        ]
+
+    def _run_pool(
+        self,
+        configs: List[Dict],
+        differencing: List[Optional[int]],
+        positions: List[int],
+        workers: int,
+        rows: List[Dict],
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Runs positions in a fresh pool, appending their rows. If a worker dies,
+        returns the unfinished positions split into (running, queued) at the time.
+        """
+        started = multiprocessing.SimpleQueue()
+        finished = set()
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(started,)) as pool:
+            futures = {
+                pool.submit(
+                    _run_series, position, configs[position], self.model_type,
+                    self.forecast_periods, differencing[position],
+                ): position
+                for position in positions
+            }
+            for future in as_completed(futures):
+                position = futures[future]
+                try:
+                    row = future.result()
+                except BrokenProcessPool:
+                    break
+                except Exception as exc:
+                    # e.g. a row that could not be sent back
+                    row = self._failed_row(position, configs[position], f"{type(exc).__name__}: {exc}")
+                finished.add(position)
+                rows.append(row)
+                self._report(len(rows), len(configs), row)
+
+        began = set()
+        while not started.empty():
+            began.add(started.get())
+        started.close()
+
+        unfinished = [position for position in positions if position not in finished]
+        running = [position for position in unfinished if position in began]
+        queued = [position for position in unfinished if position not in began]
+        return running, queued
+
+    def _failed_row(self, position: int, source_config: Dict, error: str) -> Dict:
+        return {
+            "position": position,
+            "series": series_label(source_config),
+            "model_type": self.model_type,
+            "status": "failed",
+            "error": error,
+        }
+
+    def _report(self, done: int, total: int, row: Dict):
+        if self.progress is not None:
+            self.progress(done, total, row)
+
+    def _consolidate(self, rows: List[Dict]) -> pd.DataFrame:
+        table = pd.DataFrame(rows)
+        if table.empty:
+            return table
+
+        table = table.sort_values("position").drop(columns="position").reset_index(drop=True)
+
+        # Fixed leading columns, then metrics, then timings, then forecast steps
+        leading = [c for c in ("series", "model_type", "status", "error", "observations",
+                               "first_date", "last_date", "last_close", "differencing_order", "model_order") if c in table]
+        forecast_cols = [c for c in table if c.startswith("forecast_") and c[len("forecast_"):].isdigit()]
+        timing_cols = [f"{stage}_seconds" for stage in STAGES if f"{stage}_seconds" in table]
+        metric_cols = [c for c in table if c not in leading + forecast_cols + timing_cols]
+        return table[leading + metric_cols + timing_cols + forecast_cols]
+
+    def _summarise(self, table: pd.DataFrame, seconds: float) -> Dict:
+        total = len(table)
+        failed = int((table["status"] == "failed").sum()) if total else 0
+        stage_seconds = {
+            stage: float(table[f"{stage}_seconds"].mean())
+            for stage in STAGES
+            if f"{stage}_seconds" in table and table[f"{stage}_seconds"].notna().any()
+        }
+        return {
+            "series": total,
+            "succeeded": total - failed,
+            "failed": failed,
+            "seconds": seconds,
+            "series_per_min": total / seconds * 60 if seconds > 0 else float("inf"),
+            "mean_stage_seconds": stage_seconds,
+            "workers": self.n_jobs,
+        }
+
+
+def write_table(table: pd.DataFrame, output_path: str):
+    """Writes CSV, or Parquet when the path ends in .parquet."""
+    if str(output_path).lower().endswith(".parquet"):
+        table.to_parquet(output_path, index=False)
+    else:
+        table.to_csv(output_path, index=False)
+
+
+# -------------------- GUI FRIENDLY FUNCTION --------------------
+
+def run_batch_forecast(
+    source_configs: Sequence[Dict],
+    model_type: str = "AUTO_ARIMA",
+    forecast_periods: int = 30,
+    output_path: Optional[str] = None,
+    n_jobs: Optional[int] = None,
+    progress: Optional[Callable[[int, int, Dict], None]] = None,
+) -> Dict:
+    batch = BatchForecaster(model_type, forecast_periods, n_jobs=n_jobs, progress=progress)
+    table = batch.run(source_configs, output_path)
+    return {"results": table, "stats": batch.stats}
@@ -1,18 +1,24 @@
-from typing import Dict
+from typing import Dict, Optional
 
-from core.data_loader import load_financial_data
-from forecasting.auto_arima import train_auto_arima
-from forecasting.xgboost_model import train_xgboost_model, predict_xgboost
+from core.dataset_cache import load_cached_financial_data
+from core.profiling import profiled, span
+from pipeline.training_pipeline import get_trained_model
 from preprocessing.feature_engineering import create_features
 
 
-def run_forecast(model_type: str, source_config: Dict, forecast_periods: int = 30):
-    df = load_financial_data(**source_config)
-    close_series = df["Close"]
+@profiled("run_forecast")
+def run_forecast(model_type: str, source_config: Dict, forecast_periods: int = 30, d: Optional[int] = None):
+    """
+    Forecasts with the model fitted by run_training when one is registered
+    for the same data; only forecast(periods) runs when the horizon changes.
+    d: AUTO_ARIMA differencing order, as passed to run_training
+    """
+    df = load_cached_financial_data(**source_config)
 
     if model_type == "AUTO_ARIMA":
-        model = train_auto_arima(close_series)
-        forecast, conf_int = model.forecast(forecast_periods)
+        model = get_trained_model(model_type, df, d)
+        with span("forecast", rows=forecast_periods, model=model_type):
+            forecast, conf_int = model.forecast(forecast_periods)
 
         return {
             "model_type": model_type,
@@ -21,9 +27,21 @@ def run_forecast(model_type: str, source_config: Dict, forecast_periods: int = 3
         }
 
     elif model_type == "XGBOOST":
-        df_features = create_features(df)
-        model = train_xgboost_model(df_features)
-        forecast = predict_xgboost(model, df_features, forecast_periods)
+        model = get_trained_model(model_type, df)
+        with span("forecast", rows=forecast_periods, model=model_type):
+            forecast = model.forecast(df["Close"], forecast_periods)
+
+        return {
+            "model_type": model_type,
+            "forecast": forecast,
+            "confidence_intervals": None,
+        }
+
+    elif model_type == "XGBOOST_DIRECT":
+        model = get_trained_model(model_type, df)
+        last_known = create_features(df).drop(columns=["Close"]).iloc[[-1]]
+        with span("forecast", rows=forecast_periods, model=model_type):
+            forecast = model.forecast(last_known, forecast_periods)
 
         return {
             "model_type": model_type,
@@ -1,20 +1,72 @@
-from typing import Dict
+from typing import Callable, Dict, Optional
 
-from core.data_loader import load_financial_data
+import pandas as pd
+
+from core.dataset_cache import load_cached_financial_data
+from core.fingerprint import fingerprint_data
+from core.profiling import profiled, span
 from preprocessing.feature_engineering import create_features
 from preprocessing.split import time_series_train_test_split
 from models.evaluation import evaluate_model
 
-from forecasting.auto_arima import train_auto_arima
-from forecasting.xgboost_model import train_xgboost_model, predict_xgboost
+from forecasting.model_registry import get_model_registry
+from forecasting.model_selector import ModelSelector, xgboost_model
+
+
+def get_trained_model(model_type: str, df: pd.DataFrame, d: Optional[int] = None):
+    """
+    Returns a fitted model for df, reusing the registry entry when the same
+    data, model type and hyperparameters have already been trained.
+    Registry misses fall through to ModelSelector, which checks the disk store.
+    d: AUTO_ARIMA differencing order decided beforehand (e.g. a batch stationarity screen)
+    """
+    registry = get_model_registry()
+    data_fingerprint = fingerprint_data(df)
+
+    if model_type == "AUTO_ARIMA":
+        return registry.get_or_train(
+            data_fingerprint,
+            model_type,
+            lambda: ModelSelector.train_model(model_type, df["Close"], d=d),
+            params=ModelSelector.get_model_class(model_type)(**ModelSelector.model_options(model_type, d)).get_params(),
+        )
+
+    elif model_type in ("XGBOOST", "XGBOOST_DIRECT"):
+        model_class = ModelSelector.get_model_class(model_type)
+
+        def _train():
+            featured_df = create_features(df)
+            X_train, _, y_train, _ = time_series_train_test_split(featured_df)
+            return ModelSelector.train_model(model_type, X_train, y_train)
+
+        return registry.get_or_train(
+            data_fingerprint,
+            model_type,
+            _train,
+            params=model_class().get_params(),
+        )
+
+    else:
+        raise ValueError(f"Unsupported model type: {model_type}")
 
 
-def run_training(model_type: str, source_config: Dict, forecast_periods: int = 30) -> Dict:
+@profiled("run_training")
+def run_training(
+    model_type: str,
+    source_config: Dict,
+    forecast_periods: int = 30,
+    d: Optional[int] = None,
+    progress: Optional[Callable[[int, str], None]] = None,
+) -> Dict:
     """
     Trains selected model and returns training results.
+    progress: called as progress(percent, message) between stages; raising
+              from it (e.g. JobContext.report on cancel) stops the run there
     """
+    progress = progress or _no_progress
 
-    df = load_financial_data(**source_config)
+    progress(5, "Loading data...")
+    df = load_cached_financial_data(**source_config)
     close_series = df["Close"]
 
     result = {"model_type": model_type}
@@ -22,28 +74,42 @@ def run_training(model_type: str, source_config: Dict, forecast_periods: int = 3
     # ================= AUTO ARIMA =================
     if model_type == "AUTO_ARIMA":
 
-        model = train_auto_arima(close_series)
+        progress(15, "Fitting model...")
+        model = get_trained_model(model_type, df, d)
 
-        in_sample_pred = model.predict_in_sample()
+        progress(80, "Scoring in-sample predictions...")
+        with span("predict", model=model_type) as stage:
+            in_sample_pred = model.predict_in_sample()
+            stage.rows = len(in_sample_pred)
         y_true = close_series[-len(in_sample_pred):]
 
-        metrics = evaluate_model(y_true, in_sample_pred)
+        with span("metrics", rows=len(y_true)):
+            metrics = evaluate_model(y_true, in_sample_pred)
 
         result.update({
             "model_order": model.order,
             "metrics": metrics
         })
 
-    # ================= XGBOOST =================
-    elif model_type == "XGBOOST":
+    # ================= XGBOOST (RECURSIVE / DIRECT) =================
+    elif model_type in ("XGBOOST", "XGBOOST_DIRECT"):
 
+        progress(15, "Generating features...")
         featured_df = create_features(df)
         X_train, X_test, y_train, y_test = time_series_train_test_split(featured_df)
 
-        model = train_xgboost_model(X_train, y_train)
-        predictions = predict_xgboost(model, X_test)
+        progress(30, "Fitting model...")
+        model = get_trained_model(model_type, df)
+
+        progress(80, "Scoring hold-out predictions...")
+        with span("predict", rows=len(X_test), model=model_type):
+            predictions = xgboost_model.predict_xgboost(model, X_test)
 
-        metrics = evaluate_model(y_test, predictions)
+        # Score each prediction against the observation it targets (DIRECT drops one row)
+        y_true = y_test.loc[predictions.index]
+
+        with span("metrics", rows=len(y_true)):
+            metrics = evaluate_model(y_true, predictions)
 
         result.update({
             "model_params": model.get_params(),
@@ -54,3 +120,7 @@ def run_training(model_type: str, source_config: Dict, forecast_periods: int = 3
         raise ValueError(f"Unsupported model type: {model_type}")
 
     return result
+
+
+def _no_progress(percent: int, message: str):
+    pass
@@ -1,9 +1,11 @@
 # preprocessing/eda.py
-from typing import Dict, Any
-import matplotlib.pyplot as plt
+from typing import Dict, Any, Optional
 import pandas as pd
+from matplotlib.figure import Figure
 import numpy as np
 
+from visualization.decimation import POINT_BUDGET, plot_series
+
 def basic_stats(df: pd.DataFrame, target_column: str = "Close") -> Dict[str, Any]:
     series = df[target_column]
 
@@ -50,20 +52,20 @@ def eda_summary(df: pd.DataFrame, target_column: str = "Close") -> Dict[str, Any
         "missing_values": missing_values_summary(df),
         "returns_stats": returns_stats(df, target_column),
     }
-import matplotlib.pyplot as plt
 
-def generate_eda_charts(df):
-    plt.close("all")
 
-    fig, axes = plt.subplots(
-        4, 1,
-        figsize=(14, 18),
-        constrained_layout=True
-    )
+def generate_eda_charts(df, max_points: Optional[int] = POINT_BUDGET):
+    """
+    max_points: points per line (decimated, re-decimated on zoom); None draws all.
+    The figure is not registered with pyplot: it lives as long as its references
+    (see visualization.figure_cache), so no other page's figure is ever closed.
+    """
+    fig = Figure(figsize=(14, 18), constrained_layout=True)
+    axes = fig.subplots(4, 1)
 
     # Price + Rolling Mean
-    df["Close"].plot(ax=axes[0], label="Close", color="cyan")
-    df["Close"].rolling(20).mean().plot(ax=axes[0], label="Rolling Mean (20)", color="magenta")
+    plot_series(axes[0], df["Close"], max_points, label="Close", color="cyan")
+    plot_series(axes[0], df["Close"].rolling(20).mean(), max_points, label="Rolling Mean (20)", color="magenta")
     axes[0].set_title("Price with Rolling Mean")
     axes[0].legend()
     axes[0].grid(True)
@@ -76,13 +78,13 @@ def generate_eda_charts(df):
 
     # Rolling Volatility
     volatility = returns.rolling(20).std()
-    axes[2].plot(volatility, color="orange")
+    plot_series(axes[2], volatility, max_points, color="orange")
     axes[2].set_title("Rolling Volatility (20)")
     axes[2].grid(True)
 
     # Cumulative Returns
     cumulative = (1 + returns).cumprod()
-    axes[3].plot(cumulative, color="lime")
+    plot_series(axes[3], cumulative, max_points, color="lime")
     axes[3].set_title("Cumulative Returns")
     axes[3].grid(True)
 
@@ -91,11 +93,12 @@ def generate_eda_charts(df):
 
     fig.tight_layout(pad=4)
     return fig
-def generate_preview_charts(df):
-    fig, ax = plt.subplots(1, 1, figsize=(10, 4))
+def generate_preview_charts(df, max_points: Optional[int] = POINT_BUDGET):
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots(1, 1)
 
-    ax.plot(df["Close"], label="Close Price")
-    ax.plot(df["Close"].rolling(20).mean(), label="Rolling Mean (20)")
+    plot_series(ax, df["Close"], max_points, label="Close Price")
+    plot_series(ax, df["Close"].rolling(20).mean(), max_points, label="Rolling Mean (20)")
     ax.set_title("Raw Price Preview (Before Cleaning)")
     ax.legend()
     ax.grid(True)
@@ -2,14 +2,38 @@
 Feature Engineering Module for CLUE Financial Forecasting
 Handles generation of features for univariate financial time series.
 Designed for AutoML pipeline and GUI integration.
+
+Two backends produce the same columns:
+- "numpy" (default): lag matrix from one sliding_window_view, rolling
+  mean/std from cumulative sums, written into one preallocated matrix
+- "pandas": the original column-by-column implementation
+
+rolling_mean_w / rolling_std_w cover the w observations up to and including
+the row's own Close (the target), not the w before it. Recursive
+forecasting (forecasting.recursive_forecaster) follows the same definition,
+so it fills those windows with its own predictions.
 """
 
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import List, Tuple
+
+from core.profiling import profiled
+
+
+TIME_FEATURE_NAMES = ["day", "month", "year", "day_of_week", "quarter"]
 
 
 class FeatureEngineer:
-    def __init__(self, target_column: str = "Close"):
+    def __init__(self, target_column: str = "Close", backend: str = "numpy", dtype=np.float64):
+        if backend not in ("numpy", "pandas"):
+            raise ValueError("backend must be 'numpy' or 'pandas'")
         self.target_column = target_column
+        self.backend = backend
+        self.dtype = dtype
+        self.feature_names_: List[str] = []
+        self._incremental = None
 
     # -------------------- PUBLIC METHODS --------------------
 
@@ -21,6 +45,9 @@ class FeatureEngineer:
         include_time_features: bool = True,
     ) -> pd.DataFrame:
         """Main entry point for feature generation."""
+        if self.backend == "numpy" and self._numpy_compatible(df):
+            return self._generate_features_numpy(df, lags, rolling_windows, include_time_features)
+
         df = df.copy()
         df = self._create_lag_features(df, lags)
         df = self._create_rolling_features(df, rolling_windows)
@@ -29,8 +56,241 @@ class FeatureEngineer:
             df = self._create_time_features(df)
 
         df = df.dropna()
+        self.feature_names_ = self.feature_names(lags, rolling_windows, include_time_features)
+        df.attrs["feature_names"] = list(self.feature_names_)
         return df
 
+    @staticmethod
+    def warmup_rows(lags: int, rolling_windows: list) -> int:
+        """Number of leading observations without a complete feature row."""
+        return max([lags, *[w - 1 for w in rolling_windows]] or [0])
+
+    def feature_names(self, lags: int, rolling_windows: list, include_time_features: bool = True) -> List[str]:
+        names = [f"lag_{lag}" for lag in range(1, lags + 1)]
+        for window in rolling_windows:
+            names += [f"rolling_mean_{window}", f"rolling_std_{window}"]
+        if include_time_features:
+            names += TIME_FEATURE_NAMES
+        return names
+
+    def generate_feature_matrix(
+        self,
+        values: np.ndarray,
+        index: pd.Index = None,
+        lags: int = 5,
+        rolling_windows: list = [7, 14, 30],
+        include_time_features: bool = True,
+        out: np.ndarray = None,
+    ) -> Tuple[np.ndarray, List[str], int]:
+        """
+        Array-level feature builder.
+        Returns (matrix, feature names, first_row), where matrix row i holds
+        the features of observation first_row + i. Pass `out` to write into
+        an existing (rows, features) array instead of allocating one.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        windows = list(rolling_windows)
+        first_row = self.warmup_rows(lags, windows)
+        n_rows = max(n - first_row, 0)
+
+        names = self.feature_names(lags, windows, include_time_features)
+        # Column-major, so every feature column is one contiguous write
+        matrix = out if out is not None else np.empty((n_rows, len(names)), dtype=self.dtype, order="F")
+        if matrix.shape != (n_rows, len(names)):
+            raise ValueError(f"out must have shape {(n_rows, len(names))}")
+        if n_rows == 0:
+            return matrix, names, first_row
+
+        col = 0
+
+        # Lags: row t of the window view holds [y(t-lags), ..., y(t)]
+        if lags > 0:
+            view = sliding_window_view(values, lags + 1)[first_row - lags:]
+            matrix[:, col:col + lags] = view[:, lags - 1::-1]
+            col += lags
+
+        for window in windows:
+            self._rolling_mean_std(values, window, first_row, matrix[:, col], matrix[:, col + 1])
+            col += 2
+
+        if include_time_features:
+            if not isinstance(index, pd.DatetimeIndex):
+                raise ValueError("DataFrame index must be DatetimeIndex for time features")
+            day, month, year, day_of_week, quarter = self._calendar_columns(index[first_row:])
+            matrix[:, col] = day
+            matrix[:, col + 1] = month
+            matrix[:, col + 2] = year
+            matrix[:, col + 3] = day_of_week
+            matrix[:, col + 4] = quarter
+
+        return matrix, names, first_row
+
+    # -------------------- INCREMENTAL (APPEND) MODE --------------------
+
+    def start_incremental(
+        self,
+        df: pd.DataFrame,
+        lags: int = 5,
+        rolling_windows: list = [7, 14, 30],
+        include_time_features: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Generates features for df and keeps the trailing window state,
+        so later append() calls only compute rows for new observations.
+        """
+        features = self.generate_features(df, lags, rolling_windows, include_time_features)
+        warmup = self.warmup_rows(lags, rolling_windows)
+
+        self._incremental = {
+            "lags": lags,
+            "rolling_windows": list(rolling_windows),
+            "include_time_features": include_time_features,
+            "columns": list(df.columns),
+            "warmup": warmup,
+            # Lag buffer + rolling window inputs: the last `warmup` observations
+            "tail": df.iloc[-warmup:].copy() if warmup else df.iloc[:0].copy(),
+            "last_index": df.index[-1] if len(df) else None,
+        }
+        return features
+
+    def append(self, new_rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Returns feature rows for new_rows only, in O(len(new_rows) + window)
+        time, and advances the trailing window state.
+        """
+        state = self._incremental
+        if state is None:
+            raise ValueError("Call start_incremental() before append()")
+        if list(new_rows.columns) != state["columns"]:
+            raise ValueError(f"Expected columns {state['columns']}")
+        if new_rows.empty:
+            return self._empty_feature_frame(new_rows, state)
+        if state["last_index"] is not None and new_rows.index[0] <= state["last_index"]:
+            raise ValueError("Appended rows must come after the last seen observation")
+
+        combined = pd.concat([state["tail"], new_rows])
+        features = self.generate_features(
+            combined,
+            state["lags"],
+            state["rolling_windows"],
+            state["include_time_features"],
+        )
+
+        warmup = state["warmup"]
+        state["tail"] = combined.iloc[-warmup:].copy() if warmup else combined.iloc[:0].copy()
+        state["last_index"] = combined.index[-1]
+
+        # The tail only ever holds warm-up rows, so every output row is new
+        return features
+
+    def _empty_feature_frame(self, df: pd.DataFrame, state: dict) -> pd.DataFrame:
+        names = self.feature_names(state["lags"], state["rolling_windows"], state["include_time_features"])
+        return pd.DataFrame(columns=[*df.columns, *names], index=df.index[:0], dtype=float)
+
+    # -------------------- NUMPY BACKEND --------------------
+
+    @staticmethod
+    def _calendar_columns(dates: pd.DatetimeIndex) -> tuple:
+        """day, month, year, day_of_week, quarter via datetime64 arithmetic."""
+        if dates.tz is not None:
+            return dates.day, dates.month, dates.year, dates.dayofweek, dates.quarter
+
+        stamps = dates.to_numpy()
+        days = stamps.astype("datetime64[D]")
+        months = stamps.astype("datetime64[M]")
+        years = stamps.astype("datetime64[Y]")
+
+        month = (months - years).astype(np.int64) + 1
+        return (
+            (days - months).astype(np.int64) + 1,
+            month,
+            years.astype(np.int64) + 1970,
+            (days.astype(np.int64) + 3) % 7,   # 1970-01-01 was a Thursday
+            (month - 1) // 3 + 1,
+        )
+
+    @staticmethod
+    def _rolling_mean_std(
+        values: np.ndarray,
+        window: int,
+        first_row: int,
+        out_mean: np.ndarray,
+        out_std: np.ndarray,
+        chunk_size: int = 1 << 16,
+    ):
+        """
+        Rolling mean and sample std (ddof=1) from cumulative sums.
+        Prefix sums restart every chunk_size rows around the chunk mean, so
+        the sum-of-squares variance stays accurate on millions of rows.
+        """
+        n = len(values)
+        for start in range(first_row, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            raw = values[start - window + 1:stop]
+            centre = raw.mean()
+            segment = raw - centre
+
+            csum = np.concatenate(([0.0], np.cumsum(segment)))
+            csum_sq = np.concatenate(([0.0], np.cumsum(segment * segment)))
+
+            window_sum = csum[window:] - csum[:-window]
+            window_sum_sq = csum_sq[window:] - csum_sq[:-window]
+            mean = window_sum / window
+
+            rows = slice(start - first_row, stop - first_row)
+            out_mean[rows] = mean + centre
+            if window > 1:
+                var = (window_sum_sq - window_sum * mean) / (window - 1)
+                out_std[rows] = np.sqrt(np.maximum(var, 0.0))
+            else:
+                out_std[rows] = np.nan
+
+    def _numpy_compatible(self, df: pd.DataFrame) -> bool:
+        # NaNs inside the target would spread through the cumulative sums
+        numeric = all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes)
+        return numeric and not df.isna().to_numpy().any()
+
+    def _generate_features_numpy(
+        self,
+        df: pd.DataFrame,
+        lags: int,
+        rolling_windows: list,
+        include_time_features: bool,
+    ) -> pd.DataFrame:
+        names = self.feature_names(lags, rolling_windows, include_time_features)
+        first_row = self.warmup_rows(lags, rolling_windows)
+        n_rows = max(len(df) - first_row, 0)
+
+        # One block holding the original columns followed by the features
+        n_base = df.shape[1]
+        dtype = np.result_type(self.dtype, *df.dtypes)
+        matrix = np.empty((n_rows, n_base + len(names)), dtype=dtype, order="F")
+        matrix[:, :n_base] = df.to_numpy()[first_row:]
+
+        self.generate_feature_matrix(
+            df[self.target_column].to_numpy(),
+            df.index,
+            lags,
+            rolling_windows,
+            include_time_features,
+            out=matrix[:, n_base:],
+        )
+
+        # Same rows as dropna() on the pandas backend (e.g. NaN std for window 1)
+        complete = ~np.isnan(matrix).any(axis=1)
+        if not complete.all():
+            matrix = matrix[complete]
+            index = df.index[first_row:][complete]
+        else:
+            index = df.index[first_row:]
+
+        result = pd.DataFrame(matrix, index=index, columns=[*df.columns, *names], copy=False)
+        result.attrs = dict(df.attrs)
+        result.attrs["feature_names"] = list(names)
+        self.feature_names_ = names
+        return result
+
     # -------------------- LAG FEATURES --------------------
 
     def _create_lag_features(self, df: pd.DataFrame, lags: int) -> pd.DataFrame:
@@ -46,6 +306,19 @@ class FeatureEngineer:
             df[f"rolling_std_{window}"] = df[self.target_column].rolling(window).std()
         return df
 
+    # -------------------- DIRECT TARGETS --------------------
+
+    def generate_direct_targets(self, df: pd.DataFrame, horizons: list) -> pd.DataFrame:
+        """
+        Shifted targets for direct multi-horizon models:
+        target_h{h} at row t is the target value h steps after t.
+        """
+        series = df[self.target_column]
+        return pd.DataFrame(
+            {f"target_h{h}": series.shift(-h) for h in horizons},
+            index=df.index,
+        )
+
     # -------------------- TIME FEATURES --------------------
 
     def _create_time_features(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -63,6 +336,7 @@ class FeatureEngineer:
 
 # -------------------- GUI FRIENDLY FUNCTION --------------------
 
+@profiled("create_features", rows=len)
 def create_features(
     df: pd.DataFrame,
     lags: int = 5,
@@ -72,3 +346,12 @@ def create_features(
 ) -> pd.DataFrame:
     engineer = FeatureEngineer(target_column)
     return engineer.generate_features(df, lags, rolling_windows, include_time_features)
+
+
+def create_direct_targets(
+    df: pd.DataFrame,
+    horizons: list,
+    target_column: str = "Close",
+) -> pd.DataFrame:
+    engineer = FeatureEngineer(target_column)
+    return engineer.generate_direct_targets(df, horizons)
@@ -5,7 +5,9 @@ Designed for GUI and AutoML pipeline integration.
 """
 
 import pandas as pd
-from typing import Tuple
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from core.profiling import profiled
 
 
 class TimeSeriesSplitter:
@@ -35,8 +37,62 @@ class TimeSeriesSplitter:
         return X_train, X_test, y_train, y_test
 
 
-# -------------------- GUI FRIENDLY FUNCTION --------------------
+class Fold(NamedTuple):
+    """Positional bounds of one walk-forward fold: train [train_start, origin), test [origin, test_end)."""
+    train_start: int
+    origin: int
+    test_end: int
+
+
+class WalkForwardSplitter:
+    def __init__(
+        self,
+        n_folds: int = 5,
+        horizon: int = 30,
+        step: Optional[int] = None,
+        window: Optional[int] = None,
+        min_train_size: int = 100,
+    ):
+        """
+        Rolling-origin folds ending at the last observation.
+        step: distance between consecutive origins (default: horizon)
+        window: fixed training length (rolling); None grows the window (expanding)
+        """
+        if n_folds < 1 or horizon < 1:
+            raise ValueError("n_folds and horizon must be positive")
+        self.n_folds = n_folds
+        self.horizon = horizon
+        self.step = step or horizon
+        self.window = window
+        self.min_train_size = min_train_size
+
+    # -------------------- PUBLIC METHODS --------------------
+
+    def folds(self, n_observations: int) -> List[Fold]:
+        """Fold bounds for a series of n_observations, oldest origin first."""
+        last_origin = n_observations - self.horizon
+        origins = [last_origin - k * self.step for k in reversed(range(self.n_folds))]
 
+        if origins[0] < max(self.min_train_size, self.window or 0):
+            raise ValueError(
+                f"Series too short for {self.n_folds} folds of horizon {self.horizon} "
+                f"(needs at least {self.min_train_size} training observations in the first fold)"
+            )
+
+        return [
+            Fold(origin - self.window if self.window else 0, origin, origin + self.horizon)
+            for origin in origins
+        ]
+
+    def split(self, df: pd.DataFrame) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame]]:
+        """Yields (train_df, test_df) for every fold, preserving time order."""
+        for fold in self.folds(len(df)):
+            yield df.iloc[fold.train_start:fold.origin], df.iloc[fold.origin:fold.test_end]
+
+
+# -------------------- GUI FRIENDLY FUNCTIONS --------------------
+
+@profiled("train_test_split", rows=lambda split: len(split[0]) + len(split[1]))
 def time_series_train_test_split(
     df: pd.DataFrame,
     test_size: float = 0.2,
@@ -44,3 +100,13 @@ def time_series_train_test_split(
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, pd.Series]:
     splitter = TimeSeriesSplitter(test_size)
     return splitter.split(df, target_column)
+
+
+def walk_forward_folds(
+    n_observations: int,
+    n_folds: int = 5,
+    horizon: int = 30,
+    step: Optional[int] = None,
+    window: Optional[int] = None,
+) -> List[Fold]:
+    return WalkForwardSplitter(n_folds, horizon, step, window).folds(n_observations)
@@ -1,50 +1,223 @@
 """
 Stationarity Module for CLUE Financial Forecasting
 Handles ADF test and automatic differencing logic
-for univariate financial time series (Close price).
+for univariate financial time series (Close price):
+- ADF outcomes are cached per (series fingerprint, differencing order, lag setup)
+- differencing is capped at max_diff
+- fixed_lag runs a single ADF regression instead of an AIC search over lags
+- screen_stationarity decides d for a whole universe of series in parallel,
+  optionally loading each series inside its worker
 """
 
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
 import pandas as pd
 from statsmodels.tsa.stattools import adfuller
 
+from core.fingerprint import fingerprint_data
+
+
+_ADF_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_ADF_CACHE_SIZE = 1024
+_ADF_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(key: tuple) -> Optional[dict]:
+    with _ADF_CACHE_LOCK:
+        if key in _ADF_CACHE:
+            _ADF_CACHE.move_to_end(key)
+            return _ADF_CACHE[key]
+    return None
+
+
+def _cache_put(key: tuple, result: dict):
+    with _ADF_CACHE_LOCK:
+        _ADF_CACHE[key] = result
+        while len(_ADF_CACHE) > _ADF_CACHE_SIZE:
+            _ADF_CACHE.popitem(last=False)
+
+
+def clear_adf_cache():
+    with _ADF_CACHE_LOCK:
+        _ADF_CACHE.clear()
+
+
+def _run_adf(values: np.ndarray, fixed_lag: Optional[int]) -> dict:
+    if fixed_lag is None:
+        result = adfuller(values)
+    else:
+        result = adfuller(values, maxlag=fixed_lag, autolag=None)
+
+    return {
+        "adf_statistic": float(result[0]),
+        "p_value": float(result[1]),
+        "used_lag": int(result[2]),
+        "n_obs": int(result[3]),
+        "critical_values": result[4],
+    }
+
 
 class StationarityChecker:
-    def __init__(self, significance_level: float = 0.05):
+    def __init__(
+        self,
+        significance_level: float = 0.05,
+        max_diff: int = 2,
+        fixed_lag: Optional[int] = None,
+        use_cache: bool = True,
+    ):
+        """
+        max_diff: upper bound on the number of differences make_stationary applies
+        fixed_lag: ADF lag order to use as-is (fast path); None searches lags by AIC
+        """
         self.significance_level = significance_level
+        self.max_diff = max_diff
+        self.fixed_lag = fixed_lag
+        self.use_cache = use_cache
 
     # -------------------- PUBLIC METHODS --------------------
 
     def adf_test(self, series: pd.Series) -> dict:
         """Performs Augmented Dickey-Fuller test."""
-        result = adfuller(series.dropna())
+        values = _clean_values(series)
+        return self._adf(values, self._fingerprint(values), 0)
 
-        return {
-            "adf_statistic": result[0],
-            "p_value": result[1],
-            "used_lag": result[2],
-            "n_obs": result[3],
-            "critical_values": result[4],
-            "is_stationary": result[1] < self.significance_level,
-        }
+    def differencing_order(self, series: pd.Series) -> dict:
+        """ADF result of the first difference order (<= max_diff) that tests stationary."""
+        values = _clean_values(series)
+        fingerprint = self._fingerprint(values)
+
+        diff_count = 0
+        test_result = self._adf(values, fingerprint, diff_count)
+        while not test_result["is_stationary"] and diff_count < self.max_diff:
+            values = np.diff(values)
+            diff_count += 1
+            test_result = self._adf(values, fingerprint, diff_count)
+
+        return {**test_result, "differencing_order": diff_count}
 
     def make_stationary(self, df: pd.DataFrame, target_column: str = "Close") -> pd.DataFrame:
-        """Applies differencing until stationarity is achieved."""
+        """Applies differencing until stationarity is achieved, at most max_diff times."""
         series = df[target_column]
-        differenced = series.copy()
-        diff_count = 0
+        test_result = self.differencing_order(series)
+        diff_count = test_result["differencing_order"]
 
-        while True:
-            test_result = self.adf_test(differenced)
-            if test_result["is_stationary"]:
-                break
+        differenced = series.copy()
+        for _ in range(diff_count):
             differenced = differenced.diff().dropna()
-            diff_count += 1
 
         stationary_df = differenced.to_frame(name=target_column)
         stationary_df.attrs["differencing_order"] = diff_count
+        # False when max_diff was reached without passing the test
+        stationary_df.attrs["is_stationary"] = test_result["is_stationary"]
 
         return stationary_df
 
+    # -------------------- HELPERS --------------------
+
+    def _fingerprint(self, values: np.ndarray) -> Optional[str]:
+        return fingerprint_data(values) if self.use_cache else None
+
+    def _adf(self, values: np.ndarray, fingerprint: Optional[str], diff_order: int) -> dict:
+        # Differenced values are never re-hashed: the key is the source fingerprint plus the order
+        key = (fingerprint, diff_order, self.fixed_lag)
+        result = _cache_get(key) if fingerprint is not None else None
+        if result is None:
+            result = _run_adf(values, self.fixed_lag)
+            if fingerprint is not None:
+                _cache_put(key, result)
+
+        return {**result, "is_stationary": result["p_value"] < self.significance_level}
+
+
+def _clean_values(series) -> np.ndarray:
+    values = np.asarray(series, dtype=float)
+    return values[~np.isnan(values)]
+
+
+# -------------------- SCREENING --------------------
+
+def _screen_series(
+    name: str,
+    values: Any,
+    checker_kwargs: Dict,
+    loader: Optional[Callable[[Any], pd.Series]] = None,
+) -> Tuple[Dict, List[tuple]]:
+    """Decides d for one series; returns its row and the ADF cache entries it produced."""
+    checker = StationarityChecker(**checker_kwargs)
+    start = time.perf_counter()
+    row = {"series": name}
+    error = None
+
+    try:
+        if loader is not None:
+            values = loader(values)
+        values = np.asarray(values, dtype=float)
+        result = checker.differencing_order(values)
+        row.update({
+            "differencing_order": result["differencing_order"],
+            "is_stationary": result["is_stationary"],
+            "p_value": result["p_value"],
+            "adf_statistic": result["adf_statistic"],
+            "used_lag": result["used_lag"],
+            "n_obs": result["n_obs"],
+        })
+    except Exception as exc:
+        # e.g. too few observations left after differencing
+        error = f"{type(exc).__name__}: {exc}"
+    row["seconds"] = time.perf_counter() - start
+    row["error"] = error
+
+    entries = []
+    if checker.use_cache and error is None:
+        fingerprint = checker._fingerprint(_clean_values(values))
+        with _ADF_CACHE_LOCK:
+            entries = [(key, result) for key, result in _ADF_CACHE.items() if key[0] == fingerprint]
+    return row, entries
+
+
+def screen_stationarity(
+    series_map: Mapping[str, Any],
+    n_jobs: Optional[int] = None,
+    loader: Optional[Callable[[Any], pd.Series]] = None,
+    **checker_kwargs,
+) -> pd.DataFrame:
+    """
+    Differencing decisions for many series (e.g. a ticker universe) before
+    the ARIMA search runs. Returns one row per series, indexed by name.
+    Passed on as d (BatchForecaster does this), the ADF decision replaces
+    the order search's own KPSS test, so each series gets one d either way.
+    loader: picklable function turning each series_map value (e.g. a source
+            config) into the series, called inside the worker; load failures
+            become the row's error
+    Results computed in worker processes are copied into this process's cache.
+    """
+    n_jobs = n_jobs or max(1, (os.cpu_count() or 1) - 1)
+    names = list(series_map)
+    if loader is None:
+        values = [np.asarray(series_map[name], dtype=float) for name in names]
+    else:
+        values = [series_map[name] for name in names]
+    kwargs = [checker_kwargs] * len(names)
+    loaders = [loader] * len(names)
+
+    if n_jobs == 1 or len(names) <= 1:
+        outcomes = list(map(_screen_series, names, values, kwargs, loaders))
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(names))) as pool:
+            chunksize = max(1, len(names) // (n_jobs * 4))
+            outcomes = list(pool.map(_screen_series, names, values, kwargs, loaders, chunksize=chunksize))
+        for _, entries in outcomes:
+            for key, result in entries:
+                _cache_put(key, result)
+
+    return pd.DataFrame([row for row, _ in outcomes]).set_index("series")
+
 
 # -------------------- GUI FRIENDLY FUNCTION --------------------
 
@@ -55,4 +228,4 @@ def check_stationarity(df: pd.DataFrame, column: str = "Close") -> dict:
 
 def transform_to_stationary(df: pd.DataFrame, column: str = "Close") -> pd.DataFrame:
     checker = StationarityChecker()
-    return checker.make_stationary(df, column)
\ No newline at end of file
+    return checker.make_stationary(df, column)
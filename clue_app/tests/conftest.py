@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests import the app modules the way main.py / cli.py do (from clue_app/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
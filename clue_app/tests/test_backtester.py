@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecasting.backtester import WalkForwardBacktester
+
+
+def _random_walk(n=600, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2015-01-01", periods=n, name="Date")
+    return pd.DataFrame({"Close": 100 + np.cumsum(rng.normal(0, 1, n))}, index=index)
+
+
+@pytest.mark.parametrize("n_folds, horizon", [(4, 5), (5, 30)])
+def test_xgboost_warm_start_tracks_full_refits(n_folds, horizon):
+    df = _random_walk()
+
+    def run(incremental):
+        backtester = WalkForwardBacktester("XGBOOST", n_folds=n_folds, horizon=horizon, n_jobs=1, incremental=incremental)
+        return backtester.run(df)
+
+    warm, full = run(True), run(False)
+    assert warm["stats"]["full_fits"] == 1
+    assert full["stats"]["full_fits"] == n_folds
+
+    # Warm-started folds score the model a full refit would ship, within tolerance
+    assert warm["metrics"]["MAE"] == pytest.approx(full["metrics"]["MAE"], rel=0.25)
+    one_step = (warm["horizon_metrics"].loc[1, "MAE"], full["horizon_metrics"].loc[1, "MAE"])
+    assert one_step[0] == pytest.approx(one_step[1], rel=0.25)
@@ -0,0 +1,47 @@
+import multiprocessing
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import core.dataset_cache
+from pipeline.batch_pipeline import BatchForecaster
+
+
+def _write_csv(path, n=260):
+    rng = np.random.default_rng(0)
+    pd.DataFrame({
+        "Date": pd.bdate_range("2015-01-01", periods=n).strftime("%Y-%m-%d"),
+        "Open": 1.0,
+        "Close": 100 + np.cumsum(rng.normal(0, 1, n)),
+    }).to_csv(path, index=False)
+    return {"source": "csv", "file_path": str(path)}
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="workers must inherit the patched loader")
+def test_dead_worker_fails_only_its_series(tmp_path, monkeypatch):
+    monkeypatch.setenv("CLUE_MODEL_DIR", str(tmp_path / "models"))
+    monkeypatch.setenv("CLUE_SERIES_DIR", str(tmp_path / "series"))
+
+    load = core.dataset_cache.load_cached_financial_data
+
+    def crashing_load(**config):
+        if "crash" in config["file_path"]:
+            os._exit(1)
+        return load(**config)
+
+    monkeypatch.setattr(core.dataset_cache, "load_cached_financial_data", crashing_load)
+
+    configs = [_write_csv(tmp_path / name) for name in ("a.csv", "crash.csv", "b.csv", "c.csv")]
+    batch = BatchForecaster("XGBOOST", forecast_periods=3, n_jobs=2)
+    table = batch.run(configs)
+
+    status = dict(zip(table["series"], table["status"]))
+    assert status == {"a.csv": "ok", "crash.csv": "failed", "b.csv": "ok", "c.csv": "ok"}
+    assert "BrokenProcessPool" in table.loc[table["series"] == "crash.csv", "error"].iloc[0]
+    assert batch.stats["pool_restarts"] >= 1
+
+    # Training time is split by stage
+    ok = table[table["status"] == "ok"]
+    assert ok[["features_seconds", "fit_seconds", "metrics_seconds"]].notna().all().all()
@@ -0,0 +1,21 @@
+import pandas as pd
+
+from core.dataset_cache import DatasetCache
+
+
+def test_source_is_normalized_for_key_and_loader(tmp_path):
+    path = tmp_path / "prices.csv"
+    pd.DataFrame({"Date": ["2024-01-02", "2024-01-03"], "Close": [1.0, 2.0]}).to_csv(path, index=False)
+
+    sources = []
+
+    def loader(**config):
+        sources.append(config["source"])
+        return pd.DataFrame({"Close": [1.0, 2.0]}, index=pd.to_datetime(["2024-01-02", "2024-01-03"]))
+
+    cache = DatasetCache(loader=loader)
+    cache.load(source=" CSV ", file_path=str(path))
+    cache.load(source="csv", file_path=str(path))
+
+    assert sources == ["csv"]
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+import pmdarima as pm
+import pytest
+
+from forecasting.order_search import ARIMAOrderSearch
+
+
+def _arma_series(n=400, seed=3):
+    rng = np.random.default_rng(seed)
+    noise = rng.normal(0, 1, n + 2)
+    returns = np.zeros(n)
+    for t in range(2, n):
+        returns[t] = 0.5 * returns[t - 1] - 0.3 * returns[t - 2] + noise[t] + 0.4 * noise[t - 1]
+    return pd.Series(100 + np.cumsum(returns))
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_exact_search_matches_pmdarima_exhaustive_winner(n_jobs):
+    series = _arma_series()
+    limits = dict(max_p=3, max_q=3, max_order=4)
+
+    search = ARIMAOrderSearch(**limits, probe_size=0, patience=None, n_jobs=n_jobs)
+    order = search.search(series, d=1)
+
+    reference = pm.auto_arima(
+        series, d=1, start_p=0, start_q=0, **limits,
+        seasonal=False, stepwise=False, trend="t", maxiter=50,
+        information_criterion="aic", error_action="ignore", suppress_warnings=True,
+    )
+    assert order == reference.order
+    assert search.stats["skipped"] == 0
+    assert search.stats["pruned"] == 0
@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from core.yahoo_cache import EmptyDownloadError, YahooPriceCache
+
+
+def _prices(start, end):
+    index = pd.bdate_range(start, end - pd.Timedelta(days=1), name="Date")
+    return pd.DataFrame({"Close": range(len(index))}, index=index, dtype=float)
+
+
+class _Downloader:
+    def __init__(self, empty=False):
+        self.empty = empty
+        self.calls = []
+
+    def __call__(self, ticker, start, end):
+        self.calls.append((start, end))
+        return pd.DataFrame() if self.empty else _prices(start, end)
+
+
+def test_empty_download_is_not_cached_as_covered(tmp_path):
+    failing = _Downloader(empty=True)
+    cache = YahooPriceCache(tmp_path, downloader=failing)
+
+    with pytest.raises(EmptyDownloadError):
+        cache.get("AAPL", "2024-01-01", "2024-02-01")
+    assert cache.covered_ranges("AAPL") == []
+
+    # The range is fetched again once the source answers
+    working = _Downloader()
+    cache = YahooPriceCache(tmp_path, downloader=working)
+    assert len(cache.get("AAPL", "2024-01-01", "2024-02-01")) == 23
+    assert len(working.calls) == 1
+
+
+def test_empty_download_serves_cached_rows(tmp_path):
+    YahooPriceCache(tmp_path, downloader=_Downloader()).get("AAPL", "2024-01-01", "2024-02-01")
+
+    cache = YahooPriceCache(tmp_path, downloader=_Downloader(empty=True))
+    with pytest.warns(UserWarning, match="serving cached"):
+        df = cache.get("AAPL", "2024-01-01", "2024-03-01")
+
+    assert len(df) == 23
+    assert cache.covered_ranges("AAPL") == [(pd.Timestamp("2024-01-01"), pd.Timestamp("2024-02-01"))]
+
+
+def test_empty_weekend_is_covered(tmp_path):
+    downloader = _Downloader(empty=True)
+    cache = YahooPriceCache(tmp_path, downloader=downloader)
+
+    assert cache.get("AAPL", "2024-01-06", "2024-01-08").empty
+    assert cache.get("AAPL", "2024-01-06", "2024-01-08").empty
+    assert len(downloader.calls) == 1
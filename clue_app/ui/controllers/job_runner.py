@@ -0,0 +1,237 @@
+# ui/controllers/job_runner.py
+"""
+Background Job Runner for CLUE
+Runs long pipeline steps (training, forecasting, EDA, reports) on a
+QThreadPool so the GUI thread stays responsive. Results, errors and
+progress are delivered back on the GUI thread through Qt signals.
+
+Jobs must not create Qt widgets or pyplot figures; build figures in the
+on_result callback, which always runs on the GUI thread.
+"""
+
+import itertools
+import threading
+import traceback
+from typing import Callable, Dict, List, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when the user cancelled it."""
+
+
+class JobContext:
+    """Handed to job functions that opt in, for progress and cancellation."""
+
+    def __init__(self, job_id: str, signals: "JobSignals"):
+        self.job_id = job_id
+        self._signals = signals
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise JobCancelled(self.job_id)
+
+    def report(self, percent: int, message: str = ""):
+        """Emits progress and doubles as a cancellation checkpoint."""
+        self.check_cancelled()
+        self._signals.progress.emit(self.job_id, int(percent), message)
+
+
+class JobSignals(QObject):
+    started = Signal(str, str)           # job id, name
+    progress = Signal(str, int, str)     # job id, percent, message
+    finished = Signal(str, object)       # job id, result
+    failed = Signal(str, str, str)       # job id, error message, traceback
+    cancelled = Signal(str)              # job id
+
+
+class Job(QRunnable):
+    def __init__(self, job_id: str, name: str, fn: Callable, args: tuple, kwargs: dict, with_context: bool):
+        super().__init__()
+        self.setAutoDelete(False)
+
+        self.job_id = job_id
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.with_context = with_context
+
+        self.signals = JobSignals()
+        self.context = JobContext(job_id, self.signals)
+        self.done = threading.Event()
+
+    def run(self):
+        try:
+            self._execute()
+        finally:
+            self.done.set()
+
+    def _execute(self):
+        if self.context.cancelled:
+            self.signals.cancelled.emit(self.job_id)
+            return
+
+        self.signals.started.emit(self.job_id, self.name)
+
+        try:
+            if self.with_context:
+                result = self.fn(*self.args, job_context=self.context, **self.kwargs)
+            else:
+                result = self.fn(*self.args, **self.kwargs)
+        except JobCancelled:
+            self.signals.cancelled.emit(self.job_id)
+            return
+        except Exception as exc:
+            self.signals.failed.emit(self.job_id, f"{type(exc).__name__}: {exc}", traceback.format_exc())
+            return
+
+        # Cancellation is cooperative; drop results of jobs cancelled mid-run
+        if self.context.cancelled:
+            self.signals.cancelled.emit(self.job_id)
+        else:
+            self.signals.finished.emit(self.job_id, result)
+
+
+class JobRunner(QObject):
+    """
+    Queues jobs on a private thread pool.
+    With the default single worker, jobs run in submission order, so the
+    user can queue the next wizard step while the current one finishes.
+    """
+
+    job_started = Signal(str, str)
+    job_progress = Signal(str, int, str)
+    job_finished = Signal(str)
+    job_failed = Signal(str, str, str, str)  # job id, name, error message, traceback
+    job_cancelled = Signal(str, str)     # job id, name
+    idle = Signal()
+
+    def __init__(self, parent: Optional[QObject] = None, max_workers: int = 1):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_workers)
+
+        self._ids = itertools.count(1)
+        self._jobs: Dict[str, Job] = {}
+        self._callbacks: Dict[str, tuple] = {}
+        # Finished jobs stay referenced until their worker has fully returned
+        self._retired: List[Job] = []
+
+    # ================= PUBLIC API =================
+
+    def submit(
+        self,
+        name: str,
+        fn: Callable,
+        *args,
+        on_result: Optional[Callable] = None,
+        on_error: Optional[Callable] = None,
+        with_context: bool = False,
+        **kwargs,
+    ) -> str:
+        """
+        Queues fn(*args, **kwargs) and returns its job id.
+        With with_context=True, fn also receives job_context=JobContext.
+        """
+        self._retired = [job for job in self._retired if not job.done.is_set()]
+
+        job_id = f"{name}-{next(self._ids)}"
+        job = Job(job_id, name, fn, args, kwargs, with_context)
+
+        job.signals.started.connect(self._on_started)
+        job.signals.progress.connect(self._on_progress)
+        job.signals.finished.connect(self._on_finished)
+        job.signals.failed.connect(self._on_failed)
+        job.signals.cancelled.connect(self._on_cancelled)
+
+        self._jobs[job_id] = job
+        self._callbacks[job_id] = (on_result, on_error)
+        self.pool.start(job)
+        return job_id
+
+    def cancel(self, job_id: str) -> bool:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return False
+
+        job.context.cancel()
+        if self.pool.tryTake(job):
+            # Never started: report it directly
+            self._on_cancelled(job_id)
+        return True
+
+    def cancel_all(self):
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+
+    def is_busy(self) -> bool:
+        return bool(self._jobs)
+
+    def pending_jobs(self):
+        return [job.name for job in self._jobs.values()]
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        return self.pool.waitForDone(timeout_ms)
+
+    # ================= SIGNAL HANDLERS (GUI THREAD) =================
+
+    @Slot(str, str)
+    def _on_started(self, job_id: str, name: str):
+        self.job_started.emit(job_id, name)
+
+    @Slot(str, int, str)
+    def _on_progress(self, job_id: str, percent: int, message: str):
+        self.job_progress.emit(job_id, percent, message)
+
+    @Slot(str, object)
+    def _on_finished(self, job_id: str, result):
+        on_result, _ = self._release(job_id)
+        self.job_finished.emit(job_id)
+        # Idle first, so status set by on_result (or jobs it chains) wins
+        self._emit_idle()
+        if on_result is not None:
+            on_result(result)
+
+    @Slot(str, str, str)
+    def _on_failed(self, job_id: str, message: str, details: str):
+        name = self._job_name(job_id)
+        _, on_error = self._release(job_id)
+        self.job_failed.emit(job_id, name, message, details)
+        if on_error is not None:
+            on_error(message)
+        self._emit_idle()
+
+    @Slot(str)
+    def _on_cancelled(self, job_id: str):
+        if job_id not in self._jobs:
+            return
+        name = self._job_name(job_id)
+        self._release(job_id)
+        self.job_cancelled.emit(job_id, name)
+        self._emit_idle()
+
+    # ================= HELPERS =================
+
+    def _job_name(self, job_id: str) -> str:
+        job = self._jobs.get(job_id)
+        return job.name if job is not None else job_id
+
+    def _release(self, job_id: str) -> tuple:
+        job = self._jobs.pop(job_id, None)
+        if job is not None:
+            self._retired.append(job)
+        return self._callbacks.pop(job_id, (None, None))
+
+    def _emit_idle(self):
+        if not self._jobs:
+            self.idle.emit()
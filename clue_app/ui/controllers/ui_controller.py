@@ -2,13 +2,17 @@
 
 from typing import Dict
 
+from PySide6.QtWidgets import QMessageBox
+
 from ui.main_window import MainWindow
-from preprocessing.eda import eda_summary, generate_eda_charts, generate_preview_charts
+from ui.controllers.job_runner import JobRunner
+from preprocessing.eda import eda_summary
 from pipeline.training_pipeline import run_training
 from pipeline.forecasting_pipeline import run_forecast
-from core.report_generator import generate_report
-from core.data_loader import load_financial_data
-from visualization.forecast_plot import plot_forecast
+from core.report_generator import format_eda_summary, generate_report
+from core.dataset_cache import load_cached_financial_data
+from core.profiling import get_profiler
+from visualization.figure_cache import get_figure_cache
 
 
 class UIController:
@@ -25,7 +29,20 @@ class UIController:
         # Navigation history for Back button
         self.page_history = []
 
+        # Long steps run off the GUI thread, in submission order
+        self.jobs = JobRunner(main_window)
+
+        # Charts are built once per dataset / forecast and shared with the report
+        self.figures = get_figure_cache()
+
+        # Stage timings for the diagnostics panel and the report appendix,
+        # counted from the last data selection
+        self.profiler = get_profiler()
+        self.profile_mark = self.profiler.mark()
+
         self._connect_signals()
+        self._connect_job_signals()
+        self._connect_diagnostics_signals()
 
     # ================= SAFE NAVIGATION =================
 
@@ -63,18 +80,58 @@ class UIController:
         if hasattr(w.report_page, "generate_report_clicked"):
             w.report_page.generate_report_clicked.connect(self._generate_report)
 
+    def _connect_job_signals(self):
+        w = self.main_window
+
+        self.jobs.job_started.connect(lambda _, name: w.show_job_progress(-1, f"{name}..."))
+        self.jobs.job_progress.connect(lambda _, percent, message: w.show_job_progress(percent, message))
+        self.jobs.job_failed.connect(self._on_job_failed)
+        self.jobs.job_cancelled.connect(lambda _, name: w.hide_job_progress(f"{name} cancelled"))
+        self.jobs.idle.connect(lambda: w.hide_job_progress())
+        w.cancel_job_btn.clicked.connect(self.jobs.cancel_all)
+
+    def _connect_diagnostics_signals(self):
+        panel = self.main_window.diagnostics_panel
+
+        self.jobs.idle.connect(self._refresh_diagnostics)
+        panel.refresh_clicked.connect(self._refresh_diagnostics)
+        panel.clear_clicked.connect(self._clear_diagnostics)
+
+    def _refresh_diagnostics(self):
+        self.main_window.diagnostics_panel.set_spans(self.profiler.records())
+
+    def _clear_diagnostics(self):
+        self.profiler.clear()
+        self._refresh_diagnostics()
+
+    def _on_job_failed(self, job_id: str, name: str, message: str, details: str):
+        self.main_window.hide_job_progress(f"{name} failed")
+        box = QMessageBox(QMessageBox.Warning, "CLUE", f"{name} failed:\n{message}", QMessageBox.Ok, self.main_window)
+        # Traceback behind "Show Details..."
+        box.setDetailedText(details)
+        box.exec()
+
     # ================= DATA PREVIEW (BEFORE EDA) =================
 
     def _on_data_selected(self, config: dict):
         self.source_config = config
-        df = load_financial_data(**self.source_config)
+        self.profile_mark = self.profiler.mark()
+
+        self.jobs.submit(
+            "Loading data",
+            _load_with_summary,
+            dict(self.source_config),
+            on_result=self._show_data_preview,
+            with_context=True,
+        )
 
-        summary = eda_summary(df)
-        preview_fig = generate_preview_charts(df)
+    def _show_data_preview(self, loaded):
+        df, summary = loaded
+        preview_fig = self.figures.preview_chart(df)
 
         page = self.main_window.before_eda_page
         page.set_status("Preview of raw data (Before Cleaning)")
-        page.set_eda_summary(self._format_eda_summary(summary))
+        page.set_eda_summary(format_eda_summary(summary))
         page.set_preview_plot(preview_fig)
 
         self.go_to(page)
@@ -89,13 +146,20 @@ class UIController:
     # ================= FULL EDA =================
 
     def _run_eda(self):
-        df = load_financial_data(**self.source_config)
+        self.jobs.submit(
+            "Running EDA",
+            _load_with_summary,
+            dict(self.source_config),
+            on_result=self._show_eda,
+            with_context=True,
+        )
 
-        summary = eda_summary(df)
-        fig = generate_eda_charts(df)
+    def _show_eda(self, loaded):
+        df, summary = loaded
+        fig = self.figures.eda_charts(df)
 
         page = self.main_window.after_eda_page
-        page.set_eda_summary(self._format_eda_summary(summary))
+        page.set_eda_summary(format_eda_summary(summary))
         page.set_eda_plot(fig)
 
         self.go_to(page)
@@ -103,19 +167,24 @@ class UIController:
     # ================= TRAIN MODEL =================
 
     def _run_training(self):
-        result = run_training(
+        self.jobs.submit(
+            f"Training {self.current_model_type}",
+            _train_with_progress,
             self.current_model_type,
-            self.source_config,
-            forecast_periods=self.forecast_horizon,
+            dict(self.source_config),
+            self.forecast_horizon,
+            on_result=self._show_training_result,
+            with_context=True,
         )
 
+    def _show_training_result(self, result: Dict):
         self.last_training_result = result
         self.last_metrics = result.get("metrics", {})
 
         model_order = result.get("model_order", "N/A")
 
         self.main_window.model_result_page.set_results(
-            model_type=self.current_model_type,
+            model_type=result.get("model_type", self.current_model_type),
             model_order=model_order,
             metrics=self.last_metrics,
         )
@@ -125,16 +194,21 @@ class UIController:
     # ================= FORECAST =================
 
     def _run_forecast(self):
-        result = run_forecast(
+        self.jobs.submit(
+            "Forecasting",
+            _forecast_with_history,
             self.current_model_type,
-            self.source_config,
-            forecast_periods=self.forecast_horizon,
+            dict(self.source_config),
+            self.forecast_horizon,
+            on_result=self._show_forecast,
+            with_context=True,
         )
 
+    def _show_forecast(self, forecasted):
+        df, result = forecasted
         self.last_forecast_result = result
-        df = load_financial_data(**self.source_config)
 
-        fig = plot_forecast(
+        fig = self.figures.forecast_chart(
             df,
             result.get("forecast"),
             result.get("confidence_intervals"),
@@ -165,9 +239,33 @@ class UIController:
         if not output_path.lower().endswith(".pdf"):
             output_path += ".pdf"
 
-        df = load_financial_data(**self.source_config)
+        # Figures come from the figure cache on the GUI thread once the data
+        # is loaded, then the PDF itself is written in the background.
+        self.jobs.submit(
+            "Preparing report",
+            _load_with_summary,
+            dict(self.source_config),
+            on_result=lambda loaded: self._build_report(output_path, loaded),
+            with_context=True,
+        )
 
-        generate_report(
+    def _build_report(self, output_path: str, loaded):
+        df, summary = loaded
+        eda_fig = self.figures.eda_charts(df)
+        forecast_fig = self.figures.forecast_chart(
+            df,
+            self.last_forecast_result.get("forecast"),
+            self.last_forecast_result.get("confidence_intervals"),
+        )
+
+        # The pages share these figures (and may be panning them), so rasterise
+        # them here on the GUI thread; the job only embeds the PNG bytes.
+        eda_png = self.figures.render(eda_fig)
+        forecast_png = self.figures.render(forecast_fig)
+
+        self.jobs.submit(
+            "Generating report",
+            generate_report,
             output_path=output_path,
             title="CLUE Forecasting Report",
             model_results={
@@ -175,38 +273,17 @@ class UIController:
                 **self.last_training_result,
             },
             metrics=self.last_metrics,
-            eda_summary=self._format_eda_summary(eda_summary(df)),
-            eda_fig=generate_eda_charts(df),
-            forecast_fig=plot_forecast(
-                df,
-                self.last_forecast_result.get("forecast"),
-                self.last_forecast_result.get("confidence_intervals"),
-            ),
+            eda_summary=format_eda_summary(summary),
+            eda_fig=eda_png,
+            forecast_fig=forecast_png,
             predicted_values=self.last_forecast_result.get("forecast"),
             notes="Generated by CLUE AI Forecasting System",
+            profile=self.profiler.records(since=self.profile_mark),
+            on_result=lambda _: self.main_window.hide_job_progress(f"Report saved to {output_path}"),
         )
 
     # ================= HELPERS =================
 
-    def _format_eda_summary(self, summary: dict) -> str:
-        stats = summary.get("basic_stats", {})
-        returns = summary.get("returns_stats", {})
-
-        return (
-            "DATA OVERVIEW\n"
-            f"Start Date   : {stats.get('start_date')}\n"
-            f"End Date     : {stats.get('end_date')}\n"
-            f"Observations : {stats.get('n_observations')}\n\n"
-            "PRICE STATISTICS\n"
-            f"Min  : {stats.get('min'):.2f}\n"
-            f"Max  : {stats.get('max'):.2f}\n"
-            f"Mean : {stats.get('mean'):.2f}\n"
-            f"Std  : {stats.get('std'):.2f}\n\n"
-            "RETURNS\n"
-            f"Mean Daily Return : {returns.get('mean_daily_return'):.4f}\n"
-            f"Volatility        : {returns.get('volatility'):.4f}\n"
-        )
-
     def _format_metrics(self, metrics: dict) -> str:
         if not metrics:
             return "No metrics available."
@@ -216,4 +293,29 @@ class UIController:
             f"MSE  : {metrics.get('MSE', 0.0):.4f}\n"
             f"RMSE : {metrics.get('RMSE', 0.0):.4f}\n"
             f"MAPE : {metrics.get('MAPE', 0.0):.4f}%"
-        )
\ No newline at end of file
+        )
+
+
+# ================= BACKGROUND JOB FUNCTIONS =================
+# These run on the job runner's worker thread: no widgets, no figures.
+
+def _load_with_summary(source_config: Dict, job_context=None):
+    job_context.report(10, "Loading data...")
+    df = load_cached_financial_data(**source_config)
+
+    job_context.report(70, "Summarising data...")
+    return df, eda_summary(df)
+
+
+def _train_with_progress(model_type: str, source_config: Dict, horizon: int, job_context=None):
+    # report() raises JobCancelled, so a cancel takes effect between stages
+    return run_training(model_type, source_config, forecast_periods=horizon, progress=job_context.report)
+
+
+def _forecast_with_history(model_type: str, source_config: Dict, horizon: int, job_context=None):
+    job_context.report(10, "Loading data...")
+    df = load_cached_financial_data(**source_config)
+
+    job_context.report(30, f"Forecasting {horizon} periods...")
+    result = run_forecast(model_type, source_config, forecast_periods=horizon)
+    return df, result
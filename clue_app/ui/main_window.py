@@ -1,4 +1,5 @@
-from PySide6.QtWidgets import QMainWindow, QStackedWidget
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QMainWindow, QStackedWidget, QProgressBar, QPushButton, QDockWidget
 
 from ui.pages.welcome_page import WelcomePage
 from ui.pages.model_selection_page import ModelSelectionPage
@@ -9,6 +10,7 @@ from ui.pages.forecast_page import ForecastPage
 from ui.pages.evaluation_page import EvaluationPage
 from ui.pages.report_page import ReportPage
 from ui.pages.data_source_page import DataSourcePage
+from ui.widgets.diagnostics_panel import DiagnosticsPanel
 
 
 class MainWindow(QMainWindow):
@@ -21,6 +23,8 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self.stack)
 
         self._init_pages()
+        self._init_job_status()
+        self._init_diagnostics()
 
         # ✅ Show Welcome Page FIRST
         self.stack.setCurrentWidget(self.welcome_page)
@@ -47,6 +51,55 @@ class MainWindow(QMainWindow):
         self.stack.addWidget(self.evaluation_page)
         self.stack.addWidget(self.report_page)
 
+    def _init_job_status(self):
+        """Status bar progress for background jobs (hidden while idle)."""
+        self.job_progress = QProgressBar()
+        self.job_progress.setRange(0, 100)
+        self.job_progress.setMaximumWidth(220)
+        self.job_progress.hide()
+
+        self.cancel_job_btn = QPushButton("Cancel")
+        self.cancel_job_btn.hide()
+
+        self.statusBar().addPermanentWidget(self.job_progress)
+        self.statusBar().addPermanentWidget(self.cancel_job_btn)
+
+    def _init_diagnostics(self):
+        """Pipeline stage timings, docked at the bottom and hidden until asked for."""
+        self.diagnostics_panel = DiagnosticsPanel()
+
+        self.diagnostics_dock = QDockWidget("Diagnostics", self)
+        self.diagnostics_dock.setObjectName("diagnostics_dock")
+        self.diagnostics_dock.setWidget(self.diagnostics_panel)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.diagnostics_dock)
+        self.diagnostics_dock.hide()
+
+        self.diagnostics_btn = QPushButton("Diagnostics")
+        self.diagnostics_btn.setCheckable(True)
+        self.diagnostics_btn.toggled.connect(self.diagnostics_dock.setVisible)
+        self.diagnostics_dock.visibilityChanged.connect(self.diagnostics_btn.setChecked)
+        self.statusBar().addPermanentWidget(self.diagnostics_btn)
+
+    def show_job_progress(self, percent: int, message: str = ""):
+        # Negative percent shows a busy indicator for jobs without progress steps
+        if percent < 0:
+            self.job_progress.setRange(0, 0)
+        else:
+            self.job_progress.setRange(0, 100)
+            self.job_progress.setValue(percent)
+        self.job_progress.show()
+        self.cancel_job_btn.show()
+        if message:
+            self.statusBar().showMessage(message)
+
+    def hide_job_progress(self, message: str = ""):
+        self.job_progress.hide()
+        self.cancel_job_btn.hide()
+        if message:
+            self.statusBar().showMessage(message, 5000)
+        else:
+            self.statusBar().clearMessage()
+
     # ✅ Universal navigation
     def go_to_page(self, page):
         self.stack.setCurrentWidget(page)
@@ -6,6 +6,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 from ui.widgets.matplotlib_canvas import MatplotlibCanvas
+from visualization.forecast_plot import forecast_artists
 
 
 class ForecastPage(QWidget):
@@ -108,7 +109,8 @@ class ForecastPage(QWidget):
     # ================= PUBLIC METHODS =================
 
     def set_forecast_plot(self, fig):
-        self.canvas.draw_figure(fig)
+        # Forecast line and band are blitted, so a new horizon only redraws them
+        self.canvas.draw_figure(fig, animated=forecast_artists(fig))
 
     def set_predicted_values(self, values):
         """
@@ -12,7 +12,7 @@ class ModelSelectionPage(QWidget):
         layout.addWidget(QLabel("Select Forecasting Model"))
 
         self.model_combo = QComboBox()
-        self.model_combo.addItems(["AUTO_ARIMA", "XGBOOST"])
+        self.model_combo.addItems(["AUTO_ARIMA", "XGBOOST", "XGBOOST_DIRECT"])
         layout.addWidget(self.model_combo)
 
         layout.addWidget(QLabel("Forecast Horizon (days):"))
@@ -0,0 +1,65 @@
+# ui/widgets/diagnostics_panel.py
+
+from typing import Dict, List
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout,
+    QLabel, QPushButton, QTableWidget, QTableWidgetItem, QHeaderView
+)
+
+from core.profiling import SPAN_COLUMNS, span_rows
+
+
+class DiagnosticsPanel(QWidget):
+    """Per-stage timings (core.profiling spans) of the pipeline runs in this session."""
+
+    refresh_clicked = Signal()
+    clear_clicked = Signal()
+
+    def __init__(self):
+        super().__init__()
+
+        layout = QVBoxLayout(self)
+
+        self.summary_label = QLabel("No pipeline stages recorded yet.")
+        layout.addWidget(self.summary_label)
+
+        self.table = QTableWidget(0, len(SPAN_COLUMNS))
+        self.table.setHorizontalHeaderLabels(SPAN_COLUMNS)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        buttons = QHBoxLayout()
+        self.refresh_btn = QPushButton("Refresh")
+        self.clear_btn = QPushButton("Clear")
+        buttons.addStretch()
+        buttons.addWidget(self.refresh_btn)
+        buttons.addWidget(self.clear_btn)
+        layout.addLayout(buttons)
+
+        self.refresh_btn.clicked.connect(self.refresh_clicked.emit)
+        self.clear_btn.clicked.connect(self.clear_clicked.emit)
+
+    # ================= PUBLIC METHODS =================
+
+    def set_spans(self, records: List[Dict]):
+        """records: core.profiling span records, in start order"""
+        rows = span_rows(records)
+        self.table.setRowCount(len(rows))
+
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+        top_level = [record for record in records if record["depth"] == 0]
+        if top_level:
+            total = sum(record["wall_seconds"] for record in top_level)
+            self.summary_label.setText(f"{len(records)} stages, {total:.2f} s across {len(top_level)} runs")
+        else:
+            self.summary_label.setText("No pipeline stages recorded yet.")
@@ -1,12 +1,207 @@
+"""
+Matplotlib Canvas for CLUE
+Embeds figures in the Qt pages:
+- a figure is bound to its canvas when the canvas is created, so every
+  new figure gets its own FigureCanvasQTAgg, swapped inside this widget
+- animated artists (the forecast line and confidence band) are blitted
+  over a cached background, so replacing them never redraws the history
+- wheel zoom and drag pan redraw only the axes under the cursor over a
+  cached background of the rest of the figure; decimated lines refine
+  themselves and a full redraw follows once the input settles
+- double-click restores an axes' original x-range
+"""
+
+from typing import Iterable, List, Optional
+
+from matplotlib.backend_bases import FigureCanvasBase
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+
+class InteractiveFigureCanvas(FigureCanvas):
+    ZOOM_STEP = 1.25
+    SETTLE_MS = 200
+
+    def __init__(self, figure: Figure):
+        super().__init__(figure)
+        self.animated: List = []
+        self._background = None
+        self._background_state = None
+        self._interaction: Optional[dict] = None
+        self._home_xlim = {}
+        self._capturing = False
+
+        self._settle = QTimer(self)
+        self._settle.setSingleShot(True)
+        self._settle.setInterval(self.SETTLE_MS)
+        self._settle.timeout.connect(self.end_interaction)
+
+        self.mpl_connect("draw_event", self._on_draw)
+        self.mpl_connect("scroll_event", self._on_scroll)
+        self.mpl_connect("button_press_event", self._on_press)
+        self.mpl_connect("motion_notify_event", self._on_motion)
+        self.mpl_connect("button_release_event", self._on_release)
+
+    # -------------------- ANIMATED ARTISTS --------------------
+
+    def set_animated_artists(self, artists: Iterable):
+        """Artists drawn over the cached background instead of with the figure."""
+        self.animated = list(artists)
+        for artist in self.animated:
+            artist.set_animated(True)
+
+    def update_artists(self, artists: Iterable):
+        """Shows replaced/changed animated artists, blitting when the background still fits."""
+        self.set_animated_artists(artists)
+        if self._background is None or self._background_state != self._view_state():
+            # Limits or size moved (e.g. a longer horizon): the background is stale
+            self.draw_idle()
+            return
+
+        self.restore_region(self._background)
+        self._draw_animated()
+        self.blit(self.figure.bbox)
+
+    def _on_draw(self, event):
+        # savefig draws through this canvas too: keep its renderer (and image) out of the blit cache
+        if event is not None and event.canvas is not self or self._capturing or self.is_saving():
+            return
+        self._background = self.copy_from_bbox(self.figure.bbox)
+        self._background_state = self._view_state()
+        self._draw_animated()
+
+    def _draw_animated(self, axes=None):
+        for artist in self.animated:
+            if artist.axes is not None and artist in artist.axes.get_children() and axes in (None, artist.axes):
+                self.figure.draw_artist(artist)
+
+    def _view_state(self):
+        return self.get_width_height(), tuple(tuple(ax.viewLim.bounds) for ax in self.figure.axes)
+
+    # -------------------- PAN / ZOOM --------------------
+
+    def begin_interaction(self, ax):
+        """Caches the figure without ax, so each step only redraws ax."""
+        if self._interaction is not None and self._interaction["axes"] is ax:
+            return
+        self.end_interaction(force=True, redraw=False)
+        self._home_xlim.setdefault(ax, ax.get_xlim())
 
+        self._capturing = True
+        ax.set_visible(False)
+        try:
+            self.draw()
+            background = self.copy_from_bbox(self.figure.bbox)
+        finally:
+            ax.set_visible(True)
+            self._capturing = False
+        self._interaction = {"axes": ax, "background": background, "press_x": None, "xlim": None}
 
-class MatplotlibCanvas(FigureCanvas):
+    def reset_home_view(self):
+        """Ends any pan / zoom and forgets the home x-limits (after the figure's view was reset)."""
+        self.end_interaction(force=True, redraw=False)
+        self._home_xlim.clear()
+
+    def end_interaction(self, force: bool = False, redraw: bool = True):
+        """Full redraw once input settles; a held drag keeps the interaction open."""
+        self._settle.stop()
+        if self._interaction is None:
+            return
+        if self._interaction["press_x"] is not None and not force:
+            return
+        self._interaction = None
+        if redraw:
+            self.draw_idle()
+
+    def _redraw_interaction(self):
+        ax = self._interaction["axes"]
+        self.restore_region(self._interaction["background"])
+        self.figure.draw_artist(ax)
+        self._draw_animated(ax)
+        self.blit(self.figure.bbox)
+        self._settle.start()
+
+    def _on_scroll(self, event):
+        ax = event.inaxes
+        if event.canvas is not self or ax is None or event.xdata is None:
+            return
+        self.begin_interaction(ax)
+
+        scale = self.ZOOM_STEP ** -event.step
+        low, high = ax.get_xlim()
+        ax.set_xlim(event.xdata - (event.xdata - low) * scale, event.xdata + (high - event.xdata) * scale)
+        self._redraw_interaction()
+
+    def _on_press(self, event):
+        ax = event.inaxes
+        if event.canvas is not self or ax is None or event.button != 1:
+            return
+
+        if event.dblclick:
+            self.end_interaction(force=True, redraw=False)
+            if ax in self._home_xlim:
+                ax.set_xlim(self._home_xlim[ax])
+            self.draw_idle()
+            return
+
+        self.begin_interaction(ax)
+        self._interaction.update(press_x=event.x, xlim=ax.get_xlim())
+
+    def _on_motion(self, event):
+        if event.canvas is not self or self._interaction is None or self._interaction["press_x"] is None:
+            return
+        ax = self._interaction["axes"]
+        low, high = self._interaction["xlim"]
+        shift = (event.x - self._interaction["press_x"]) / ax.bbox.width * (high - low)
+        ax.set_xlim(low - shift, high - shift)
+        self._redraw_interaction()
+
+    def _on_release(self, event):
+        if event.canvas is not self or self._interaction is None or self._interaction["press_x"] is None:
+            return
+        self._interaction["press_x"] = None
+        self._settle.start()
+
+
+class MatplotlibCanvas(QWidget):
     def __init__(self):
-        self.figure = Figure()
-        super().__init__(self.figure)
+        super().__init__()
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+        self.canvas = InteractiveFigureCanvas(Figure())
+        self._layout.addWidget(self.canvas)
+
+    @property
+    def figure(self) -> Figure:
+        return self.canvas.figure
+
+    def draw_figure(self, fig, animated: Optional[Iterable] = None):
+        """
+        Shows fig. animated: artists of fig that change on their own; when
+        fig is already shown, only they are redrawn (blitted).
+        """
+        if fig is self.canvas.figure:
+            # The figure was updated in place (and reset to its full view)
+            self.canvas.reset_home_view()
+            if animated is not None:
+                self.canvas.update_artists(animated)
+            else:
+                self.canvas.draw_idle()
+            return
+
+        old = self.canvas
+        self.canvas = InteractiveFigureCanvas(fig)
+        if animated is not None:
+            self.canvas.set_animated_artists(animated)
+        self._layout.replaceWidget(old, self.canvas)
+
+        # The old figure may be shown again or saved to a report: give it a Qt-free canvas
+        if old.figure.canvas is old:
+            FigureCanvasBase(old.figure)
+        old.setParent(None)
+        old.deleteLater()
 
-    def draw_figure(self, fig):
-        self.figure = fig
-        self.draw_idle()
+        self.canvas.draw_idle()
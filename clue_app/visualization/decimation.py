@@ -0,0 +1,191 @@
+"""
+Plot Decimation for CLUE
+Long histories (minute bars, multi-decade series) are reduced to a point
+budget before they reach matplotlib, preserving the visual shape:
+- min/max envelope: keeps every bucket's extremes, so spikes survive
+- LTTB (largest-triangle-three-buckets): keeps the points that span the
+  largest triangles, i.e. the ones the eye notices
+- the default "minmax-lttb" runs the cheap envelope first, then LTTB
+Lines drawn with plot_decimated re-decimate the visible range on zoom.
+"""
+
+from typing import Optional, Tuple
+
+import matplotlib.dates as mdates
+import numpy as np
+import pandas as pd
+
+
+# Roughly twice the horizontal pixels of a full-width chart
+POINT_BUDGET = 4000
+
+# minmax-lttb: envelope down to this many times the budget before LTTB
+ENVELOPE_FACTOR = 4
+
+METHODS = ("minmax-lttb", "lttb", "minmax")
+
+# Mean bucket width up to which LTTB runs on Python floats instead of NumPy slices
+_SCALAR_BUCKET_WIDTH = 32
+
+
+# -------------------- ALGORITHMS --------------------
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the min and max of n_out // 2 equal buckets (plus both ends), sorted."""
+    n = len(y)
+    n_buckets = max(1, (n_out - 2) // 2)
+    if n <= n_out or n_buckets < 1:
+        return np.arange(n)
+
+    # Pad to a whole number of buckets with edge values, which never win a min/max tie
+    edges = np.linspace(1, n - 1, n_buckets + 1).astype(np.int64)
+    width = int(np.max(np.diff(edges)))
+    positions = edges[:-1, None] + np.arange(width)[None, :]
+    positions = np.minimum(positions, edges[1:, None] - 1)
+    window = y[positions]
+
+    rows = np.arange(n_buckets)
+    lows = positions[rows, np.argmin(window, axis=1)]
+    highs = positions[rows, np.argmax(window, axis=1)]
+    return np.unique(np.concatenate(([0], lows, highs, [n - 1])))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-triangle-three-buckets: n_out indices, always keeping both ends."""
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Mean point of every bucket, the third vertex for the bucket before it
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    mean_x = np.append(sums_x / counts, x[-1])
+    mean_y = np.append(sums_y / counts, y[-1])
+
+    if counts.mean() <= _SCALAR_BUCKET_WIDTH:
+        return _lttb_scalar(x, y, edges, mean_x, mean_y)
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        ax, ay = x[previous], y[previous]
+        bx, by = x[start:stop], y[start:stop]
+        # Twice the triangle area; the constant factor does not change the argmax
+        areas = np.abs((ax - mean_x[bucket + 1]) * (by - ay) - (ax - bx) * (mean_y[bucket + 1] - ay))
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def _lttb_scalar(x: np.ndarray, y: np.ndarray, edges: np.ndarray, mean_x: np.ndarray, mean_y: np.ndarray) -> np.ndarray:
+    """Same selection as lttb_indices; plain floats beat per-bucket NumPy calls on narrow buckets."""
+    xs, ys, bounds = x.tolist(), y.tolist(), edges.tolist()
+    next_x, next_y = mean_x.tolist(), mean_y.tolist()
+
+    selected = [0]
+    previous = 0
+    for bucket in range(len(bounds) - 1):
+        ax, ay = xs[previous], ys[previous]
+        cx, cy = next_x[bucket + 1], next_y[bucket + 1]
+        # Twice the triangle area, expanded to a linear function of the candidate
+        dx, dy, offset = ax - cx, cy - ay, ay * cx - ax * cy
+        best = -1.0
+        for candidate in range(bounds[bucket], bounds[bucket + 1]):
+            area = abs(ys[candidate] * dx + xs[candidate] * dy + offset)
+            if area > best:
+                best, previous = area, candidate
+        selected.append(previous)
+
+    selected.append(len(ys) - 1)
+    return np.asarray(selected, dtype=np.int64)
+
+
+def decimate_indices(x: np.ndarray, y: np.ndarray, max_points: int, method: str = "minmax-lttb") -> np.ndarray:
+    """Indices of at most max_points finite points that keep the shape of (x, y)."""
+    if method not in METHODS:
+        raise ValueError(f"Unknown decimation method: {method}")
+
+    finite = np.flatnonzero(np.isfinite(y))
+    if len(finite) <= max_points:
+        return finite
+
+    x, y = x[finite], y[finite]
+    if method == "minmax":
+        return finite[minmax_indices(y, max_points)]
+    if method == "lttb":
+        return finite[lttb_indices(x, y, max_points)]
+
+    envelope = minmax_indices(y, max_points * ENVELOPE_FACTOR)
+    return finite[envelope[lttb_indices(x[envelope], y[envelope], max_points)]]
+
+
+def decimate(x, y, max_points: int = POINT_BUDGET, method: str = "minmax-lttb") -> Tuple:
+    """Returns the decimated (x, y), keeping pandas index / datetime types."""
+    positions = _as_numbers(x)
+    values = np.asarray(y, dtype=float)
+    indices = decimate_indices(positions, values, max_points, method)
+    return _take(x, indices), values[indices]
+
+
+# -------------------- MATPLOTLIB --------------------
+
+class DecimatedLine:
+    """A Line2D showing a decimated view of (x, y) that is refreshed when the x-range changes."""
+
+    def __init__(self, ax, x, y, max_points: int, method: str, **plot_kwargs):
+        self.x = x
+        self.y = np.asarray(y, dtype=float)
+        self.positions = _as_numbers(x)
+        self.max_points = max_points
+        self.method = method
+        self.sorted = bool(np.all(np.diff(self.positions) >= 0))
+
+        x_view, y_view = self._view(0, len(self.y))
+        (self.line,) = ax.plot(x_view, y_view, **plot_kwargs)
+
+        # A plain closure keeps this object alive (bound methods are held weakly)
+        ax.callbacks.connect("xlim_changed", lambda axes: self.on_xlim_changed(axes))
+
+    def on_xlim_changed(self, ax):
+        if not self.sorted:
+            return
+        low, high = ax.get_xlim()
+        # One point beyond each edge so the line still leaves the visible area
+        start = max(0, int(np.searchsorted(self.positions, low, side="left")) - 1)
+        stop = min(len(self.y), int(np.searchsorted(self.positions, high, side="right")) + 1)
+        self.line.set_data(*self._view(start, stop))
+
+    def _view(self, start: int, stop: int):
+        indices = start + decimate_indices(self.positions[start:stop], self.y[start:stop], self.max_points, self.method)
+        return _take(self.x, indices), self.y[indices]
+
+
+def plot_decimated(ax, x, y, max_points: Optional[int] = POINT_BUDGET, method: str = "minmax-lttb", **plot_kwargs):
+    """ax.plot(x, y) with at most max_points points on screen; None plots every point."""
+    if max_points is None or len(y) <= max_points:
+        (line,) = ax.plot(x, y, **plot_kwargs)
+        return line
+    return DecimatedLine(ax, x, y, max_points, method, **plot_kwargs).line
+
+
+def plot_series(ax, series: pd.Series, max_points: Optional[int] = POINT_BUDGET, **plot_kwargs):
+    return plot_decimated(ax, series.index, series.to_numpy(dtype=float), max_points, **plot_kwargs)
+
+
+# -------------------- HELPERS --------------------
+
+def _as_numbers(x) -> np.ndarray:
+    """x as floats on matplotlib's axis scale (dates become day numbers)."""
+    if isinstance(x, pd.DatetimeIndex) or np.issubdtype(np.asarray(x).dtype, np.datetime64):
+        return np.asarray(mdates.date2num(x), dtype=float)
+    return np.asarray(x, dtype=float)
+
+
+def _take(x, indices: np.ndarray):
+    if isinstance(x, pd.Index):
+        return x[indices]
+    return np.asarray(x)[indices]
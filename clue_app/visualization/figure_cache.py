@@ -0,0 +1,270 @@
+"""
+Figure Cache for CLUE
+Builds each chart once per (data fingerprint, forecast id) and shares it
+between the preview / EDA / forecast pages and the PDF report:
+- figures are plain matplotlib Figures, never registered with pyplot, so
+  their lifetime is explicit (cache entry + page references), no plt.close("all")
+- rendered rasters are cached next to each figure, keyed by the figure's
+  content fingerprint; reports always show the view the figure was built
+  with, whatever the page has zoomed or panned to
+- a new forecast for already-charted data updates the existing forecast
+  figure in place (only its forecast artists change), so the page can blit
+- LRU eviction by figure count and (estimated) bytes, with hit/miss statistics
+"""
+
+import io
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.fingerprint import fingerprint_data, fingerprint_figure
+from preprocessing.eda import generate_eda_charts, generate_preview_charts
+from visualization.forecast_plot import forecast_artists, plot_forecast, update_forecast
+
+
+DEFAULT_MAX_FIGURES = 12
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Renderings of figures the cache did not build (e.g. CLI reports)
+_LOOSE_RASTERS = 16
+
+
+class _FigureEntry:
+    __slots__ = ("figure", "source_bytes", "size", "view", "rasters")
+
+    def __init__(self, figure, source_bytes: int):
+        self.figure = figure
+        self.source_bytes = source_bytes
+        # Size the figure was built at; an embedding canvas resizes it to the widget
+        self.size = tuple(figure.get_size_inches())
+        # Axes limits it was built with; page pan / zoom changes the live ones
+        self.view = _capture_view(figure)
+        # (format, dpi) -> (figure fingerprint, rendered bytes)
+        self.rasters: Dict[Tuple[str, int], Tuple[str, bytes]] = {}
+
+    @property
+    def nbytes(self) -> int:
+        return self.source_bytes + sum(len(raster) for _, raster in self.rasters.values())
+
+
+class FigureCache:
+    def __init__(self, max_figures: int = DEFAULT_MAX_FIGURES, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_figures <= 0 or max_bytes <= 0:
+            raise ValueError("max_figures and max_bytes must be positive")
+
+        self.max_figures = max_figures
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[Hashable, _FigureEntry]" = OrderedDict()
+        self._keys_by_figure: Dict[int, Hashable] = {}
+        self._loose: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # -------------------- FIGURES --------------------
+
+    def preview_chart(self, df: pd.DataFrame):
+        return self.get(("preview", fingerprint_data(df["Close"])), lambda: generate_preview_charts(df), _source_bytes(df))
+
+    def eda_charts(self, df: pd.DataFrame):
+        return self.get(("eda", fingerprint_data(df["Close"])), lambda: generate_eda_charts(df), _source_bytes(df))
+
+    def forecast_chart(self, df: pd.DataFrame, forecast: pd.Series, conf_int: Optional[pd.DataFrame]):
+        forecast_id = fingerprint_data(np.asarray(forecast, dtype=float))
+        if conf_int is not None:
+            forecast_id += fingerprint_data(np.asarray(conf_int, dtype=float))
+
+        data_id = fingerprint_data(df["Close"])
+        key = ("forecast", data_id, forecast_id)
+
+        with self._lock:
+            if key not in self._entries:
+                previous = next((k for k in reversed(self._entries) if k[:2] == ("forecast", data_id)), None)
+                if previous is not None:
+                    # Same history, new forecast: swap the forecast artists of the shown figure
+                    entry = self._entries.pop(previous)
+                    # Back to the full view first: relim needs the undecimated history
+                    _apply_view(entry.figure, entry.view)
+                    update_forecast(entry.figure, df, forecast, conf_int)
+                    entry.view = _capture_view(entry.figure)
+                    self._entries[key] = entry
+                    self._keys_by_figure[id(entry.figure)] = key
+                    self.misses += 1
+                    return entry.figure
+
+        return self.get(key, lambda: plot_forecast(df, forecast, conf_int), _source_bytes(df))
+
+    def get(self, key: Hashable, builder: Callable[[], object], source_bytes: int = 0):
+        """Returns the cached figure for key, building it on a miss (on the calling thread)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.figure
+            self.misses += 1
+
+        figure = builder()
+        with self._lock:
+            self._entries[key] = _FigureEntry(figure, source_bytes)
+            self._keys_by_figure[id(figure)] = key
+            self._evict()
+        return figure
+
+    # -------------------- RASTERS --------------------
+
+    def render(self, fig, image_format: str = "png", dpi: int = 150) -> bytes:
+        """fig rendered into memory; reused while the figure's content is unchanged."""
+        with self._lock:
+            entry = self._entry_for(fig)
+
+        with _as_built(fig, entry):
+            fingerprint = fingerprint_figure(fig)
+            loose_key = (fingerprint, image_format, dpi)
+
+            with self._lock:
+                if entry is not None:
+                    cached = entry.rasters.get((image_format, dpi))
+                    if cached is not None and cached[0] == fingerprint:
+                        self.hits += 1
+                        return cached[1]
+                elif loose_key in self._loose:
+                    self._loose.move_to_end(loose_key)
+                    self.hits += 1
+                    return self._loose[loose_key]
+                self.misses += 1
+
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=image_format, dpi=dpi, bbox_inches="tight")
+            rendered = buffer.getvalue()
+
+        with self._lock:
+            entry = self._entry_for(fig)
+            if entry is not None:
+                entry.rasters[(image_format, dpi)] = (fingerprint, rendered)
+                self._evict()
+            else:
+                self._loose[loose_key] = rendered
+                while len(self._loose) > _LOOSE_RASTERS:
+                    self._loose.popitem(last=False)
+        return rendered
+
+    # -------------------- LIFECYCLE --------------------
+
+    def release(self, fig) -> bool:
+        """Drops fig (and its rasters) from the cache; pages holding it keep working."""
+        with self._lock:
+            key = self._keys_by_figure.get(id(fig))
+            if key is None:
+                return False
+            self._drop(key)
+            return True
+
+    def invalidate(self, kind: Optional[str] = None):
+        """Drops every figure of one kind ("preview", "eda", "forecast"), or all of them."""
+        with self._lock:
+            for key in [key for key in self._entries if kind is None or key[0] == kind]:
+                self._drop(key)
+            if kind is None:
+                self._loose.clear()
+
+    def clear(self):
+        self.invalidate()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "figures": len(self._entries),
+                "bytes": self._current_bytes(),
+                "max_figures": self.max_figures,
+                "max_bytes": self.max_bytes,
+            }
+
+    # -------------------- HELPERS --------------------
+
+    def _entry_for(self, fig) -> Optional[_FigureEntry]:
+        key = self._keys_by_figure.get(id(fig))
+        entry = self._entries.get(key) if key is not None else None
+        return entry if entry is not None and entry.figure is fig else None
+
+    def _current_bytes(self) -> int:
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    def _drop(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self._keys_by_figure.pop(id(entry.figure), None)
+
+    def _evict(self):
+        # Never evict the newest entry: its caller is about to use it
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_figures or self._current_bytes() > self.max_bytes
+        ):
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+
+@contextmanager
+def _as_built(fig, entry: Optional[_FigureEntry]):
+    """
+    savefig skips animated (blitted) artists, and an embedding canvas resizes
+    the figure to its widget and pans / zooms its axes: fingerprint and render
+    the figure as built, then hand it back to the canvas unchanged.
+    Mutates fig, so call it on the thread that owns the canvas.
+    """
+    animated = [artist for artist in forecast_artists(fig) if artist.get_animated()] if fig.axes else []
+    size = fig.get_size_inches()
+    view = _capture_view(fig)
+    try:
+        for artist in animated:
+            artist.set_animated(False)
+        if entry is not None:
+            fig.set_size_inches(entry.size, forward=False)
+            # set_xlim also re-decimates long lines for the full range
+            _apply_view(fig, entry.view)
+        yield
+    finally:
+        _apply_view(fig, view)
+        fig.set_size_inches(size, forward=False)
+        for artist in animated:
+            artist.set_animated(True)
+
+
+def _capture_view(fig) -> List[tuple]:
+    return [(ax.get_xlim(), ax.get_ylim(), ax.get_autoscalex_on(), ax.get_autoscaley_on()) for ax in fig.axes]
+
+
+def _apply_view(fig, view: List[tuple]):
+    for ax, (xlim, ylim, autoscale_x, autoscale_y) in zip(fig.axes, view):
+        if ax.get_xlim() != xlim:
+            ax.set_xlim(xlim)
+        if ax.get_ylim() != ylim:
+            ax.set_ylim(ylim)
+        ax.set_autoscalex_on(autoscale_x)
+        ax.set_autoscaley_on(autoscale_y)
+
+
+def _source_bytes(df: pd.DataFrame) -> int:
+    """Decimated lines keep the full series for re-decimation on zoom."""
+    return int(df.memory_usage(index=True).sum())
+
+
+_default_cache: Optional[FigureCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_figure_cache() -> FigureCache:
+    """Returns the session-wide figure cache."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = FigureCache()
+        return _default_cache
@@ -3,16 +3,64 @@ Forecast Visualization for CLUE
 Compatible with all pandas versions
 """
 
-import matplotlib.pyplot as plt
+from typing import List, Optional
+
 import pandas as pd
+from matplotlib.figure import Figure
+
+from visualization.decimation import POINT_BUDGET, plot_series
+
+
+FORECAST_GIDS = ("forecast", "confidence")
 
 
-def plot_forecast(df: pd.DataFrame, forecast: pd.Series, conf_int: pd.DataFrame):
-    fig, ax = plt.subplots(figsize=(10, 5))
+def plot_forecast(df: pd.DataFrame, forecast: pd.Series, conf_int: pd.DataFrame, max_points: Optional[int] = POINT_BUDGET):
+    """max_points: history points drawn (decimated, re-decimated on zoom); None draws all."""
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
 
     # Plot historical prices
-    ax.plot(df.index, df["Close"], label="History")
+    plot_series(ax, df["Close"], max_points, label="History")
+
+    _draw_forecast(ax, df, forecast, conf_int)
+
+    ax.set_title("Forecast with Confidence Interval")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Price")
+    ax.legend()
+    ax.grid(True)
+
+    return fig
+
 
+def forecast_artists(fig) -> List:
+    """The forecast line and confidence band of a plot_forecast figure."""
+    return [artist for artist in fig.axes[0].get_children() if artist.get_gid() in FORECAST_GIDS]
+
+
+def update_forecast(fig, df: pd.DataFrame, forecast: pd.Series, conf_int: pd.DataFrame) -> List:
+    """
+    Replaces the forecast line and confidence band of a plot_forecast figure
+    in place (e.g. after a horizon change) and returns the new artists.
+    The history line is left untouched.
+    """
+    ax = fig.axes[0]
+    animated = False
+    for artist in forecast_artists(fig):
+        animated = animated or artist.get_animated()
+        artist.remove()
+
+    # Data limits from the history only, then extended by the new forecast
+    ax.relim()
+    artists = _draw_forecast(ax, df, forecast, conf_int)
+    for artist in artists:
+        artist.set_animated(animated)
+    ax.autoscale_view()
+
+    return artists
+
+
+def _draw_forecast(ax, df: pd.DataFrame, forecast: pd.Series, conf_int: pd.DataFrame) -> List:
     # Create future index safely (no 'closed' argument)
     future_index = pd.date_range(
         start=df.index[-1] + pd.Timedelta(days=1),
@@ -20,23 +68,21 @@ def plot_forecast(df: pd.DataFrame, forecast: pd.Series, conf_int: pd.DataFrame)
         freq="D"
     )
 
-    # Plot forecast
-    ax.plot(future_index, forecast.values, label="Forecast")
+    # Plot forecast (fixed cycle colours, so in-place updates look like a fresh plot)
+    (line,) = ax.plot(future_index, forecast.values, color="C1", label="Forecast", gid="forecast")
+    artists = [line]
 
     # Confidence interval shading
     if conf_int is not None:
-        ax.fill_between(
+        band = ax.fill_between(
             future_index,
             conf_int["Lower CI"].values,
             conf_int["Upper CI"].values,
             alpha=0.3,
-            label="Confidence Interval"
+            color="C2",
+            label="Confidence Interval",
+            gid="confidence",
         )
+        artists.append(band)
 
-    ax.set_title("Forecast with Confidence Interval")
-    ax.set_xlabel("Date")
-    ax.set_ylabel("Price")
-    ax.legend()
-    ax.grid(True)
-
-    return fig
+    return artists